@@ -0,0 +1,4 @@
+"""Offline benchmarks for the TradingAgents orchestration layer.
+
+Run with ``python -m benchmarks.run``; see ``benchmarks/run.py`` for options.
+"""
@@ -0,0 +1,109 @@
+"""Scripted chat model for offline benchmarks.
+
+FakeChatModel stands in for both the quick and deep thinking models. It
+sleeps for a fixed latency, answers tool-bound calls with tool calls for
+``tool_rounds`` rounds and then with a report, and reports token usage
+estimated from message length, so callbacks and tracing see the same
+shape of traffic as with a real provider.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+# Argument values used when the model calls a tool, by parameter name
+TOOL_ARGS = {
+    "symbol": "FIXT",
+    "ticker": "FIXT",
+    "start_date": "2024-02-28",
+    "end_date": "2024-03-28",
+    "curr_date": "2024-03-28",
+    "indicator": "rsi",
+    "look_back_days": 30,
+    "freq": "quarterly",
+    "limit": 5,
+}
+
+_SENTENCE = "Momentum, valuation and sentiment were weighed against the risk budget. "
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model with configurable latency, tool-call pattern and reply size."""
+
+    model: str = "fake-chat"
+    latency: float = 0.0
+    tool_rounds: int = 1
+    reply_tokens: int = 400
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-chat"
+
+    def bind_tools(self, tools, **kwargs: Any):
+        return self.bind(tools=[convert_to_openai_tool(t) for t in tools], **kwargs)
+
+    def _reply(self) -> str:
+        filler = _SENTENCE * max(1, self.reply_tokens * 4 // len(_SENTENCE))
+        # Parseable by both the trader's and the portfolio manager's formats
+        return f"**Rating**: Hold\n\n{filler}\n\nFINAL TRANSACTION PROPOSAL: **HOLD**"
+
+    def _respond(self, messages: List[BaseMessage], tools: Optional[List[Dict]]) -> ChatResult:
+        rounds = sum(1 for m in messages if isinstance(m, AIMessage) and m.tool_calls)
+        if tools and rounds < self.tool_rounds:
+            message = AIMessage(
+                content="",
+                tool_calls=[
+                    {
+                        "name": tool["function"]["name"],
+                        "args": {
+                            name: TOOL_ARGS[name]
+                            for name in tool["function"]["parameters"].get("properties", {})
+                            if name in TOOL_ARGS
+                        },
+                        "id": f"call_{uuid4().hex[:12]}",
+                    }
+                    for tool in tools
+                ],
+            )
+        else:
+            message = AIMessage(content=self._reply())
+
+        tokens_in = sum(_estimate_tokens(str(m.content)) for m in messages)
+        tokens_out = _estimate_tokens(str(message.content)) + 20 * len(message.tool_calls)
+        message.usage_metadata = {
+            "input_tokens": tokens_in,
+            "output_tokens": tokens_out,
+            "total_tokens": tokens_in + tokens_out,
+        }
+        message.response_metadata = {"model_name": self.model}
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        if self.latency:
+            time.sleep(self.latency)
+        return self._respond(messages, kwargs.get("tools"))
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self._respond(messages, kwargs.get("tools"))
+
+
+class FakeLLMClient:
+    """Drop-in for ``create_llm_client`` results, returning a FakeChatModel."""
+
+    def __init__(self, model: str, callbacks=None, **settings: Any):
+        self.llm = FakeChatModel(model=model, callbacks=callbacks, **settings)
+
+    def get_llm(self) -> FakeChatModel:
+        return self.llm
@@ -0,0 +1,146 @@
+"""Recorded vendor responses served through ``route_to_vendor``.
+
+Fixtures live in ``benchmarks/fixtures/{vendor}/{method}.json`` and are
+captured from the live vendors with ``python -m benchmarks.run --record``.
+No recordings are checked in: methods without one are served a synthetic
+response of similar shape and size, so a fresh checkout benchmarks
+against synthetic fixtures only.
+"""
+
+import contextlib
+import functools
+import json
+import math
+import os
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterator, Tuple
+from unittest import mock
+
+from tradingagents.dataflows import interface
+
+FIXTURE_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _synthetic_prices(days: int = 60) -> str:
+    rows = ["Date,Open,High,Low,Close,Volume"]
+    start = date(2024, 1, 2)
+    for i in range(days):
+        close = 100 + 5 * math.sin(i / 6) + i * 0.1
+        rows.append(
+            f"{start + timedelta(days=i)},{close - 0.5:.2f},{close + 1:.2f},"
+            f"{close - 1:.2f},{close:.2f},{1_000_000 + 5_000 * i}"
+        )
+    return "# Stock data for FIXT\n\n" + "\n".join(rows)
+
+
+def _synthetic_indicator() -> str:
+    start = date(2024, 2, 28)
+    lines = [
+        f"{start + timedelta(days=i)}: {50 + 10 * math.sin(i / 4):.2f}" for i in range(30)
+    ]
+    return "## rsi values from 2024-02-28 to 2024-03-28:\n\n" + "\n".join(lines)
+
+
+def _synthetic_text(title: str, paragraphs: int = 8) -> str:
+    body = "\n\n".join(
+        f"### Item {i + 1}\nRevenue, margins and guidance moved in line with the "
+        f"sector; analysts revised estimates and flagged supply-chain risk. " * 3
+        for i in range(paragraphs)
+    )
+    return f"## {title}\n\n{body}"
+
+
+def synthetic_fixture(method: str) -> str:
+    """Deterministic stand-in for a vendor response."""
+    if method == "get_stock_data":
+        return _synthetic_prices()
+    if method == "get_indicators":
+        return _synthetic_indicator()
+    return _synthetic_text(method.replace("get_", "").replace("_", " ").title())
+
+
+def load_fixtures(directory: str = FIXTURE_DIR) -> Dict[Tuple[str, str], str]:
+    """Return recorded outputs keyed by (method, vendor)."""
+    fixtures = {}
+    if not os.path.isdir(directory):
+        return fixtures
+    for vendor in os.listdir(directory):
+        vendor_dir = os.path.join(directory, vendor)
+        if not os.path.isdir(vendor_dir):
+            continue
+        for filename in os.listdir(vendor_dir):
+            if filename.endswith(".json"):
+                with open(os.path.join(vendor_dir, filename), "r", encoding="utf-8") as f:
+                    fixtures[(filename[:-5], vendor)] = json.load(f)["output"]
+    return fixtures
+
+
+def record_fixtures(
+    ticker: str, trade_date: str, directory: str = FIXTURE_DIR
+) -> Dict[Tuple[str, str], str]:
+    """Call every vendor implementation once and save its output."""
+    start = (date.fromisoformat(trade_date) - timedelta(days=30)).isoformat()
+    calls = {
+        "get_stock_data": (ticker, start, trade_date),
+        "get_indicators": (ticker, "rsi", trade_date, 30),
+        "get_fundamentals": (ticker, trade_date),
+        "get_balance_sheet": (ticker, "quarterly", trade_date),
+        "get_cashflow": (ticker, "quarterly", trade_date),
+        "get_income_statement": (ticker, "quarterly", trade_date),
+        "get_news": (ticker, start, trade_date),
+        "get_global_news": (trade_date, 7, 5),
+        "get_insider_transactions": (ticker,),
+    }
+    recorded = {}
+    for method, args in calls.items():
+        for vendor, impl in interface.VENDOR_METHODS[method].items():
+            func = impl[0] if isinstance(impl, list) else impl
+            try:
+                output = func(*args)
+            except Exception as e:
+                print(f"Skipping {method} ({vendor}): {e!r}")
+                continue
+            os.makedirs(os.path.join(directory, vendor), exist_ok=True)
+            with open(os.path.join(directory, vendor, f"{method}.json"), "w", encoding="utf-8") as f:
+                json.dump({"args": list(args), "recorded_on": date.today().isoformat(), "output": output}, f)
+            recorded[(method, vendor)] = output
+    return recorded
+
+
+@contextlib.contextmanager
+def serve_fixtures(
+    fixtures: Dict[Tuple[str, str], str], latency: float = 0.0
+) -> Iterator[None]:
+    """Route every vendor call to its fixture for the duration of the block.
+
+    Each response is delayed by ``latency`` seconds to stand in for the
+    network round trip. The batch-level prefetches of ``propagate_many``
+    call yfinance directly rather than through ``route_to_vendor``, so they
+    are turned into no-ops to keep the block offline.
+    """
+    originals = {method: dict(impls) for method, impls in interface.VENDOR_METHODS.items()}
+
+    def server(method, vendor, original):
+        output = fixtures.get((method, vendor)) or synthetic_fixture(method)
+
+        @functools.wraps(original)  # Keeps the signature for response-cache keys
+        def serve(*args, **kwargs):
+            if latency:
+                time.sleep(latency)
+            return output
+
+        return serve
+
+    try:
+        for method, impls in interface.VENDOR_METHODS.items():
+            for vendor, impl in impls.items():
+                original = impl[0] if isinstance(impl, list) else impl
+                impls[vendor] = server(method, vendor, original)
+        with mock.patch("tradingagents.graph.trading_graph.prefetch_global_news"), \
+                mock.patch("tradingagents.graph.trading_graph.prefetch_ohlcv"):
+            yield
+    finally:
+        for method, impls in originals.items():
+            interface.VENDOR_METHODS[method].clear()
+            interface.VENDOR_METHODS[method].update(impls)
@@ -0,0 +1,222 @@
+"""Benchmark the full TradingAgentsGraph offline.
+
+Every run goes through the real graph, agents, tool nodes and vendor
+router. Only the chat models (FakeChatModel), the vendor functions
+(fixtures, synthetic unless recorded) and the batch prefetches are
+replaced, so the numbers isolate the cost of the orchestration layer.
+
+For each ticker count it reports:
+
+- graph overhead per run: run wall time minus time inside LLM and tool
+  calls (exact for the default serial analysts)
+- mean tool latency per call, including the simulated vendor latency
+- peak traced Python memory (tracemalloc) for the batch
+- input/output tokens per run
+
+Examples::
+
+    python -m benchmarks.run
+    python -m benchmarks.run --tickers 1 10 --llm-latency 0.2 --save baseline.json
+    python -m benchmarks.run --baseline baseline.json --tolerance 0.25
+    python -m benchmarks.run --record --record-ticker NVDA --record-date 2024-05-10
+"""
+
+import argparse
+import copy
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict, List
+from unittest import mock
+
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+from tradingagents.graph.tracing import RunTracer
+
+from .fake_llm import FakeLLMClient
+from .fixtures import load_fixtures, record_fixtures, serve_fixtures
+
+TRADE_DATE = "2024-03-28"
+
+# Metrics compared against a baseline; all are lower-is-better
+REGRESSION_METRICS = ("overhead_ms_per_run", "peak_memory_mb")
+
+
+def build_config(workdir: str, args: argparse.Namespace) -> Dict[str, Any]:
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config.update({
+        "results_dir": f"{workdir}/results",
+        "data_cache_dir": f"{workdir}/cache",
+        "memory_dir": None,
+        "checkpoint_db": None,
+        "max_debate_rounds": args.debate_rounds,
+        "max_risk_discuss_rounds": args.debate_rounds,
+        "max_concurrent_runs": args.workers,
+        "data_vendors": {category: args.vendor for category in config["data_vendors"]},
+        "tool_vendors": {},
+    })
+    config["response_cache"] = {**config["response_cache"], "enabled": args.response_cache}
+    config["llm_cache"] = {**config["llm_cache"], "enabled": False}
+    config["tracing"] = {**config["tracing"], "enabled": False}
+    return config
+
+
+def build_graph(config: Dict[str, Any], args: argparse.Namespace) -> TradingAgentsGraph:
+    def fake_client(provider, model, base_url=None, **kwargs):
+        return FakeLLMClient(
+            model,
+            callbacks=kwargs.get("callbacks"),
+            latency=args.llm_latency,
+            tool_rounds=args.tool_rounds,
+            reply_tokens=args.reply_tokens,
+        )
+
+    with mock.patch("tradingagents.graph.trading_graph.create_llm_client", fake_client):
+        graph = TradingAgentsGraph(args.analysts, config=config)
+    graph.tracer = RunTracer()
+    return graph
+
+
+def run_scale(graph: TradingAgentsGraph, tickers: int, workers: int) -> Dict[str, Any]:
+    """Run one batch of ``tickers`` runs and aggregate its traces."""
+    graph.tracer.summaries.clear()
+    jobs = [(f"T{i:03d}", TRADE_DATE) for i in range(tickers)]
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    started = time.perf_counter()
+    errors = [
+        result
+        for _, _, result, _ in graph.propagate_many(jobs, max_workers=workers, return_exceptions=True)
+        if isinstance(result, Exception)
+    ]
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    summaries = [s for s in graph.tracer.summaries if s["status"] == "ok"]
+    runs = max(len(summaries), 1)
+    llm_ms = sum(m["wall_ms"] for s in summaries for m in s["models"].values())
+    tool_ms = sum(t["wall_ms"] for s in summaries for t in s["tools"].values())
+    tool_calls = sum(t["calls"] for s in summaries for t in s["tools"].values())
+    run_ms = sum(s["wall_ms"] for s in summaries)
+
+    return {
+        "tickers": tickers,
+        "completed_runs": len(summaries),
+        "errors": [repr(e) for e in errors],
+        "wall_seconds": elapsed,
+        "runs_per_minute": len(summaries) / elapsed * 60 if elapsed > 0 else 0.0,
+        "run_ms": run_ms / runs,
+        "overhead_ms_per_run": max(0.0, run_ms - llm_ms - tool_ms) / runs,
+        "llm_ms_per_run": llm_ms / runs,
+        "llm_calls_per_run": sum(s["llm_calls"] for s in summaries) / runs,
+        "tool_ms_per_call": tool_ms / tool_calls if tool_calls else 0.0,
+        "tool_calls_per_run": tool_calls / runs,
+        "peak_memory_mb": peak / 1024 / 1024,
+        "tokens_in_per_run": sum(s["tokens_in"] for s in summaries) / runs,
+        "tokens_out_per_run": sum(s["tokens_out"] for s in summaries) / runs,
+    }
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    columns = [
+        ("tickers", "tickers", "{:d}"),
+        ("runs/min", "runs_per_minute", "{:.1f}"),
+        ("overhead ms/run", "overhead_ms_per_run", "{:.1f}"),
+        ("llm ms/run", "llm_ms_per_run", "{:.1f}"),
+        ("tool ms/call", "tool_ms_per_call", "{:.2f}"),
+        ("peak MB", "peak_memory_mb", "{:.1f}"),
+        ("tokens in/run", "tokens_in_per_run", "{:.0f}"),
+        ("tokens out/run", "tokens_out_per_run", "{:.0f}"),
+    ]
+    rows = [[title for title, _, _ in columns]] + [
+        [fmt.format(result[key]) for _, key, fmt in columns] for result in results
+    ]
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    for row in rows:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
+    for result in results:
+        if result["errors"]:
+            print(f"{result['tickers']} tickers: {len(result['errors'])} failed runs, "
+                  f"first: {result['errors'][0]}")
+
+
+def compare_to_baseline(results, baseline_path: str, tolerance: float) -> List[str]:
+    """Return a message for every metric that regressed beyond ``tolerance``."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {r["tickers"]: r for r in json.load(f)["results"]}
+    regressions = []
+    for result in results:
+        previous = baseline.get(result["tickers"])
+        if previous is None:
+            continue
+        for metric in REGRESSION_METRICS:
+            limit = previous[metric] * (1 + tolerance)
+            if result[metric] > limit:
+                regressions.append(
+                    f"{result['tickers']} tickers: {metric} {result[metric]:.2f} "
+                    f"> {limit:.2f} (baseline {previous[metric]:.2f})"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tickers", type=int, nargs="+", default=[1, 10, 100],
+                        help="Batch sizes to run")
+    parser.add_argument("--workers", type=int, default=DEFAULT_CONFIG["max_concurrent_runs"])
+    parser.add_argument("--analysts", nargs="+",
+                        default=["market", "social", "news", "fundamentals"])
+    parser.add_argument("--debate-rounds", type=int, default=1)
+    parser.add_argument("--llm-latency", type=float, default=0.0,
+                        help="Seconds per fake LLM call")
+    parser.add_argument("--tool-latency", type=float, default=0.0,
+                        help="Seconds per fixture vendor call")
+    parser.add_argument("--tool-rounds", type=int, default=1,
+                        help="Tool-call rounds per analyst before it writes its report")
+    parser.add_argument("--reply-tokens", type=int, default=400)
+    parser.add_argument("--vendor", default="yfinance", choices=["yfinance", "alpha_vantage"],
+                        help="Vendor whose fixtures the router serves")
+    parser.add_argument("--response-cache", action="store_true",
+                        help="Turn the vendor response cache on (in a temporary directory)")
+    parser.add_argument("--save", help="Write results as JSON to this path")
+    parser.add_argument("--baseline", help="Fail if results regress against this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression against --baseline")
+    parser.add_argument("--record", action="store_true",
+                        help="Record vendor fixtures from the live APIs and exit")
+    parser.add_argument("--record-ticker", default="NVDA")
+    parser.add_argument("--record-date", default=TRADE_DATE)
+    args = parser.parse_args(argv)
+
+    if args.record:
+        recorded = record_fixtures(args.record_ticker, args.record_date)
+        print(f"Recorded {len(recorded)} fixtures")
+        return 0
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir, serve_fixtures(load_fixtures(), args.tool_latency):
+        graph = build_graph(build_config(workdir, args), args)
+        run_scale(graph, 1, 1)  # Warm-up: imports, prompt templates, first-call setup
+        for tickers in args.tickers:
+            results.append(run_scale(graph, tickers, args.workers))
+    print_results(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+
+    if args.baseline:
+        regressions = compare_to_baseline(results, args.baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION: {message}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1153,7 +1153,7 @@ def run_analysis():
 
         # Get final state and decision
         final_state = trace[-1]
-        decision = graph.process_signal(final_state["final_trade_decision"])
+        decision = graph.get_decision(final_state)
 
         # Update all agent statuses to completed
         for agent in message_buffer.agent_status:
@@ -0,0 +1,124 @@
+import json
+import os
+import time
+import unittest
+from unittest.mock import patch
+
+from tradingagents.dataflows import alpha_vantage_common as av
+from tradingagents.dataflows.alpha_vantage_common import (
+    AlphaVantageRateLimitError,
+    TokenBucket,
+)
+
+PER_MINUTE = json.dumps({"Note": "Our standard API call frequency is 5 calls per minute and 500 calls per day."})
+PER_DAY = json.dumps({"Information": "Our standard API rate limit is 25 requests per day."})
+BAD_KEY = json.dumps({
+    "Information": "The demo API key is for demo purposes only. Please claim your free API key."
+})
+PREMIUM = json.dumps({
+    "Information": "Thank you for using Alpha Vantage! This is a premium endpoint."
+})
+
+
+class FakeResponse:
+    def __init__(self, text, status_code=200, headers=None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(timeout)
+        return self.responses.pop(0)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=50.0, capacity=2)
+        started = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        # Two tokens up front, two more at 50/s
+        self.assertGreaterEqual(time.monotonic() - started, 0.035)
+
+    def test_pause_blocks_acquire(self):
+        bucket = TokenBucket(rate=1000.0, capacity=5)
+        bucket.pause(0.05)
+        started = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+
+
+@patch.dict(os.environ, {"ALPHA_VANTAGE_API_KEY": "test"})
+class MakeApiRequestTests(unittest.TestCase):
+    def request(self, responses, max_retries=3):
+        session = FakeSession(responses)
+        limiter = TokenBucket(rate=1e6, capacity=1e6)
+        settings = {**av.DEFAULT_SETTINGS, "max_retries": max_retries, "timeout": 7}
+        with patch.object(av, "_get_settings", return_value=settings), \
+                patch.object(av, "_get_session", return_value=session), \
+                patch.object(av, "_get_rate_limiter", return_value=limiter), \
+                patch.object(limiter, "pause") as pause:
+            try:
+                return av._make_api_request("SMA", {"symbol": "IBM"}), session, pause
+            except AlphaVantageRateLimitError as e:
+                return e, session, pause
+
+    def test_per_minute_limit_waits_and_retries(self):
+        result, session, pause = self.request([FakeResponse(PER_MINUTE), FakeResponse("a,b\n1,2")])
+        self.assertEqual(result, "a,b\n1,2")
+        self.assertEqual(session.calls, [7, 7])
+        pause.assert_called_once()
+
+    def test_http_429_waits_as_long_as_retry_after(self):
+        result, session, pause = self.request([
+            FakeResponse("", status_code=429, headers={"Retry-After": "12"}),
+            FakeResponse("", status_code=429),
+            FakeResponse("a,b\n1,2"),
+        ])
+        self.assertEqual(result, "a,b\n1,2")
+        self.assertEqual(len(session.calls), 3)
+        self.assertEqual(pause.call_args_list[0].args, (12.0,))
+        self.assertEqual(pause.call_count, 2)
+
+    def test_daily_limit_fails_over_immediately(self):
+        result, session, pause = self.request([FakeResponse(PER_DAY)])
+        self.assertIsInstance(result, AlphaVantageRateLimitError)
+        self.assertEqual(len(session.calls), 1)
+        pause.assert_not_called()
+
+    def test_api_key_notice_fails_over_immediately(self):
+        result, session, pause = self.request([FakeResponse(BAD_KEY)])
+        self.assertIsInstance(result, AlphaVantageRateLimitError)
+        self.assertIn("API key", str(result))
+        self.assertEqual(len(session.calls), 1)
+        pause.assert_not_called()
+
+    def test_premium_endpoint_notice_is_not_retried(self):
+        result, session, pause = self.request([FakeResponse(PREMIUM)])
+        self.assertIsInstance(result, AlphaVantageRateLimitError)
+        self.assertEqual(len(session.calls), 1)
+        pause.assert_not_called()
+
+    def test_other_notices_are_returned(self):
+        note = json.dumps({"Information": "Results are delayed by 15 minutes."})
+        result, session, pause = self.request([FakeResponse(note)])
+        self.assertEqual(result, note)
+        pause.assert_not_called()
+
+    def test_persistent_limit_raises_after_retries(self):
+        result, session, _ = self.request([FakeResponse(PER_MINUTE)] * 3, max_retries=2)
+        self.assertIsInstance(result, AlphaVantageRateLimitError)
+        self.assertEqual(len(session.calls), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,173 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.backtest import Backtester, _usage_stats, rating_position
+
+DATES = ["2025-01-02", "2025-01-03", "2025-01-06", "2025-01-07", "2025-01-08"]
+CLOSES = [100.0, 110.0, 99.0, 99.0, 108.9]
+
+
+def make_summary(model, tokens_in, tokens_out, cost):
+    return {
+        "llm_calls": 1,
+        "tokens_in": tokens_in,
+        "tokens_out": tokens_out,
+        "cost_usd": cost,
+        "models": {model: {"calls": 1, "tokens_in": tokens_in, "tokens_out": tokens_out}},
+    }
+
+
+class FakeGraph:
+    """Stands in for TradingAgentsGraph, logging runs and reflections in order."""
+
+    def __init__(self, events, fail=()):
+        self.events = events
+        self.fail = set(fail)
+        self.tracer = None
+        self.memories = {}
+        self.reflector = mock.Mock()
+        self.reflector.reflect_all.side_effect = lambda outcomes, memories: self.events.append(
+            ("reflect", [state["trade_date"] for state, _ in outcomes])
+        )
+
+    def propagate_many(self, jobs, max_workers=None, return_exceptions=False):
+        for ticker, trade_date in jobs:
+            self.events.append(("run", ticker, trade_date))
+            if (ticker, trade_date) in self.fail:
+                yield ticker, trade_date, RuntimeError("provider outage"), None
+            else:
+                if self.tracer is not None:
+                    self.tracer.summaries.append(make_summary("quick", 100, 10, 0.01))
+                yield ticker, trade_date, {"trade_date": trade_date}, "BUY"
+
+
+class RatingPositionTests(unittest.TestCase):
+    def test_ratings_map_to_positions(self):
+        self.assertEqual(rating_position("BUY"), 1.0)
+        self.assertEqual(rating_position("**Underweight**"), -0.5)
+        self.assertEqual(rating_position("Sell."), -1.0)
+        self.assertIsNone(rating_position("no decision"))
+
+
+class UsageStatsTests(unittest.TestCase):
+    def test_usage_adds_up_run_summaries(self):
+        summaries = [
+            make_summary("quick", 1_000_000, 100_000, 0.7),
+            make_summary("deep", 200_000, 0, 1.0),
+        ]
+
+        stats = _usage_stats(summaries, priced=True)
+
+        self.assertEqual((stats["llm_calls"], stats["tokens_in"]), (2, 1_200_000))
+        self.assertEqual(stats["tokens_by_model"]["deep"], {"tokens_in": 200_000, "tokens_out": 0})
+        self.assertAlmostEqual(stats["cost_usd"], 1.7)
+
+    def test_cost_is_unknown_without_pricing_for_every_run(self):
+        summaries = [make_summary("quick", 10, 10, 0.1), make_summary("other", 10, 10, None)]
+
+        self.assertIsNone(_usage_stats(summaries, priced=True)["cost_usd"])
+        self.assertIsNone(_usage_stats([], priced=False)["cost_usd"])
+        self.assertEqual(_usage_stats([], priced=True)["cost_usd"], 0)
+
+
+class BacktesterTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.config = DEFAULT_CONFIG.copy()
+        self.config["results_dir"] = self.tmp.name
+        self.checkpoint_path = os.path.join(self.tmp.name, "backtest.jsonl")
+        self.events = []
+
+    def make_backtester(self, tickers=("AAPL",), fail=(), **kwargs):
+        with mock.patch(
+            "tradingagents.graph.backtest.TradingAgentsGraph",
+            return_value=FakeGraph(self.events, fail),
+        ):
+            backtester = Backtester(
+                tickers,
+                DATES[0],
+                DATES[-1],
+                config=self.config,
+                checkpoint_path=self.checkpoint_path,
+                **kwargs,
+            )
+        for ticker in backtester.tickers:
+            backtester._closes[ticker] = pd.Series(CLOSES, index=DATES)
+        return backtester
+
+    def read_checkpoint(self):
+        with open(self.checkpoint_path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_forward_return_is_none_until_holding_period_ends(self):
+        backtester = self.make_backtester(holding_days=2)
+
+        self.assertAlmostEqual(backtester.forward_return("AAPL", DATES[0]), -0.01)
+        self.assertAlmostEqual(backtester.forward_return("AAPL", DATES[2]), 0.1)
+        self.assertIsNone(backtester.forward_return("AAPL", DATES[3]))
+        self.assertIsNone(backtester.forward_return("AAPL", DATES[-1]))
+        self.assertIsNone(backtester.forward_return("AAPL", "2025-01-04"))
+
+    def test_reflects_only_after_holding_period(self):
+        summary = self.make_backtester(holding_days=2).run()
+
+        self.assertEqual(self.events, [
+            ("run", "AAPL", DATES[0]),
+            ("run", "AAPL", DATES[1]),
+            ("reflect", [DATES[0]]),
+            ("run", "AAPL", DATES[2]),
+            ("reflect", [DATES[1]]),
+            ("run", "AAPL", DATES[3]),
+            ("reflect", [DATES[2]]),
+            ("run", "AAPL", DATES[4]),
+        ])
+        self.assertEqual([r["pnl"] is None for r in summary["results"]], [False] * 3 + [True] * 2)
+        reflected = [r["trade_date"] for r in self.read_checkpoint() if r["event"] == "reflected"]
+        self.assertEqual(reflected, DATES[:3])
+
+    def test_resume_skips_completed_runs_and_retries_errors(self):
+        first = self.make_backtester(
+            tickers=("AAPL", "MSFT"), fail=[("MSFT", DATES[1])], reflect=False
+        ).run()
+        self.assertEqual((first["runs"], first["completed_runs"]), (9, 9))
+        errors = [r for r in self.read_checkpoint() if r["event"] == "error"]
+        self.assertEqual([(r["ticker"], r["trade_date"]) for r in errors], [("MSFT", DATES[1])])
+
+        self.events.clear()
+        resumed = self.make_backtester(tickers=("AAPL", "MSFT"), reflect=False).run()
+
+        self.assertEqual(self.events, [("run", "MSFT", DATES[1])])
+        self.assertEqual(
+            (resumed["runs"], resumed["resumed_runs"], resumed["completed_runs"]), (10, 9, 1)
+        )
+
+    def test_usage_covers_only_this_session(self):
+        backtester = self.make_backtester(reflect=False)
+        tracer = backtester.graph.tracer
+        tracer.summaries.append(make_summary("quick", 500, 50, None))
+
+        summary = backtester.run()
+
+        self.assertEqual((summary["llm_calls"], summary["tokens_in"]), (5, 500))
+        self.assertIsNone(summary["cost_usd"])
+
+    def test_tracer_summaries_are_drained_after_each_date(self):
+        backtester = self.make_backtester(holding_days=2)
+        backtester.graph.tracer.pricing = {"quick": {"input": 1.0, "output": 1.0}}
+
+        summary = backtester.run()
+
+        self.assertEqual(list(backtester.graph.tracer.summaries), [])
+        self.assertEqual(summary["llm_calls"], 5)
+        self.assertAlmostEqual(summary["cost_usd"], 0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
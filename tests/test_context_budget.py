@@ -0,0 +1,116 @@
+import unittest
+from types import SimpleNamespace
+
+from tradingagents.agents.managers.research_manager import create_research_manager
+from tradingagents.agents.researchers.bull_researcher import create_bull_researcher
+from tradingagents.agents.utils.context_budget import ContextBudget
+
+
+class FakeLLM:
+    def __init__(self):
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return SimpleNamespace(content=f"summary {len(self.prompts)}")
+
+    def batch(self, prompts):
+        return [self.invoke(p) for p in prompts]
+
+
+def make_state(history=""):
+    return {
+        "market_report": "x" * 4000,
+        "sentiment_report": "short",
+        "news_report": "",
+        "fundamentals_report": "y" * 4000,
+        "investment_debate_state": {"history": history, "count": 0},
+    }
+
+
+class FakeMemory:
+    def __init__(self):
+        self.queries = []
+
+    def get_memories(self, current_situation, n_matches=1):
+        self.queries.append(current_situation)
+        return [{"recommendation": "Past lesson."}]
+
+
+def make_agent_state():
+    state = make_state()
+    state["company_of_interest"] = "NVDA"
+    state["investment_debate_state"].update(
+        {"current_response": "", "bull_history": "", "bear_history": ""}
+    )
+    return state
+
+
+class ContextBudgetTests(unittest.TestCase):
+    def test_only_long_reports_are_digested_once(self):
+        llm = FakeLLM()
+        budget = ContextBudget(llm, report_tokens=100, history_tokens=1000)
+
+        view = budget.apply(make_state(), "bull_researcher")
+        budget.apply(make_state(), "bear_researcher")
+
+        self.assertEqual(len(llm.prompts), 2)
+        self.assertTrue(view["market_report"].startswith("summary"))
+        self.assertEqual(view["sentiment_report"], "short")
+
+    def test_per_agent_overrides(self):
+        llm = FakeLLM()
+        budget = ContextBudget(llm, report_tokens=100, agents={"portfolio_manager": {"report_tokens": 2000}})
+
+        view = budget.apply(make_state(), "portfolio_manager")
+
+        self.assertEqual(llm.prompts, [])
+        self.assertEqual(view["market_report"], "x" * 4000)
+
+    def test_history_summary_rolls_forward(self):
+        llm = FakeLLM()
+        budget = ContextBudget(llm, report_tokens=10000, history_tokens=200)
+        turns = [
+            f"\n{side} Analyst: point {i} " + "argument " * 40
+            for i, side in enumerate(["Bull", "Bear"] * 3)
+        ]
+
+        first = budget.apply(make_state("".join(turns[:4])))
+        second = budget.apply(make_state("".join(turns)))
+
+        self.assertIn("[Summary of earlier debate turns]", first["investment_debate_state"]["history"])
+        self.assertTrue(second["investment_debate_state"]["history"].rstrip().endswith(turns[-1].strip()))
+        # The second round extends the first summary instead of starting over
+        self.assertIn("summary 1", llm.prompts[-1])
+        self.assertNotIn(turns[0].strip(), llm.prompts[-1])
+
+    def test_state_is_not_modified(self):
+        state = make_state()
+        ContextBudget(FakeLLM(), report_tokens=100).apply(state)
+
+        self.assertEqual(state["market_report"], "x" * 4000)
+
+
+    def test_memory_lookup_uses_full_reports(self):
+        llm, memory = FakeLLM(), FakeMemory()
+        budget = ContextBudget(llm, report_tokens=100)
+
+        create_bull_researcher(llm, memory, budget).invoke(make_agent_state())
+
+        self.assertIn("x" * 4000, memory.queries[0])
+        self.assertIn("Past lesson.", llm.prompts[-1])
+        self.assertNotIn("x" * 4000, llm.prompts[-1])
+
+    def test_managers_do_not_digest_reports(self):
+        llm, memory = FakeLLM(), FakeMemory()
+        budget = ContextBudget(llm, report_tokens=100)
+
+        create_research_manager(llm, memory, budget).invoke(make_agent_state())
+
+        # Only the manager's own prompt, no report digests
+        self.assertEqual(len(llm.prompts), 1)
+        self.assertIn("y" * 4000, memory.queries[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
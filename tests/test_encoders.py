@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.encoders import NON_TRADING_DAY, OutputEncoder
+from tradingagents.dataflows.y_finance import get_stock_stats_indicators_window
+
+
+def balance_sheet():
+    columns = pd.to_datetime(["2024-03-31", "2023-12-31"])
+    return pd.DataFrame(
+        [[1.5e9, 1.25e9], [np.nan, np.nan], [0.123456, np.nan]],
+        index=pd.Index(["Total Assets", "Goodwill", "Ratio"]),
+        columns=columns,
+    )
+
+
+class OutputEncoderTests(unittest.TestCase):
+    def test_defaults_match_to_csv(self):
+        data = balance_sheet()
+        self.assertEqual(OutputEncoder().table(data), data.to_csv())
+
+    def test_compact_table(self):
+        encoder = OutputEncoder(format="compact", drop_empty=True, precision=3)
+        self.assertEqual(
+            encoder.table(balance_sheet()),
+            "|2024-03-31|2023-12-31\n"
+            "Total Assets|1500000000|1250000000\n"
+            "Ratio|0.123|\n",
+        )
+
+    def test_collapses_non_trading_runs(self):
+        dates = ["2024-03-25", "2024-03-24", "2024-03-23", "2024-03-22"]
+        values = ["51.2", NON_TRADING_DAY, NON_TRADING_DAY, "50.9"]
+
+        self.assertEqual(
+            OutputEncoder(collapse_non_trading_days=True).dated_values(dates, values),
+            "2024-03-25: 51.2\n"
+            f"2024-03-23 to 2024-03-24: {NON_TRADING_DAY}\n"
+            "2024-03-22: 50.9\n",
+        )
+        self.assertEqual(OutputEncoder().dated_values(dates, values).count(NON_TRADING_DAY), 2)
+
+    def test_dated_values_round_floats(self):
+        dates = ["2024-03-25", "2024-03-24", "2024-03-22"]
+        values = [51.23456, NON_TRADING_DAY, "N/A"]
+
+        self.assertEqual(
+            OutputEncoder(precision=2).dated_values(dates, values),
+            f"2024-03-25: 51.23\n2024-03-24: {NON_TRADING_DAY}\n2024-03-22: N/A\n",
+        )
+        self.assertIn("2024-03-25: 51.23456\n", OutputEncoder().dated_values(dates, values))
+
+    def test_indicator_window_uses_precision(self):
+        values = pd.Series(
+            [50.987654, np.nan, 51.23456],
+            index=pd.to_datetime(["2024-03-21", "2024-03-22", "2024-03-25"]),
+        )
+        engine = Mock()
+        engine.get_indicator.return_value = values
+
+        with patch("tradingagents.dataflows.y_finance.get_indicator_engine", return_value=engine), \
+                patch(
+                    "tradingagents.dataflows.y_finance.get_output_encoder",
+                    return_value=OutputEncoder(precision=3),
+                ):
+            report = get_stock_stats_indicators_window("AAPL", "rsi", "2024-03-25", 4)
+
+        self.assertIn("2024-03-25: 51.235\n", report)
+        self.assertIn("2024-03-22: N/A\n", report)
+        self.assertIn("2024-03-21: 50.988\n", report)
+
+    def test_rejects_unknown_format(self):
+        with self.assertRaises(ValueError):
+            OutputEncoder(format="xml")
+
+
+if __name__ == "__main__":
+    unittest.main()
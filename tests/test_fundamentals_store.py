@@ -0,0 +1,111 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.fundamentals_store import FundamentalsStore
+
+
+def make_statement(periods, assets=1000.0):
+    columns = pd.to_datetime(periods)
+    return pd.DataFrame(
+        [[assets + i for i in range(len(columns))], [np.nan] * len(columns)],
+        index=pd.Index(["Total Assets", "Goodwill"]),
+        columns=columns,
+    )
+
+
+class FundamentalsStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = FundamentalsStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def statement(self, as_of, today, fetched):
+        with patch(
+            "tradingagents.dataflows.fundamentals_store._fetch_statement", return_value=fetched
+        ) as fetch:
+            data = self.store.statement(
+                "AAPL", "balance_sheet", "quarterly", as_of=as_of, today=pd.Timestamp(today)
+            )
+        return data, fetch.call_count
+
+    def test_backtest_dates_are_answered_from_one_fetch(self):
+        fetched = make_statement(["2024-03-31", "2023-12-31"])
+        data, calls = self.statement("2024-05-10", "2024-05-10", fetched)
+        self.assertEqual(calls, 1)
+        pd.testing.assert_frame_equal(data, fetched, check_freq=False)
+
+        for as_of in ["2023-06-30", "2024-01-15", "2024-05-01"]:
+            _, calls = self.statement(as_of, "2024-05-11", fetched)
+            self.assertEqual(calls, 0)
+
+    def test_refreshes_only_once_a_new_period_could_exist(self):
+        self.statement("2024-05-10", "2024-05-10", make_statement(["2024-03-31"]))
+
+        # The next quarter ends 2024-06-30; nothing new can exist before it
+        _, calls = self.statement("2024-06-20", "2024-06-20", make_statement(["2024-03-31"]))
+        self.assertEqual(calls, 0)
+
+        newer = make_statement(["2024-06-30", "2024-03-31"], assets=2000.0)
+        data, calls = self.statement("2024-08-05", "2024-08-05", newer)
+        self.assertEqual(calls, 1)
+        self.assertEqual(list(data.columns.strftime("%Y-%m-%d")), ["2024-06-30", "2024-03-31"])
+
+        # Rechecked at most once per day
+        _, calls = self.statement("2024-08-05", "2024-08-05", newer)
+        self.assertEqual(calls, 0)
+
+    def test_keeps_point_in_time_versions(self):
+        self.statement("2024-05-10", "2024-05-10", make_statement(["2024-03-31"], assets=1000.0))
+        restated = make_statement(["2024-06-30", "2024-03-31"], assets=1500.0)
+        self.statement("2024-08-05", "2024-08-05", restated)
+
+        snapshots = self.store.snapshots("AAPL", "balance_sheet_quarterly")
+        self.assertEqual([s["fetched"] for s in snapshots], ["2024-05-10", "2024-08-05"])
+
+        before, calls = self.statement("2024-07-01", "2024-08-06", restated)
+        self.assertEqual(calls, 0)
+        self.assertEqual(before.loc["Total Assets"].tolist(), [1000.0])
+        self.assertTrue(pd.isna(before.loc["Goodwill"]).all())
+
+    def test_unchanged_refresh_extends_the_snapshot(self):
+        self.statement("2024-05-10", "2024-05-10", make_statement(["2024-03-31"]))
+        self.statement("2024-07-15", "2024-07-15", make_statement(["2024-03-31"]))
+
+        snapshots = self.store.snapshots("AAPL", "balance_sheet_quarterly")
+        self.assertEqual(len(snapshots), 1)
+        self.assertEqual(snapshots[0]["checked"], "2024-07-15")
+
+    def test_info_reused_for_earlier_dates(self):
+        with patch(
+            "tradingagents.dataflows.fundamentals_store._fetch_info",
+            return_value={"longName": "Apple Inc.", "beta": 1.2},
+        ) as fetch:
+            for as_of in ["2024-05-10", "2024-01-02", "2024-05-10"]:
+                info = self.store.info("AAPL", as_of=as_of, today=pd.Timestamp("2024-05-10"))
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(info["beta"], 1.2)
+
+    def test_info_keeps_only_the_newest_snapshots(self):
+        store = FundamentalsStore(self.tmp.name, info_snapshots=2)
+        days = pd.bdate_range("2024-05-06", periods=4)
+        for i, day in enumerate(days):
+            with patch(
+                "tradingagents.dataflows.fundamentals_store._fetch_info",
+                return_value={"longName": "Apple Inc.", "currentPrice": 180.0 + i},
+            ):
+                store.info("AAPL", today=day)
+
+        snapshots = store.snapshots("AAPL", "info")
+        self.assertEqual([s["fetched"] for s in snapshots], ["2024-05-08", "2024-05-09"])
+        info = store.info("AAPL", as_of="2024-05-06", today=days[-1])
+        self.assertEqual(info["currentPrice"], 182.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+from tradingagents.dataflows.indicator_engine import IndicatorEngine
+
+
+def make_history(*args, **kwargs):
+    dates = pd.bdate_range("2024-01-01", periods=60)
+    closes = np.linspace(100.0, 130.0, len(dates))
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Open": closes,
+            "High": closes + 1,
+            "Low": closes - 1,
+            "Close": closes,
+            "Volume": np.full(len(dates), 1000),
+        }
+    )
+
+
+class IndicatorEngineTests(unittest.TestCase):
+    def setUp(self):
+        self.store = Mock()
+        self.store.fetched_until.return_value = pd.Timestamp("2024-03-26")
+        patcher = patch(
+            "tradingagents.dataflows.indicator_engine.get_ohlcv_store", return_value=self.store
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("tradingagents.dataflows.indicator_engine.load_ohlcv", side_effect=make_history)
+    def test_indicators_for_same_key_share_one_computation(self, load):
+        engine = IndicatorEngine(max_entries=4)
+
+        rsi = engine.get_indicator("AAPL", "rsi", "2024-03-22")
+        macd = engine.get_indicator("aapl", "macd", "2024-03-22")
+
+        load.assert_called_once()
+        self.assertEqual(len(rsi), 60)
+        self.assertEqual(len(macd), 60)
+        self.assertEqual(engine.get_stats()["hits"], 1)
+
+    @patch("tradingagents.dataflows.indicator_engine.load_ohlcv", side_effect=make_history)
+    def test_least_recently_used_frame_is_evicted(self, load):
+        engine = IndicatorEngine(max_entries=2)
+
+        engine.get_frame("AAPL", "2024-03-20")
+        engine.get_frame("MSFT", "2024-03-20")
+        engine.get_frame("AAPL", "2024-03-20")
+        engine.get_frame("NVDA", "2024-03-20")
+        engine.get_frame("MSFT", "2024-03-20")
+
+        self.assertEqual(load.call_count, 4)
+        self.assertEqual(engine.get_stats()["entries"], 2)
+
+    @patch("tradingagents.dataflows.indicator_engine.load_ohlcv", side_effect=make_history)
+    def test_frames_not_yet_fetched_past_are_not_cached(self, load):
+        engine = IndicatorEngine()
+
+        engine.get_frame("AAPL", "2024-03-26")
+        engine.get_frame("AAPL", "2024-03-26")
+        self.store.fetched_until.return_value = pd.Timestamp("2024-03-27")
+        engine.get_frame("AAPL", "2024-03-26")
+        engine.get_frame("AAPL", "2024-03-26")
+
+        self.assertEqual(load.call_count, 3)
+        self.assertEqual(engine.get_stats()["entries"], 1)
+
+    @patch(
+        "tradingagents.dataflows.indicator_engine.load_ohlcv", side_effect=RuntimeError("outage")
+    )
+    def test_failed_computation_releases_its_key_lock(self, load):
+        engine = IndicatorEngine()
+
+        with self.assertRaises(RuntimeError):
+            engine.get_frame("AAPL", "2024-03-22")
+
+        self.assertEqual(engine._key_locks, {})
+
+    def test_unsupported_indicator_raises(self):
+        with self.assertRaises(ValueError):
+            IndicatorEngine().get_indicator("AAPL", "not_an_indicator", "2024-03-22")
+
+
+if __name__ == "__main__":
+    unittest.main()
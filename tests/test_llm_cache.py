@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
+
+from tradingagents.llm_clients.cache import LLMCacheMissError, LLMResponseCache
+
+
+def prompt(text, message_id):
+    return dumps([HumanMessage(content=text, id=message_id)])
+
+
+class LLMResponseCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "llm_cache.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hits_ignore_message_ids(self):
+        cache = LLMResponseCache(self.path)
+        cache.update(prompt("Rate NVDA", "run-1"), "gpt", [ChatGeneration(message=AIMessage(content="BUY"))])
+
+        cached = LLMResponseCache(self.path).lookup(prompt("Rate NVDA", "run-2"), "gpt")
+
+        self.assertEqual(cached[0].message.content, "BUY")
+        self.assertIsNone(cache.lookup(prompt("Rate NVDA", "run-3"), "other-model"))
+
+    def test_replay_mode_raises_on_miss(self):
+        cache = LLMResponseCache(self.path, replay_only=True)
+
+        with self.assertRaises(LLMCacheMissError):
+            cache.lookup(prompt("Rate AAPL", "run-1"), "gpt")
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = LLMResponseCache(self.path, max_size_mb=0.002)
+        for i in range(3):
+            generation = ChatGeneration(message=AIMessage(content=str(i) * 600))
+            cache.update(prompt(f"question {i}", "id"), "gpt", [generation])
+
+        self.assertIsNone(cache.lookup(prompt("question 0", "id"), "gpt"))
+        self.assertIsNotNone(cache.lookup(prompt("question 2", "id"), "gpt"))
+        self.assertLessEqual(cache.get_stats()["size_bytes"], cache.max_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
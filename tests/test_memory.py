@@ -0,0 +1,137 @@
+import sys
+import tempfile
+import threading
+import unittest
+
+from tradingagents.agents.utils.memory import FinancialSituationMemory
+
+SITUATIONS = [
+    ("High inflation with rising interest rates", "Favor consumer staples."),
+    ("Tech sector volatility with institutional selling", "Trim growth tech."),
+    ("Strong dollar pressuring emerging markets", "Hedge currency exposure."),
+]
+
+
+class FinancialSituationMemoryTests(unittest.TestCase):
+    def setUp(self):
+        self.memory = FinancialSituationMemory("test")
+        self.memory.add_situations(SITUATIONS)
+
+    def test_best_match_ranks_first(self):
+        results = self.memory.get_memories("tech stocks hit by institutional selling", n_matches=2)
+
+        self.assertEqual(results[0]["recommendation"], "Trim growth tech.")
+        self.assertEqual(results[0]["similarity_score"], 1.0)
+        self.assertEqual(len(results), 2)
+
+    def test_incremental_adds_are_searchable(self):
+        self.memory.add_situations([("Oil supply shock lifts energy prices", "Add energy exposure.")])
+
+        results = self.memory.get_memories("energy prices after an oil shock")
+
+        self.assertEqual(results[0]["recommendation"], "Add energy exposure.")
+        self.assertEqual(self.memory.postings["oil"], {3: 1})
+
+    def test_unmatched_query_still_returns_requested_count(self):
+        results = self.memory.get_memories("nothing in common", n_matches=2)
+
+        self.assertEqual([r["similarity_score"] for r in results], [0.0, 0.0])
+        self.assertEqual(results[0]["recommendation"], "Favor consumer staples.")
+
+    def test_queries_run_safely_alongside_adds(self):
+        errors = []
+        # Switch threads often so queries overlap with in-place index updates
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        self.memory.add_situations(
+            [(f"inflation backlog {i}", f"advice {i}") for i in range(2000)]
+        )
+
+        def add():
+            for i in range(200):
+                self.memory.add_situations([(f"inflation situation {i} term{i}", f"advice {i}")])
+
+        def query():
+            try:
+                for _ in range(50):
+                    self.memory.get_memories("inflation rising rates", n_matches=3)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=add)] + [threading.Thread(target=query) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.memory.term_counts), 2203)
+
+    def test_clear(self):
+        self.memory.clear()
+
+        self.assertEqual(self.memory.get_memories("inflation"), [])
+
+
+class PersistentMemoryTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = {"memory_dir": self.tmp.name}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_memories_survive_restart(self):
+        FinancialSituationMemory("bull_memory", self.config).add_situations(SITUATIONS)
+
+        reloaded = FinancialSituationMemory("bull_memory", self.config)
+        results = reloaded.get_memories("strong dollar hurts emerging markets")
+
+        self.assertEqual(results[0]["recommendation"], "Hedge currency exposure.")
+        self.assertEqual(len(reloaded.term_counts), 3)
+
+    def test_appends_from_another_instance_are_picked_up(self):
+        reader = FinancialSituationMemory("trader_memory", self.config)
+        writer = FinancialSituationMemory("trader_memory", self.config)
+        reader.add_situations(SITUATIONS[:1])
+
+        writer.add_situations(SITUATIONS[1:])
+        results = reader.get_memories("tech sector selling")
+
+        self.assertEqual(results[0]["recommendation"], "Trim growth tech.")
+        self.assertEqual(len(reader.term_counts), 3)
+
+    def test_queries_run_safely_while_other_writers_append(self):
+        reader = FinancialSituationMemory("shared_memory", self.config)
+        writer = FinancialSituationMemory("shared_memory", self.config)
+        writer.add_situations([(f"inflation backlog {i}", f"advice {i}") for i in range(1000)])
+        errors = []
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def add():
+            for i in range(100):
+                writer.add_situations([(f"inflation situation {i}", f"advice {i}")])
+
+        def query():
+            try:
+                for _ in range(50):
+                    reader.get_memories("inflation rising rates", n_matches=3)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=add)] + [threading.Thread(target=query) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        reader.get_memories("inflation")
+        self.assertEqual(len(reader.term_counts), 1100)
+
+
+if __name__ == "__main__":
+    unittest.main()
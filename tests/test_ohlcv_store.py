@@ -0,0 +1,175 @@
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from tradingagents.dataflows.ohlcv_store import (
+    FAILED_FETCH_RETRY_SECONDS,
+    OHLCVStore,
+    _download_many,
+)
+
+
+def make_bars(dates, close_offset=0.0):
+    dates = pd.to_datetime(dates)
+    closes = [100.0 + i + close_offset for i in range(len(dates))]
+    return pd.DataFrame(
+        {
+            "Date": dates,
+            "Open": closes,
+            "High": [c + 1 for c in closes],
+            "Low": [c - 1 for c in closes],
+            "Close": closes,
+            "Volume": [1000 * (i + 1) for i in range(len(dates))],
+        }
+    )
+
+
+class OHLCVStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = OHLCVStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_read_filters_by_date_range(self):
+        bars = make_bars(["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"])
+        self.store.write("AAPL", bars, pd.Timestamp("2024-01-06"))
+
+        window = self.store.read("AAPL", start="2024-01-03", end="2024-01-04")
+
+        self.assertEqual(
+            list(window["Date"].dt.strftime("%Y-%m-%d")), ["2024-01-03", "2024-01-04"]
+        )
+        self.assertEqual(list(window["Close"]), [101.0, 102.0])
+        self.assertEqual(list(window["Volume"]), [2000, 3000])
+
+    def test_append_skips_already_stored_days(self):
+        self.store.write("AAPL", make_bars(["2024-01-02", "2024-01-03"]), pd.Timestamp("2024-01-04"))
+        self.store.append(
+            "AAPL", make_bars(["2024-01-03", "2024-01-04"], close_offset=1.0), pd.Timestamp("2024-01-05")
+        )
+
+        data = self.store.read("AAPL")
+
+        self.assertEqual(len(data), 3)
+        self.assertEqual(self.store.fetched_until("AAPL"), pd.Timestamp("2024-01-05"))
+
+    def test_update_downloads_only_missing_days(self):
+        self.store.write("AAPL", make_bars(["2024-01-02", "2024-01-03"]), pd.Timestamp("2024-01-04"))
+        # Same close on the overlapping 2024-01-03 bar, so no reload
+        new_bars = make_bars(["2024-01-03", "2024-01-04", "2024-01-05"], close_offset=1.0)
+
+        with patch("tradingagents.dataflows.ohlcv_store._download", return_value=new_bars) as download:
+            self.store.update("AAPL", today=pd.Timestamp("2024-01-06"))
+            self.store.update("AAPL", today=pd.Timestamp("2024-01-06"))
+
+        download.assert_called_once()
+        self.assertEqual(download.call_args[0][1], pd.Timestamp("2024-01-03"))
+        self.assertEqual(len(self.store.read("AAPL")), 4)
+
+    def test_update_reloads_when_adjusted_history_changes(self):
+        self.store.write("AAPL", make_bars(["2024-01-02", "2024-01-03"]), pd.Timestamp("2024-01-04"))
+        readjusted = make_bars(["2024-01-02", "2024-01-03", "2024-01-04"], close_offset=-50.0)
+
+        with patch("tradingagents.dataflows.ohlcv_store._download", return_value=readjusted) as download:
+            self.store.update("AAPL", today=pd.Timestamp("2024-01-05"))
+
+        self.assertEqual(download.call_count, 2)
+        self.assertEqual(list(self.store.read("AAPL")["Close"]), [50.0, 51.0, 52.0])
+
+    def test_update_many_groups_symbols_by_start_date(self):
+        self.store.write("AAPL", make_bars(["2024-01-02", "2024-01-03"]), pd.Timestamp("2024-01-04"))
+        self.store.write("MSFT", make_bars(["2024-01-02", "2024-01-03"]), pd.Timestamp("2024-01-04"))
+        # Same close on the overlapping 2024-01-03 bar, so no reload
+        new_bars = make_bars(["2024-01-03", "2024-01-04", "2024-01-05"], close_offset=1.0)
+
+        def download_many(symbols, start, end):
+            return {symbol: new_bars.copy() for symbol in symbols}
+
+        with patch("tradingagents.dataflows.ohlcv_store._download_many", side_effect=download_many) as bulk, \
+                patch("tradingagents.dataflows.ohlcv_store._download") as single:
+            self.store.update_many(["AAPL", "msft", "NVDA"], today=pd.Timestamp("2024-01-06"))
+            self.store.update_many(["AAPL", "MSFT", "NVDA"], today=pd.Timestamp("2024-01-06"))
+
+        # One request for the stored symbols, one for the new one; none repeated
+        self.assertEqual(bulk.call_count, 2)
+        self.assertEqual(sorted(bulk.call_args_list[0][0][0]), ["AAPL", "MSFT"])
+        self.assertEqual(bulk.call_args_list[1][0][0], ["NVDA"])
+        single.assert_not_called()
+        self.assertEqual(len(self.store.read("MSFT")), 4)
+        self.assertEqual(len(self.store.read("NVDA")), 3)
+
+    def test_empty_download_is_not_repeated_the_same_day(self):
+        empty = make_bars([])
+
+        with patch("tradingagents.dataflows.ohlcv_store._download", return_value=empty) as download:
+            self.store.update("GONE", today=pd.Timestamp("2024-01-06"))
+            self.store.update("GONE", today=pd.Timestamp("2024-01-06"))
+            self.store.update_many(["GONE"], today=pd.Timestamp("2024-01-06"))
+            self.assertEqual(download.call_count, 1)
+            self.assertEqual(self.store.fetched_until("GONE"), pd.Timestamp("2024-01-06"))
+
+            self.store.update("GONE", today=pd.Timestamp("2024-01-07"))
+
+        self.assertEqual(download.call_count, 2)
+        self.assertTrue(self.store.read("GONE").empty)
+
+    def test_failed_download_is_retried_only_after_a_delay(self):
+        self.store.write("AAPL", make_bars(["2024-01-02", "2024-01-03"]), pd.Timestamp("2024-01-04"))
+        outage = ConnectionError("rate limited")
+
+        with patch("tradingagents.dataflows.ohlcv_store._download", side_effect=outage) as download, \
+                patch("tradingagents.dataflows.ohlcv_store._download_many", side_effect=outage) as bulk, \
+                self.assertLogs("tradingagents.dataflows.ohlcv_store", level="WARNING"):
+            self.store.update("AAPL", today=pd.Timestamp("2024-01-06"))
+            self.store.update("AAPL", today=pd.Timestamp("2024-01-06"))
+            self.store.update_many(["AAPL", "MSFT"], today=pd.Timestamp("2024-01-06"))
+            self.store.update("MSFT", today=pd.Timestamp("2024-01-06"))
+
+            download.assert_called_once()
+            self.assertEqual(bulk.call_args[0][0], ["MSFT"])
+            self.assertEqual(self.store.fetched_until("AAPL"), pd.Timestamp("2024-01-04"))
+            self.assertEqual(len(self.store.read("AAPL")), 2)
+
+            later = time.time() + FAILED_FETCH_RETRY_SECONDS
+            with patch("tradingagents.dataflows.ohlcv_store.time.time", return_value=later):
+                self.store.update("AAPL", today=pd.Timestamp("2024-01-06"))
+
+        self.assertEqual(download.call_count, 2)
+
+    def test_dividends_and_splits_are_kept(self):
+        bars = make_bars(["2024-01-02", "2024-01-03"])
+        bars["Dividends"] = [0.0, 0.24]
+        bars["Stock Splits"] = [4.0, 0.0]
+        self.store.write("AAPL", bars, pd.Timestamp("2024-01-04"))
+
+        data = self.store.read("AAPL")
+
+        self.assertEqual(list(data["Dividends"]), [0.0, 0.24])
+        self.assertEqual(list(data["Stock Splits"]), [4.0, 0.0])
+
+    def test_download_many_splits_grouped_frame(self):
+        index = pd.DatetimeIndex(pd.to_datetime(["2024-01-02", "2024-01-03"]), name="Date")
+        columns = pd.MultiIndex.from_product([["AAPL", "NEWCO"], ["Open", "High", "Low", "Close", "Volume"]])
+        values = [
+            [1.0, 2.0, 0.5, 1.5, 100, None, None, None, None, None],
+            [1.5, 2.5, 1.0, 2.0, 200, 9.0, 9.5, 8.5, 9.0, 50],
+        ]
+        grouped = pd.DataFrame(values, index=index, columns=columns)
+
+        with patch("tradingagents.dataflows.ohlcv_store.yf.download", return_value=grouped):
+            frames = _download_many(
+                ["AAPL", "NEWCO", "GONE"], pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-04")
+            )
+
+        self.assertEqual(sorted(frames), ["AAPL", "NEWCO"])
+        self.assertEqual(list(frames["AAPL"]["Close"]), [1.5, 2.0])
+        self.assertEqual(len(frames["NEWCO"]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
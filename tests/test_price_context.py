@@ -0,0 +1,52 @@
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from tradingagents.dataflows.ohlcv_store import OHLCVStore
+from tradingagents.dataflows.price_context import get_price_window, price_context
+
+
+class PriceContextTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = OHLCVStore(self.tmp.name)
+        dates = pd.bdate_range("2024-01-01", "2024-01-31")
+        bars = pd.DataFrame({
+            "Date": dates, "Open": 1.0, "High": 2.0, "Low": 0.5,
+            "Close": [float(i) for i in range(len(dates))], "Volume": 100,
+        })
+        self.store.write("AAPL", bars, pd.Timestamp("2024-02-01"))
+        patcher = patch(
+            "tradingagents.dataflows.price_context.get_ohlcv_store", return_value=self.store
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # History is fetched up to 2024-02-01; don't top it up from the network
+        updater = patch.object(self.store, "update")
+        updater.start()
+        self.addCleanup(updater.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_history_is_read_once_per_context(self):
+        with patch.object(self.store, "read", wraps=self.store.read) as read:
+            with price_context():
+                first = get_price_window("aapl", start="2024-01-08", end="2024-01-12")
+                second = get_price_window("AAPL", end="2024-01-03")
+                with price_context():
+                    get_price_window("AAPL")
+            get_price_window("AAPL")
+
+        # One read inside the (nested) context, one outside it
+        self.assertEqual(read.call_count, 2)
+        self.assertEqual(list(first["Close"]), [5.0, 6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(second.index.max(), pd.Timestamp("2024-01-03"))
+
+    def test_start_before_stored_history(self):
+        self.assertIsNone(get_price_window("AAPL", start="2010-01-01"))
+        self.assertIsNone(get_price_window("MSFT", start="2024-01-02"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from types import SimpleNamespace
+
+from tradingagents.graph.reflection import Reflector
+
+MEMORY_NAMES = [
+    "bull_memory",
+    "bear_memory",
+    "trader_memory",
+    "invest_judge_memory",
+    "portfolio_manager_memory",
+]
+
+
+class RecordingLLM:
+    """Answers each prompt with its report text and records every call."""
+
+    def __init__(self):
+        self.invoke_calls = []
+        self.batch_calls = []
+
+    def invoke(self, messages):
+        self.invoke_calls.append(messages)
+        return self._answer(messages)
+
+    def batch(self, inputs, config=None):
+        self.batch_calls.append((list(inputs), config))
+        return [self._answer(messages) for messages in inputs]
+
+    @staticmethod
+    def _answer(messages):
+        report = messages[1][1].split("Analysis/Decision: ")[1].split("\n\n")[0]
+        return SimpleNamespace(content=f"lesson for {report}")
+
+
+class RecordingMemory:
+    def __init__(self):
+        self.calls = []
+
+    def add_situations(self, situations_and_advice):
+        self.calls.append(list(situations_and_advice))
+
+
+def make_state(ticker):
+    return {
+        "market_report": f"{ticker} market",
+        "sentiment_report": f"{ticker} sentiment",
+        "news_report": f"{ticker} news",
+        "fundamentals_report": f"{ticker} fundamentals",
+        "investment_debate_state": {
+            "bull_history": f"{ticker} bull",
+            "bear_history": f"{ticker} bear",
+            "judge_decision": f"{ticker} research manager",
+        },
+        "trader_investment_plan": f"{ticker} trader",
+        "risk_debate_state": {"judge_decision": f"{ticker} portfolio manager"},
+    }
+
+
+class ReflectAllTests(unittest.TestCase):
+    def setUp(self):
+        self.llm = RecordingLLM()
+        self.reflector = Reflector(self.llm)
+        self.memories = {name: RecordingMemory() for name in MEMORY_NAMES}
+
+    def test_one_batch_call_and_one_add_per_memory(self):
+        outcomes = [(make_state("AAPL"), 0.02), (make_state("MSFT"), -0.01)]
+
+        self.reflector.reflect_all(outcomes, self.memories, max_concurrency=3)
+
+        self.assertEqual(self.llm.invoke_calls, [])
+        self.assertEqual(len(self.llm.batch_calls), 1)
+        inputs, config = self.llm.batch_calls[0]
+        self.assertEqual(len(inputs), len(outcomes) * len(MEMORY_NAMES))
+        self.assertEqual(config, {"max_concurrency": 3})
+        for memory in self.memories.values():
+            self.assertEqual(len(memory.calls), 1)
+            self.assertEqual(len(memory.calls[0]), len(outcomes))
+
+    def test_each_memory_gets_its_own_reflections(self):
+        aapl, msft = make_state("AAPL"), make_state("MSFT")
+
+        self.reflector.reflect_all([(aapl, 0.02), (msft, -0.01)], self.memories)
+
+        situation = self.reflector._extract_current_situation(aapl)
+        self.assertEqual(
+            self.memories["bear_memory"].calls[0][0], (situation, "lesson for AAPL bear")
+        )
+        self.assertEqual(
+            [advice for _, advice in self.memories["portfolio_manager_memory"].calls[0]],
+            ["lesson for AAPL portfolio manager", "lesson for MSFT portfolio manager"],
+        )
+        self.assertIsNone(self.llm.batch_calls[0][1])
+
+    def test_no_outcomes_makes_no_calls(self):
+        self.reflector.reflect_all([], self.memories)
+
+        self.assertEqual(self.llm.batch_calls, [])
+        self.assertTrue(all(not memory.calls for memory in self.memories.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
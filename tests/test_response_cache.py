@@ -0,0 +1,108 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from tradingagents.dataflows import interface
+from tradingagents.dataflows.response_cache import (
+    MISS,
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+
+
+def get_fundamentals(ticker, curr_date=None):
+    return f"fundamentals for {ticker}"
+
+
+class ResponseCacheTests(unittest.TestCase):
+    def test_equivalent_calls_share_a_key(self):
+        cache = ResponseCache(MemoryCacheBackend())
+
+        key, as_of = cache.make_key("get_fundamentals", "yfinance", get_fundamentals, ("aapl ",), {"curr_date": "2024-01-05"})
+        same, _ = cache.make_key("get_fundamentals", "yfinance", get_fundamentals, (), {"ticker": "AAPL", "curr_date": "2024-01-05"})
+        other_date, _ = cache.make_key("get_fundamentals", "yfinance", get_fundamentals, ("AAPL", "2024-01-08"), {})
+
+        self.assertEqual(key, same)
+        self.assertNotEqual(key, other_date)
+        self.assertEqual(as_of, "2024-01-05")
+
+    def test_tool_output_settings_are_part_of_the_key(self):
+        cache = ResponseCache(MemoryCacheBackend())
+        call = ("get_fundamentals", "yfinance", get_fundamentals, ("AAPL", "2024-01-05"), {})
+        config = {"tool_output": {"format": "csv", "precision": None}}
+
+        with patch("tradingagents.dataflows.response_cache.get_config", return_value=config):
+            csv_key, _ = cache.make_key(*call)
+            config["tool_output"] = {"format": "compact", "precision": 2}
+            compact_key, _ = cache.make_key(*call)
+
+        self.assertNotEqual(csv_key, compact_key)
+
+    def test_hits_and_misses_are_counted_per_method(self):
+        cache = ResponseCache(MemoryCacheBackend())
+        key, as_of = cache.make_key("get_fundamentals", "yfinance", get_fundamentals, ("AAPL", "2024-01-05"), {})
+
+        self.assertIs(cache.get("get_fundamentals", key), MISS)
+        cache.set("get_fundamentals", "fundamental_data", key, as_of, "report")
+        self.assertEqual(cache.get("get_fundamentals", key), "report")
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["by_method"]["get_fundamentals"], {"hits": 1, "misses": 1})
+
+    def test_expired_entries_are_misses(self):
+        cache = ResponseCache(MemoryCacheBackend(), ttls={"news_data": 60})
+        cache.set("get_global_news", "news_data", "k", "2024-01-05", "news")
+
+        with patch("tradingagents.dataflows.response_cache.time.time", return_value=datetime.now().timestamp() + 120):
+            self.assertIs(cache.get("get_global_news", "k"), MISS)
+
+    def test_same_day_responses_expire_at_end_of_day(self):
+        backend = MemoryCacheBackend()
+        cache = ResponseCache(backend, ttls={"news_data": 30 * 24 * 3600})
+        cache.set("get_global_news", "news_data", "k", datetime.now().strftime("%Y-%m-%d"), "news")
+
+        expires_at, _ = backend.get("k")
+        tomorrow = datetime.now().date() + timedelta(days=1)
+        self.assertLessEqual(expires_at, datetime(tomorrow.year, tomorrow.month, tomorrow.day).timestamp())
+
+    def test_disk_backend_survives_restarts(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ResponseCache(DiskCacheBackend(tmp)).set("get_global_news", "news_data", "abc123", "2024-01-05", "news")
+            self.assertEqual(ResponseCache(DiskCacheBackend(tmp)).get("get_global_news", "abc123"), "news")
+
+
+    def test_disk_sweep_drops_expired_and_enforces_size(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = DiskCacheBackend(tmp, max_bytes=None)
+            now = datetime.now().timestamp()
+            backend.set("aa01", now - 10, "expired")
+            backend.set("aa02", now + 100, "x" * 1000)
+            backend.set("aa03", now + 200, "y" * 1000)
+
+            backend.max_bytes = 1500
+            backend.sweep()
+
+            self.assertIsNone(backend.get("aa01"))
+            self.assertIsNone(backend.get("aa02"))  # Closest to expiry goes first
+            self.assertEqual(backend.get("aa03")[1], "y" * 1000)
+
+    def test_empty_vendor_answers_are_not_cached(self):
+        calls = []
+
+        def get_news(ticker, start_date, end_date):
+            calls.append(ticker)
+            return f"No news found for {ticker}"
+
+        cache = ResponseCache(MemoryCacheBackend())
+        with patch.dict(interface.VENDOR_METHODS, {"get_news": {"yfinance": get_news}}), \
+                patch.object(interface, "get_response_cache", return_value=cache):
+            for _ in range(2):
+                interface.route_to_vendor("get_news", "AAPL", "2024-01-01", "2024-01-05")
+
+        self.assertEqual(calls, ["AAPL", "AAPL"])
+
+
+if __name__ == "__main__":
+    unittest.main()
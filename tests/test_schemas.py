@@ -0,0 +1,147 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from benchmarks.fake_llm import FakeChatModel
+from tradingagents.agents.managers.research_manager import create_research_manager
+from tradingagents.agents.trader.trader import create_trader
+from tradingagents.agents.utils.schemas import (
+    KeyLevels,
+    TradeDecision,
+    render_decision,
+    unpack_response,
+)
+from tradingagents.graph.signal_processing import parse_rating
+
+
+class NoMemory:
+    def get_memories(self, current_situation, n_matches=1):
+        return []
+
+
+def make_state():
+    return {
+        "company_of_interest": "NVDA",
+        "market_report": "Uptrend.",
+        "sentiment_report": "Upbeat.",
+        "news_report": "Quiet.",
+        "fundamentals_report": "Solid.",
+        "investment_plan": "Buy on dips.",
+        "investment_debate_state": {
+            "history": "Bull: buy. Bear: wait.",
+            "bull_history": "Bull: buy.",
+            "bear_history": "Bear: wait.",
+            "count": 2,
+        },
+    }
+
+
+def make_decision(**overrides):
+    fields = dict(
+        rating="OVERWEIGHT",
+        conviction="medium",
+        time_horizon="1-3 months",
+        key_levels=KeyLevels(entry=101.5, stop_loss=95.0),
+        summary="Add on pullbacks toward the entry level.",
+        analysis="## Thesis\nMargins keep expanding.",
+    )
+    fields.update(overrides)
+    return TradeDecision(**fields)
+
+
+class TradeDecisionTests(unittest.TestCase):
+    def test_rendered_text_parses_to_the_same_rating(self):
+        text = render_decision(make_decision())
+
+        self.assertIn("**Key Levels**: entry 101.5, stop-loss 95", text)
+        self.assertTrue(text.endswith("## Thesis\nMargins keep expanding."))
+        self.assertEqual(parse_rating(text), "OVERWEIGHT")
+
+    def test_key_levels_line_omitted_when_empty(self):
+        text = render_decision(make_decision(key_levels=KeyLevels()))
+        self.assertNotIn("Key Levels", text)
+
+    def test_unpack_response(self):
+        text, structured = unpack_response(make_decision(rating="SELL"))
+        self.assertEqual(structured["rating"], "SELL")
+        self.assertEqual(structured["key_levels"]["stop_loss"], 95.0)
+        self.assertIn("**Rating**: Sell", text)
+
+        self.assertEqual(
+            unpack_response(SimpleNamespace(content="free text")), ("free text", None)
+        )
+
+    def test_unpack_structured_output_with_raw(self):
+        raw = AIMessage(content="**Rating**: Buy")
+        parsed = make_decision()
+
+        self.assertEqual(
+            unpack_response({"raw": raw, "parsed": parsed, "parsing_error": None}),
+            unpack_response(parsed),
+        )
+        self.assertEqual(
+            unpack_response({"raw": raw, "parsed": None, "parsing_error": None}),
+            ("**Rating**: Buy", None),
+        )
+
+    def test_invalid_rating_rejected(self):
+        with self.assertRaises(ValueError):
+            make_decision(rating="STRONG BUY")
+
+
+class StructuredOutputFallbackTests(unittest.TestCase):
+    def test_plain_text_answer_falls_back_to_parsing(self):
+        # tool_rounds=0: the model answers in text instead of calling the schema tool
+        llm = FakeChatModel(tool_rounds=0, reply_tokens=20)
+        trader = create_trader(llm, NoMemory(), structured_output=True)
+
+        update = trader.invoke(make_state())
+
+        self.assertNotIn("structured_trader_plan", update)
+        self.assertEqual(update["messages"][0].content, update["trader_investment_plan"])
+        self.assertEqual(parse_rating(update["trader_investment_plan"]), "HOLD")
+
+    def test_invalid_tool_arguments_ask_again_for_text(self):
+        # The fake calls the schema tool without any of its required fields
+        llm = FakeChatModel(tool_rounds=1, reply_tokens=20)
+        manager = create_research_manager(llm, NoMemory(), structured_output=True)
+
+        with self.assertLogs("tradingagents.agents.utils.schemas", level="WARNING"):
+            update = manager.invoke(make_state())
+
+        self.assertNotIn("structured_investment_plan", update)
+        self.assertTrue(update["investment_plan"])
+        self.assertEqual(parse_rating(update["investment_plan"]), "HOLD")
+
+    def test_empty_retry_raises(self):
+        llm = FakeChatModel(tool_rounds=1, reply_tokens=20)
+        manager = create_research_manager(llm, NoMemory(), structured_output=True)
+
+        with patch.object(FakeChatModel, "_reply", return_value=""), \
+                self.assertLogs("tradingagents.agents.utils.schemas", level="WARNING"), \
+                self.assertRaises(ValueError):
+            manager.invoke(make_state())
+
+    def test_trader_proposal_uses_three_levels(self):
+        decision = make_decision(rating="UNDERWEIGHT")
+        llm = RunnableLambda(lambda prompt: {"raw": AIMessage(content=""), "parsed": decision})
+
+        with patch("tradingagents.agents.trader.trader.with_decision_output", return_value=llm):
+            update = create_trader(llm, NoMemory(), structured_output=True).invoke(make_state())
+
+        self.assertTrue(
+            update["trader_investment_plan"].endswith("FINAL TRANSACTION PROPOSAL: **SELL**")
+        )
+        self.assertEqual(update["structured_trader_plan"]["rating"], "UNDERWEIGHT")
+
+    def test_content_blocks_are_joined(self):
+        message = AIMessage(content=[{"type": "text", "text": "**Rating**: Sell"}])
+
+        self.assertEqual(unpack_response(message), ("**Rating**: Sell", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+from types import SimpleNamespace
+
+from tradingagents.graph.signal_processing import SignalProcessor, parse_rating
+
+
+class FakeLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return SimpleNamespace(content="HOLD")
+
+
+class ParseRatingTests(unittest.TestCase):
+    def test_portfolio_manager_formats(self):
+        self.assertEqual(parse_rating("1. **Rating**: **Overweight**\n2. **Executive Summary**: ..."), "OVERWEIGHT")
+        self.assertEqual(parse_rating("**Rating:** Sell\n\nExit the position."), "SELL")
+        self.assertEqual(parse_rating("Rating - underweight"), "UNDERWEIGHT")
+
+    def test_trader_proposal(self):
+        self.assertEqual(parse_rating("... FINAL TRANSACTION PROPOSAL: **BUY**"), "BUY")
+
+    def test_ambiguous_or_missing_ratings(self):
+        self.assertIsNone(parse_rating("Rating: Hold or Buy depending on earnings"))
+        self.assertIsNone(parse_rating("**Rating**: Buy\n...\nRevised rating: Sell"))
+        self.assertIsNone(parse_rating("We should buy more shares."))
+
+
+class SignalProcessorTests(unittest.TestCase):
+    def test_llm_is_only_called_on_fallback(self):
+        llm = FakeLLM()
+        processor = SignalProcessor(llm)
+
+        self.assertEqual(processor.process_signal("**Rating**: Buy"), "BUY")
+        self.assertEqual(processor.process_signal("Mixed signals, stay patient."), "HOLD")
+
+        self.assertEqual(llm.calls, 1)
+        self.assertEqual(processor.get_stats(), {"parsed": 1, "llm_fallbacks": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from tradingagents.dataflows.ticker_registry import TickerRegistry, get_ticker, ticker_registry
+
+
+class TickerRegistryTests(unittest.TestCase):
+    def setUp(self):
+        patcher = patch(
+            "tradingagents.dataflows.ticker_registry.yf.Ticker",
+            side_effect=lambda symbol: object(),
+        )
+        self.ticker_cls = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_one_ticker_per_symbol_within_a_run(self):
+        with ticker_registry(max_size=4):
+            first = get_ticker("aapl")
+            self.assertIs(get_ticker("AAPL"), first)
+            with ticker_registry():
+                self.assertIs(get_ticker("AAPL"), first)
+        self.assertIsNot(get_ticker("AAPL"), first)
+        self.assertEqual(self.ticker_cls.call_count, 2)
+
+    def test_evicts_least_recently_used(self):
+        registry = TickerRegistry(max_size=2)
+        aapl = registry.get("AAPL")
+        registry.get("MSFT")
+        registry.get("AAPL")
+        registry.get("NVDA")
+
+        self.assertEqual(len(registry), 2)
+        self.assertIs(registry.get("AAPL"), aapl)
+        self.assertEqual(self.ticker_cls.call_count, 3)
+
+    def test_concurrent_lookups_share_one_ticker(self):
+        registry = TickerRegistry()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get("AAPL")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(ticker) for ticker in results}), 1)
+        self.assertEqual(self.ticker_cls.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
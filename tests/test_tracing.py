@@ -0,0 +1,101 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+from uuid import uuid4
+
+from tradingagents.graph.tracing import RunTracer
+
+
+def llm_result(tokens_in, tokens_out, cache_hit=False):
+    message = SimpleNamespace(
+        usage_metadata={"input_tokens": tokens_in, "output_tokens": tokens_out},
+        response_metadata={"model_name": "deep-model"},
+    )
+    generation = SimpleNamespace(
+        message=message, generation_info={"cache_hit": True} if cache_hit else None
+    )
+    return SimpleNamespace(generations=[[generation]])
+
+
+class RunTracerTests(unittest.TestCase):
+    def run_graph(self, tracer):
+        root, node, llm, tool = uuid4(), uuid4(), uuid4(), uuid4()
+        now = time.time_ns()
+        tracer.on_chain_start(
+            {}, {}, run_id=root, name="LangGraph",
+            metadata={"ticker": "NVDA", "trade_date": "2025-01-02", "queued_at_ns": now - 5_000_000},
+        )
+        tracer.on_chain_start(
+            {}, {}, run_id=node, parent_run_id=root, name="Market Analyst",
+            metadata={"langgraph_node": "Market Analyst"},
+        )
+        tracer.on_chat_model_start(
+            {}, [[]], run_id=llm, parent_run_id=node, metadata={"ls_model_name": "deep-model"}
+        )
+        tracer.on_llm_end(llm_result(100, 20), run_id=llm)
+        tracer.on_tool_start({"name": "get_stock_data"}, "", run_id=tool, parent_run_id=node)
+        tracer.on_custom_event(
+            "vendor_call",
+            {
+                "method": "get_stock_data", "vendor": "yfinance", "cache_hit": False,
+                "rate_limited_vendors": [], "start_ns": now, "call_ns": now + 1_000_000,
+                "end_ns": now + 3_000_000, "error": None,
+            },
+            run_id=tool,
+        )
+        tracer.on_tool_end("data", run_id=tool)
+        tracer.on_chain_end({}, run_id=node)
+        tracer.on_chain_end({}, run_id=root)
+
+    def test_summary_attributes_calls_to_nodes(self):
+        tracer = RunTracer(pricing={"deep-model": {"input": 1.0, "output": 10.0}})
+        self.run_graph(tracer)
+
+        summary = tracer.summaries[0]
+        self.assertEqual((summary["ticker"], summary["trade_date"]), ("NVDA", "2025-01-02"))
+        self.assertGreaterEqual(summary["queue_ms"], 5.0)
+        node = summary["nodes"]["Market Analyst"]
+        self.assertEqual((node["llm_calls"], node["tokens_in"], node["tool_calls"]), (1, 100, 1))
+        vendor = summary["vendors"]["get_stock_data/yfinance"]
+        self.assertEqual(vendor["calls"], 1)
+        self.assertAlmostEqual(vendor["queue_ms"], 1.0)
+        self.assertAlmostEqual(vendor["wall_ms"], 3.0)
+        self.assertAlmostEqual(summary["cost_usd"], (100 * 1.0 + 20 * 10.0) / 1e6)
+
+    def test_writes_jsonl_and_otlp(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tracer = RunTracer(directory=tmp)
+            self.run_graph(tracer)
+
+            with open(os.path.join(tmp, "events.jsonl")) as f:
+                spans = [json.loads(line) for line in f]
+            self.assertEqual(
+                sorted(span["kind"] for span in spans), ["llm", "node", "run", "tool", "vendor"]
+            )
+            with open(os.path.join(tmp, "spans.otlp.jsonl")) as f:
+                request = json.loads(f.readline())
+            otlp_spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+            self.assertEqual(len({span["traceId"] for span in otlp_spans}), 1)
+            self.assertEqual(sum("parentSpanId" not in span for span in otlp_spans), 1)
+            self.assertTrue(os.path.exists(os.path.join(tmp, "summaries.jsonl")))
+
+    def test_ignores_runs_outside_a_traced_graph(self):
+        tracer = RunTracer()
+        tracer.on_tool_start({"name": "get_news"}, "", run_id=uuid4(), parent_run_id=uuid4())
+        tracer.on_custom_event("vendor_call", {}, run_id=uuid4())
+        self.assertEqual(list(tracer.summaries), [])
+
+    def test_keeps_only_the_newest_summaries(self):
+        tracer = RunTracer(max_summaries=2)
+        for i in range(3):
+            tracer.summaries.append({"run": i})
+
+        self.assertEqual([s["run"] for s in tracer.drain_summaries()], [1, 2])
+        self.assertEqual(list(tracer.summaries), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
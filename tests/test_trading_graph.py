@@ -0,0 +1,245 @@
+import asyncio
+import copy
+import os
+import tempfile
+import threading
+import time
+import unittest
+from typing import Any
+from unittest.mock import patch
+
+from benchmarks.fake_llm import FakeChatModel
+from benchmarks.fixtures import serve_fixtures
+from tradingagents.default_config import DEFAULT_CONFIG
+from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+TRADE_DATE = "2024-03-28"
+
+
+class CountingChatModel(FakeChatModel):
+    """FakeChatModel that records every prompt and can fail a prompt once."""
+
+    script: Any = None  # Shared by the quick and deep models of a test
+
+    def _respond(self, messages, tools):
+        prompt = "\n".join(str(m.content) for m in messages)
+        delay_on = self.script.get("delay_on")
+        if delay_on and delay_on in prompt:
+            time.sleep(0.05)
+        with self.script["lock"]:
+            self.script["prompts"].append(prompt)
+            fail_on = self.script.get("fail_on")
+            if fail_on and fail_on in prompt:
+                self.script["fail_on"] = None
+                raise RuntimeError("provider outage")
+        return super()._respond(messages, tools)
+
+
+class FakeClient:
+    def __init__(self, script, model):
+        self.llm = CountingChatModel(model=model, script=script)
+
+    def get_llm(self):
+        return self.llm
+
+
+class GraphTestCase(unittest.TestCase):
+    analysts = ("market", "news")
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        fixtures = serve_fixtures({})
+        fixtures.__enter__()
+        self.addCleanup(fixtures.__exit__, None, None, None)
+        self.script = {"prompts": [], "lock": threading.Lock()}
+
+    def make_config(self, **overrides):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config.update({
+            "results_dir": os.path.join(self.tmp.name, "results"),
+            "data_cache_dir": os.path.join(self.tmp.name, "cache"),
+            "memory_dir": None,
+            "max_debate_rounds": 1,
+            "max_risk_discuss_rounds": 1,
+            "data_vendors": {category: "yfinance" for category in config["data_vendors"]},
+            "tool_vendors": {},
+        })
+        config["response_cache"] = {**config["response_cache"], "enabled": False}
+        config["tracing"] = {**config["tracing"], "enabled": False}
+        config.update(overrides)
+        return config
+
+    def make_graph(self, **overrides):
+        def fake_client(provider, model, base_url=None, **kwargs):
+            return FakeClient(self.script, model)
+
+        with patch("tradingagents.graph.trading_graph.create_llm_client", fake_client):
+            return TradingAgentsGraph(list(self.analysts), config=self.make_config(**overrides))
+
+
+class CheckpointResumeTests(GraphTestCase):
+    def test_failed_run_resumes_after_completed_nodes(self):
+        full_run = self.make_graph()
+        _, full_decision = full_run.propagate("NVDA", TRADE_DATE)
+        full_calls = len(self.script["prompts"])
+        self.script["prompts"].clear()
+
+        graph = self.make_graph(checkpoint_db=os.path.join(self.tmp.name, "checkpoints.db"))
+        self.script["fail_on"] = "You are a trading agent"
+        with self.assertRaises(RuntimeError):
+            graph.propagate("NVDA", TRADE_DATE)
+        failed_calls = len(self.script["prompts"])
+        self.script["prompts"].clear()
+
+        final_state, decision = graph.propagate("NVDA", TRADE_DATE)
+        resumed_calls = len(self.script["prompts"])
+
+        self.assertEqual(decision, full_decision)
+        self.assertTrue(final_state["market_report"])
+        # Only the failed Trader node and what follows it run again
+        self.assertEqual(resumed_calls, full_calls - failed_calls + 1)
+        self.assertTrue(any("You are a trading agent" in p for p in self.script["prompts"]))
+        self.assertFalse(any("Bull Analyst" in p for p in self.script["prompts"]))
+
+        # The finished run's thread is deleted
+        thread_id = graph.propagator.get_thread_id("NVDA", TRADE_DATE)
+        config = graph.propagator.get_graph_args(thread_id=thread_id)["config"]
+        self.assertFalse(graph.graph.get_state(config).values)
+
+
+class ParallelAnalystTests(GraphTestCase):
+    analysts = ("market", "news", "fundamentals")
+
+    # Text from each analyst's tool results (see benchmarks.fixtures)
+    TOOL_OUTPUTS = {
+        "market": "# Stock data for FIXT",
+        "news": "## Global News",
+        "fundamentals": "## Balance Sheet",
+    }
+
+    def test_analysts_join_before_debate_with_private_histories(self):
+        graph = self.make_graph(parallel_analysts=True)
+        state = graph.propagator.create_initial_state("NVDA", TRADE_DATE)
+        args = graph.propagator.get_graph_args()
+
+        args["stream_mode"] = ["updates", "values"]
+
+        order, final_state = [], None
+        for mode, chunk in graph.graph.stream(state, **args):
+            if mode == "updates":
+                order.extend(chunk)
+            else:
+                final_state = chunk
+
+        analyst_names = [f"{a.capitalize()} Analyst" for a in self.analysts]
+        self.assertCountEqual(order[:len(analyst_names)], analyst_names)
+        self.assertEqual(order[len(analyst_names)], "Bull Researcher")
+
+        for key in ("market_report", "news_report", "fundamentals_report"):
+            self.assertIn("FINAL TRANSACTION PROPOSAL", final_state[key])
+        self.assertEqual(final_state["sentiment_report"], "")
+
+        # No analyst ever sees another analyst's tool results
+        for analyst, marker in self.TOOL_OUTPUTS.items():
+            seen = [p for p in self.script["prompts"] if marker in p]
+            self.assertTrue(seen)
+            others = [m for a, m in self.TOOL_OUTPUTS.items() if a != analyst]
+            for prompt in seen:
+                if "Bull Analyst" in prompt or "Bear Analyst" in prompt:
+                    continue
+                for other in others:
+                    self.assertNotIn(other, prompt)
+        # Nor do their tool-calling turns reach the parent state
+        self.assertFalse(any(getattr(m, "tool_calls", None) for m in final_state["messages"]))
+        self.assertFalse(any(m.type == "tool" for m in final_state["messages"]))
+
+
+class PropagateManyTests(GraphTestCase):
+    analysts = ("market",)
+
+    def test_yields_in_completion_order(self):
+        graph = self.make_graph()
+        self.script["delay_on"] = "SLOW"
+
+        results = list(graph.propagate_many([("SLOW", TRADE_DATE), ("FAST", TRADE_DATE)], max_workers=2))
+
+        self.assertEqual([ticker for ticker, _, _, _ in results], ["FAST", "SLOW"])
+        for ticker, trade_date, final_state, decision in results:
+            self.assertEqual(final_state["company_of_interest"], ticker)
+            self.assertEqual(decision, "HOLD")
+
+    def test_return_exceptions(self):
+        graph = self.make_graph()
+        jobs = [("BAD", TRADE_DATE), ("GOOD", TRADE_DATE)]
+
+        self.script["fail_on"] = "BAD"
+        results = {r[0]: r for r in graph.propagate_many(jobs, max_workers=2, return_exceptions=True)}
+        self.assertIsInstance(results["BAD"][2], RuntimeError)
+        self.assertIsNone(results["BAD"][3])
+        self.assertEqual(results["GOOD"][3], "HOLD")
+
+        self.script["fail_on"] = "BAD"
+        with self.assertRaises(RuntimeError):
+            list(graph.propagate_many(jobs, max_workers=2))
+
+    def test_runs_do_not_share_instance_state(self):
+        graph = self.make_graph()
+
+        results = list(graph.propagate_many([("AAA", TRADE_DATE), ("BBB", TRADE_DATE)], max_workers=2))
+
+        self.assertIsNone(graph.curr_state)
+        self.assertIsNone(graph.ticker)
+        self.assertEqual(graph.log_states_dict, {})
+        self.assertCountEqual([r[2]["company_of_interest"] for r in results], ["AAA", "BBB"])
+        for ticker in ("AAA", "BBB"):
+            log_path = os.path.join(
+                self.tmp.name, "results", ticker, "TradingAgentsStrategy_logs",
+                f"full_states_log_{TRADE_DATE}.json",
+            )
+            self.assertTrue(os.path.exists(log_path))
+
+    def test_prefetch_failures_are_logged(self):
+        graph = self.make_graph()
+
+        with patch(
+            "tradingagents.graph.trading_graph.prefetch_ohlcv", side_effect=OSError("offline")
+        ), self.assertLogs("tradingagents.graph.trading_graph", "WARNING") as logs:
+            list(graph.propagate_many([("AAA", TRADE_DATE), ("BBB", TRADE_DATE)]))
+
+        self.assertIn("OHLCV prefetch failed", logs.output[0])
+
+
+class AsyncPropagateTests(GraphTestCase):
+    analysts = ("market", "news")
+
+    def test_apropagate_uses_async_model_calls(self):
+        graph = self.make_graph()
+
+        async def run_both():
+            return await asyncio.gather(
+                graph.apropagate("AAA", TRADE_DATE), graph.apropagate("BBB", TRADE_DATE)
+            )
+
+        with patch.object(CountingChatModel, "_generate", side_effect=AssertionError("sync call")):
+            results = asyncio.run(run_both())
+
+        for ticker, (final_state, decision) in zip(["AAA", "BBB"], results):
+            self.assertEqual(final_state["company_of_interest"], ticker)
+            self.assertTrue(final_state["news_report"])
+            self.assertEqual(decision, "HOLD")
+        self.assertIsNone(graph.curr_state)
+
+    def test_checkpointed_runs_fall_back_to_a_worker_thread(self):
+        graph = self.make_graph(checkpoint_db=os.path.join(self.tmp.name, "checkpoints.db"))
+
+        with patch.object(graph, "_run_graph", wraps=graph._run_graph) as run_graph:
+            final_state, decision = asyncio.run(graph.apropagate("AAA", TRADE_DATE))
+
+        run_graph.assert_called_once_with("AAA", TRADE_DATE)
+        self.assertEqual(final_state["company_of_interest"], "AAA")
+        self.assertEqual(decision, "HOLD")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from tradingagents.dataflows import yfinance_news
+
+
+def make_search(query, news_count, enable_fuzzy_query):
+    return SimpleNamespace(
+        news=[
+            {"title": f"{query} {i}", "publisher": "Wire", "link": f"https://example.com/{i}"}
+            for i in range(news_count)
+        ]
+    )
+
+
+class GlobalNewsStoreTests(unittest.TestCase):
+    def setUp(self):
+        yfinance_news._global_news_store.clear()
+        yfinance_news._global_news_locks.clear()
+
+    @patch("tradingagents.dataflows.yfinance_news.yf.Search", side_effect=make_search)
+    def test_searches_once_for_many_tickers(self, search):
+        self.assertEqual(yfinance_news.prefetch_global_news(limit=5), 5)
+
+        first = yfinance_news.get_global_news_yfinance("2024-01-05", 7, 5)
+        second = yfinance_news.get_global_news_yfinance("2024-01-08", 7, 5)
+
+        search.assert_called_once()
+        self.assertIn("from 2023-12-29 to 2024-01-05", first)
+        self.assertIn("### stock market economy 0 (source: Wire)", second)
+
+    @patch("tradingagents.dataflows.yfinance_news.yf.Search", side_effect=make_search)
+    def test_results_are_stored_per_limit(self, search):
+        yfinance_news.fetch_global_news_articles(limit=5)
+        articles = yfinance_news.fetch_global_news_articles(limit=10)
+
+        self.assertEqual(search.call_count, 2)
+        self.assertEqual(len(articles), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,27 +1,23 @@
-from tradingagents.agents.utils.agent_utils import build_instrument_context, get_language_instruction
+from tradingagents.agents.utils.agent_utils import (
+    build_instrument_context,
+    create_llm_node,
+    get_language_instruction,
+    recall_memories,
+)
+from tradingagents.agents.utils.schemas import unpack_response, with_decision_output
 
 
-def create_portfolio_manager(llm, memory):
-    def portfolio_manager_node(state) -> dict:
+def create_portfolio_manager(llm, memory, context_budget=None, structured_output=False):
+    if structured_output:
+        llm = with_decision_output(llm)
 
+    def build_input(state, past_memory_str):
         instrument_context = build_instrument_context(state["company_of_interest"])
 
         history = state["risk_debate_state"]["history"]
-        risk_debate_state = state["risk_debate_state"]
-        market_research_report = state["market_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
-        sentiment_report = state["sentiment_report"]
         research_plan = state["investment_plan"]
         trader_plan = state["trader_investment_plan"]
 
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
-
-        past_memory_str = ""
-        for i, rec in enumerate(past_memories, 1):
-            past_memory_str += rec["recommendation"] + "\n\n"
-
         prompt = f"""As the Portfolio Manager, synthesize the risk analysts' debate and deliver the final trading decision.
 
 {instrument_context}
@@ -54,10 +50,14 @@ def create_portfolio_manager(llm, memory):
 
 Be decisive and ground every conclusion in specific evidence from the analysts.{get_language_instruction()}"""
 
-        response = llm.invoke(prompt)
+        return prompt
+
+    def finalize(state, response):
+        risk_debate_state = state["risk_debate_state"]
+        content, structured = unpack_response(response)
 
         new_risk_debate_state = {
-            "judge_decision": response.content,
+            "judge_decision": content,
             "history": risk_debate_state["history"],
             "aggressive_history": risk_debate_state["aggressive_history"],
             "conservative_history": risk_debate_state["conservative_history"],
@@ -69,9 +69,21 @@ Be decisive and ground every conclusion in specific evidence from the analysts.{
             "count": risk_debate_state["count"],
         }
 
-        return {
+        update = {
             "risk_debate_state": new_risk_debate_state,
-            "final_trade_decision": response.content,
+            "final_trade_decision": content,
         }
-
-    return portfolio_manager_node
+        if structured is not None:
+            update["structured_final_decision"] = structured
+        return update
+
+    # The prompt only carries the plans and the debate, so only its history is budgeted
+    return create_llm_node(
+        build_input,
+        llm,
+        finalize,
+        context_budget=context_budget,
+        agent="portfolio_manager",
+        recall=recall_memories(memory),
+        budget_reports=False,
+    )
@@ -1,24 +1,18 @@
+from tradingagents.agents.utils.agent_utils import (
+    build_instrument_context,
+    create_llm_node,
+    recall_memories,
+)
+from tradingagents.agents.utils.schemas import unpack_response, with_decision_output
 
-from tradingagents.agents.utils.agent_utils import build_instrument_context
 
+def create_research_manager(llm, memory, context_budget=None, structured_output=False):
+    if structured_output:
+        llm = with_decision_output(llm)
 
-def create_research_manager(llm, memory):
-    def research_manager_node(state) -> dict:
+    def build_input(state, past_memory_str):
         instrument_context = build_instrument_context(state["company_of_interest"])
         history = state["investment_debate_state"].get("history", "")
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
-
-        investment_debate_state = state["investment_debate_state"]
-
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
-
-        past_memory_str = ""
-        for i, rec in enumerate(past_memories, 1):
-            past_memory_str += rec["recommendation"] + "\n\n"
 
         prompt = f"""As the portfolio manager and debate facilitator, your role is to critically evaluate this round of debate and make a definitive decision: align with the bear analyst, the bull analyst, or choose Hold only if it is strongly justified based on the arguments presented.
 
@@ -39,20 +33,36 @@ Here are your past reflections on mistakes:
 Here is the debate:
 Debate History:
 {history}"""
-        response = llm.invoke(prompt)
+        return prompt
+
+    def finalize(state, response):
+        investment_debate_state = state["investment_debate_state"]
+        content, structured = unpack_response(response)
 
         new_investment_debate_state = {
-            "judge_decision": response.content,
+            "judge_decision": content,
             "history": investment_debate_state.get("history", ""),
             "bear_history": investment_debate_state.get("bear_history", ""),
             "bull_history": investment_debate_state.get("bull_history", ""),
-            "current_response": response.content,
+            "current_response": content,
             "count": investment_debate_state["count"],
         }
 
-        return {
+        update = {
             "investment_debate_state": new_investment_debate_state,
-            "investment_plan": response.content,
+            "investment_plan": content,
         }
-
-    return research_manager_node
+        if structured is not None:
+            update["structured_investment_plan"] = structured
+        return update
+
+    # The prompt only carries the debate, so only its history is budgeted
+    return create_llm_node(
+        build_input,
+        llm,
+        finalize,
+        context_budget=context_budget,
+        agent="research_manager",
+        recall=recall_memories(memory),
+        budget_reports=False,
+    )
@@ -1,10 +1,10 @@
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
-def create_aggressive_debator(llm):
-    def aggressive_node(state) -> dict:
+def create_aggressive_debator(llm, context_budget=None):
+    def build_input(state):
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
-        aggressive_history = risk_debate_state.get("aggressive_history", "")
 
         current_conservative_response = risk_debate_state.get("current_conservative_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
@@ -30,7 +30,12 @@ Here is the current conversation history: {history} Here are the last arguments
 
 Engage actively by addressing any specific concerns raised, refuting the weaknesses in their logic, and asserting the benefits of risk-taking to outpace market norms. Maintain a focus on debating and persuading, not just presenting data. Challenge each counterpoint to underscore why a high-risk approach is optimal. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        return prompt
+
+    def finalize(state, response):
+        risk_debate_state = state["risk_debate_state"]
+        history = risk_debate_state.get("history", "")
+        aggressive_history = risk_debate_state.get("aggressive_history", "")
 
         argument = f"Aggressive Analyst: {response.content}"
 
@@ -50,4 +55,6 @@ Engage actively by addressing any specific concerns raised, refuting the weaknes
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return aggressive_node
+    return create_llm_node(
+        build_input, llm, finalize, context_budget=context_budget, agent="aggressive_debator"
+    )
@@ -1,10 +1,10 @@
+from tradingagents.agents.utils.agent_utils import create_llm_node
 
 
-def create_conservative_debator(llm):
-    def conservative_node(state) -> dict:
+def create_conservative_debator(llm, context_budget=None):
+    def build_input(state):
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
-        conservative_history = risk_debate_state.get("conservative_history", "")
 
         current_aggressive_response = risk_debate_state.get("current_aggressive_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
@@ -30,7 +30,12 @@ Here is the current conversation history: {history} Here is the last response fr
 
 Engage by questioning their optimism and emphasizing the potential downsides they may have overlooked. Address each of their counterpoints to showcase why a conservative stance is ultimately the safest path for the firm's assets. Focus on debating and critiquing their arguments to demonstrate the strength of a low-risk strategy over their approaches. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        return prompt
+
+    def finalize(state, response):
+        risk_debate_state = state["risk_debate_state"]
+        history = risk_debate_state.get("history", "")
+        conservative_history = risk_debate_state.get("conservative_history", "")
 
         argument = f"Conservative Analyst: {response.content}"
 
@@ -52,4 +57,6 @@ Engage by questioning their optimism and emphasizing the potential downsides the
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return conservative_node
+    return create_llm_node(
+        build_input, llm, finalize, context_budget=context_budget, agent="conservative_debator"
+    )
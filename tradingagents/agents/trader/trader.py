@@ -1,27 +1,30 @@
-import functools
+from langchain_core.messages import AIMessage
 
-from tradingagents.agents.utils.agent_utils import build_instrument_context
+from tradingagents.agents.utils.agent_utils import (
+    build_instrument_context,
+    create_llm_node,
+    recall_memories,
+)
+from tradingagents.agents.utils.schemas import unpack_response, with_decision_output
 
+# TradeDecision rating -> the trader's three-level transaction proposal
+PROPOSAL_FOR_RATING = {
+    "BUY": "BUY",
+    "OVERWEIGHT": "BUY",
+    "HOLD": "HOLD",
+    "UNDERWEIGHT": "SELL",
+    "SELL": "SELL",
+}
 
-def create_trader(llm, memory):
-    def trader_node(state, name):
+
+def create_trader(llm, memory, structured_output=False):
+    if structured_output:
+        llm = with_decision_output(llm)
+
+    def build_input(state, past_memory_str):
         company_name = state["company_of_interest"]
         instrument_context = build_instrument_context(company_name)
         investment_plan = state["investment_plan"]
-        market_research_report = state["market_report"]
-        sentiment_report = state["sentiment_report"]
-        news_report = state["news_report"]
-        fundamentals_report = state["fundamentals_report"]
-
-        curr_situation = f"{market_research_report}\n\n{sentiment_report}\n\n{news_report}\n\n{fundamentals_report}"
-        past_memories = memory.get_memories(curr_situation, n_matches=2)
-
-        past_memory_str = ""
-        if past_memories:
-            for i, rec in enumerate(past_memories, 1):
-                past_memory_str += rec["recommendation"] + "\n\n"
-        else:
-            past_memory_str = "No past memories found."
 
         context = {
             "role": "user",
@@ -36,12 +39,33 @@ def create_trader(llm, memory):
             context,
         ]
 
-        result = llm.invoke(messages)
+        return messages
+
+    def finalize(state, result):
+        content, structured = unpack_response(result)
+        if structured is None:
+            # A structured call answered in plain text yields a dict, not a message
+            message = AIMessage(content=content) if isinstance(result, dict) else result
+            return {
+                "messages": [message],
+                "trader_investment_plan": content,
+                "sender": "Trader",
+            }
 
+        # Keep the proposal line the free-text prompt asks for, which only
+        # knows BUY/HOLD/SELL
+        proposal = PROPOSAL_FOR_RATING[structured["rating"]]
+        content += f"\n\nFINAL TRANSACTION PROPOSAL: **{proposal}**"
         return {
-            "messages": [result],
-            "trader_investment_plan": result.content,
-            "sender": name,
+            "messages": [AIMessage(content=content)],
+            "trader_investment_plan": content,
+            "structured_trader_plan": structured,
+            "sender": "Trader",
         }
 
-    return functools.partial(trader_node, name="Trader")
+    return create_llm_node(
+        build_input,
+        llm,
+        finalize,
+        recall=recall_memories(memory, empty="No past memories found."),
+    )
@@ -62,11 +62,20 @@ class AgentState(MessagesState):
         InvestDebateState, "Current state of the debate on if to invest or not"
     ]
     investment_plan: Annotated[str, "Plan generated by the Analyst"]
+    structured_investment_plan: Annotated[
+        dict, "Research Manager's TradeDecision fields (structured-output mode)"
+    ]
 
     trader_investment_plan: Annotated[str, "Plan generated by the Trader"]
+    structured_trader_plan: Annotated[
+        dict, "Trader's TradeDecision fields (structured-output mode)"
+    ]
 
     # risk management team discussion step
     risk_debate_state: Annotated[
         RiskDebateState, "Current state of the debate on evaluating risk"
     ]
     final_trade_decision: Annotated[str, "Final decision made by the Risk Analysts"]
+    structured_final_decision: Annotated[
+        dict, "Portfolio Manager's TradeDecision fields (structured-output mode)"
+    ]
@@ -1,4 +1,5 @@
 from langchain_core.messages import HumanMessage, RemoveMessage
+from langchain_core.runnables import RunnableLambda
 
 # Import tools from separate utility files
 from tradingagents.agents.utils.core_stock_tools import (
@@ -18,6 +19,7 @@ from tradingagents.agents.utils.news_data_tools import (
     get_insider_transactions,
     get_global_news
 )
+from tradingagents.agents.utils.context_budget import REPORT_KEYS
 
 
 def get_language_instruction() -> str:
@@ -42,6 +44,77 @@ def build_instrument_context(ticker: str) -> str:
         "preserving any exchange suffix (e.g. `.TO`, `.L`, `.HK`, `.T`)."
     )
 
+def recall_memories(memory, n_matches=2, empty=""):
+    """Return a ``recall(state)`` for ``create_llm_node`` that looks up past lessons.
+
+    Memories are stored keyed on the full analyst reports, so the lookup
+    must run on the full state rather than a budgeted view. ``empty`` is
+    returned when nothing is stored yet.
+    """
+
+    def recall(state):
+        curr_situation = "\n\n".join(state[key] for key in REPORT_KEYS)
+        past_memories = memory.get_memories(curr_situation, n_matches=n_matches)
+        if not past_memories:
+            return empty
+        return "".join(rec["recommendation"] + "\n\n" for rec in past_memories)
+
+    return recall
+
+
+def create_llm_node(
+    build_input,
+    llm,
+    finalize,
+    context_budget=None,
+    agent=None,
+    recall=None,
+    budget_reports=True,
+):
+    """Build a graph node that runs under both ``invoke`` and ``ainvoke``.
+
+    Args:
+        build_input: ``build_input(state)`` returns the input for ``llm``;
+            with ``recall`` it is called as ``build_input(state, recalled)``
+        llm: Chat model or runnable chain to call
+        finalize: ``finalize(state, response)`` returns the state update
+        context_budget: Optional ContextBudget; ``build_input`` then receives
+            a view of the state with reports and debate history compacted
+            to the agent's budget, while ``finalize`` sees the full state
+        agent: Name used to look up per-agent budget overrides
+        recall: Optional ``recall(state)``, e.g. from ``recall_memories``,
+            run on the full state before budgeting
+        budget_reports: Whether the budget digests the analyst reports;
+            turn off for agents whose prompt does not include them
+
+    The sync path calls ``llm.invoke``; the async path awaits ``llm.ainvoke``
+    directly on the event loop instead of handing the node to a worker thread.
+    """
+
+    def prompt(view, state):
+        if recall is None:
+            return build_input(view)
+        return build_input(view, recall(state))
+
+    def node(state):
+        view = (
+            context_budget.apply(state, agent, reports=budget_reports)
+            if context_budget
+            else state
+        )
+        return finalize(state, llm.invoke(prompt(view, state)))
+
+    async def anode(state):
+        view = (
+            await context_budget.aapply(state, agent, reports=budget_reports)
+            if context_budget
+            else state
+        )
+        return finalize(state, await llm.ainvoke(prompt(view, state)))
+
+    return RunnableLambda(node, afunc=anode)
+
+
 def create_msg_delete():
     def delete_messages(state):
         """Clear messages and add placeholder for Anthropic compatibility"""
@@ -56,6 +129,3 @@ def create_msg_delete():
         return {"messages": removal_operations + [placeholder]}
 
     return delete_messages
-
-
-        
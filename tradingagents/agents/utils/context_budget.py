@@ -0,0 +1,277 @@
+"""Token budgets for the reports and debate history fed to debate agents.
+
+Researchers, risk debators and managers otherwise paste all four analyst
+reports and the whole debate transcript into every prompt, so input size
+grows with each debate round. ``ContextBudget`` builds a compacted view of
+the state for one agent: reports over budget are replaced with LLM digests,
+and the debate history keeps its latest turns verbatim while older turns
+are folded into a rolling summary. Digests and summaries are cached by
+content, so each report is digested once per budget and each new debate
+round only summarizes the turns that just fell out of the window.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+REPORT_KEYS = ("market_report", "sentiment_report", "news_report", "fundamentals_report")
+DEBATE_KEYS = ("investment_debate_state", "risk_debate_state")
+
+REPORT_NAMES = {
+    "market_report": "market research report",
+    "sentiment_report": "social media sentiment report",
+    "news_report": "world affairs news report",
+    "fundamentals_report": "company fundamentals report",
+}
+
+# Debate turns are appended as "\n<Speaker> Analyst: <argument>"
+_TURN_SPLIT = re.compile(
+    r"\n(?=(?:Bull|Bear|Aggressive|Conservative|Neutral) Analyst: )"
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+
+class ContextBudget:
+    """Compacts reports and debate history to per-agent token budgets."""
+
+    def __init__(
+        self,
+        llm,
+        report_tokens: int = 1500,
+        history_tokens: int = 3000,
+        agents: Optional[Dict[str, Dict[str, int]]] = None,
+        max_entries: int = 512,
+    ):
+        """Initialize the budget.
+
+        Args:
+            llm: Chat model used to write digests and summaries
+            report_tokens: Default budget for each analyst report
+            history_tokens: Default budget for the debate history
+            agents: Per-agent overrides, e.g.
+                ``{"portfolio_manager": {"history_tokens": 6000}}``
+            max_entries: Number of digests and summaries kept in memory
+        """
+        self.llm = llm
+        self.report_tokens = report_tokens
+        self.history_tokens = history_tokens
+        self.agents = agents or {}
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def limits(self, agent: Optional[str]) -> Tuple[int, int]:
+        """Return (report_tokens, history_tokens) for an agent."""
+        overrides = self.agents.get(agent, {}) if agent else {}
+        return (
+            overrides.get("report_tokens", self.report_tokens),
+            overrides.get("history_tokens", self.history_tokens),
+        )
+
+    def _cache_key(self, kind: str, text: str, max_tokens: int) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{kind}:{max_tokens}:{digest}"
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key: str, value: str) -> str:
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _digest_prompt(name: str, text: str, max_tokens: int) -> str:
+        return f"""Condense the following {name} into at most {max_tokens * 3 // 4} words for traders debating a position. Keep every figure, date, price level, indicator reading, rating and risk a trading decision could depend on. Drop repetition, boilerplate and formatting that carries no information.
+
+{text}"""
+
+    @staticmethod
+    def _summary_prompt(summary: str, turns: List[str], max_tokens: int) -> str:
+        earlier = f"Summary of the debate so far:\n{summary}\n\n" if summary else ""
+        new_turns = "\n".join(turns)
+        return f"""{earlier}Further debate turns:
+{new_turns}
+
+Write an updated summary of the debate in at most {max_tokens * 3 // 4} words. Attribute each argument to its speaker, keep the key evidence and figures cited, and note which points were rebutted."""
+
+    # Reports
+
+    def _pending_digests(self, state, report_tokens):
+        """Split reports into ready values and prompts that still need the LLM."""
+        ready, pending = {}, []
+        for key in REPORT_KEYS:
+            text = state.get(key) or ""
+            if estimate_tokens(text) <= report_tokens:
+                continue
+            cache_key = self._cache_key("report", text, report_tokens)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                ready[key] = cached
+            else:
+                prompt = self._digest_prompt(REPORT_NAMES[key], text, report_tokens)
+                pending.append((key, cache_key, text, prompt))
+        return ready, pending
+
+    def _store_digests(self, ready, pending, responses):
+        for (key, cache_key, text, _), response in zip(pending, responses):
+            digest = response.content
+            # Keep the original if the model failed to shorten it
+            if len(digest) >= len(text):
+                digest = text
+            ready[key] = self._cache_put(cache_key, digest)
+        return ready
+
+    def digest_reports(self, state, report_tokens: int) -> Dict[str, str]:
+        """Return digests for the reports in ``state`` that exceed the budget."""
+        ready, pending = self._pending_digests(state, report_tokens)
+        if pending:
+            responses = self.llm.batch([p[3] for p in pending])
+            ready = self._store_digests(ready, pending, responses)
+        return ready
+
+    async def adigest_reports(self, state, report_tokens: int) -> Dict[str, str]:
+        """Async variant of digest_reports."""
+        ready, pending = self._pending_digests(state, report_tokens)
+        if pending:
+            responses = await self.llm.abatch([p[3] for p in pending])
+            ready = self._store_digests(ready, pending, responses)
+        return ready
+
+    # Debate history
+
+    def _plan_history(self, history: str, max_tokens: int):
+        """Work out which turns stay verbatim and which must be summarized.
+
+        Returns None if the history fits, otherwise (recent turns, summary of
+        the longest already-summarized prefix, turns still to summarize, cache
+        key for the full older part, summary budget).
+        """
+        if estimate_tokens(history) <= max_tokens:
+            return None
+
+        turns = [t for t in _TURN_SPLIT.split(history) if t.strip()]
+
+        # Keep the most recent turns verbatim within half the budget
+        recent_budget = max_tokens // 2
+        split = len(turns)
+        used = 0
+        while split > 0:
+            cost = estimate_tokens(turns[split - 1])
+            if split < len(turns) and used + cost > recent_budget:
+                break
+            used += cost
+            split -= 1
+        older, recent = turns[:split], turns[split:]
+        if not older:
+            return None
+
+        # A fixed summary budget keeps keys stable across rounds
+        summary_budget = max_tokens - recent_budget
+        key = self._cache_key("history", "\n".join(older), summary_budget)
+
+        # Extend the longest previously summarized prefix instead of
+        # re-summarizing turns from earlier rounds
+        base, start = "", 0
+        for end in range(len(older), 0, -1):
+            cached = self._cache_get(
+                self._cache_key("history", "\n".join(older[:end]), summary_budget)
+            )
+            if cached is not None:
+                base, start = cached, end
+                break
+        return recent, base, older[start:], key, summary_budget
+
+    @staticmethod
+    def _join_history(summary: str, recent: List[str]) -> str:
+        return "\n".join([f"[Summary of earlier debate turns]\n{summary}", *recent])
+
+    def compact_history(self, history: str, max_tokens: int) -> str:
+        """Return ``history`` compacted to roughly ``max_tokens``."""
+        plan = self._plan_history(history, max_tokens)
+        if plan is None:
+            return history
+        recent, summary, pending, key, summary_budget = plan
+        if pending:
+            prompt = self._summary_prompt(summary, pending, summary_budget)
+            summary = self._cache_put(key, self.llm.invoke(prompt).content)
+        return self._join_history(summary, recent)
+
+    async def acompact_history(self, history: str, max_tokens: int) -> str:
+        """Async variant of compact_history."""
+        plan = self._plan_history(history, max_tokens)
+        if plan is None:
+            return history
+        recent, summary, pending, key, summary_budget = plan
+        if pending:
+            prompt = self._summary_prompt(summary, pending, summary_budget)
+            summary = self._cache_put(key, (await self.llm.ainvoke(prompt)).content)
+        return self._join_history(summary, recent)
+
+    # State views
+
+    @staticmethod
+    def _build_view(state, digests, histories) -> Dict[str, Any]:
+        view = dict(state)
+        view.update(digests)
+        for key, history in histories.items():
+            view[key] = {**state[key], "history": history}
+        return view
+
+    def apply(
+        self, state, agent: Optional[str] = None, reports: bool = True
+    ) -> Dict[str, Any]:
+        """Return a copy of ``state`` with reports and debate history within
+        the agent's budget. The original state is not modified.
+
+        With ``reports=False`` the reports are left as they are and only the
+        debate history is compacted.
+        """
+        report_tokens, history_tokens = self.limits(agent)
+        digests = self.digest_reports(state, report_tokens) if reports else {}
+        histories = {
+            key: self.compact_history(state[key]["history"], history_tokens)
+            for key in DEBATE_KEYS
+            if state.get(key) and state[key].get("history")
+        }
+        return self._build_view(state, digests, histories)
+
+    async def aapply(
+        self, state, agent: Optional[str] = None, reports: bool = True
+    ) -> Dict[str, Any]:
+        """Async variant of apply."""
+        report_tokens, history_tokens = self.limits(agent)
+        digests = await self.adigest_reports(state, report_tokens) if reports else {}
+        histories = {}
+        for key in DEBATE_KEYS:
+            if state.get(key) and state[key].get("history"):
+                histories[key] = await self.acompact_history(
+                    state[key]["history"], history_tokens
+                )
+        return self._build_view(state, digests, histories)
+
+
+def create_context_budget(llm, config: Dict[str, Any]) -> Optional[ContextBudget]:
+    """Build a ContextBudget from the ``context_budget`` config, or None if disabled."""
+    settings = config.get("context_budget") or {}
+    if not settings.get("enabled", False):
+        return None
+    return ContextBudget(
+        llm,
+        report_tokens=settings.get("report_tokens", 1500),
+        history_tokens=settings.get("history_tokens", 3000),
+        agents=settings.get("agents"),
+    )
@@ -4,25 +4,51 @@ Uses BM25 (Best Matching 25) algorithm for retrieval - no API calls,
 no token limits, works offline with any LLM provider.
 """
 
-from rank_bm25 import BM25Okapi
-from typing import List, Tuple
+import heapq
+import math
 import re
+import threading
+from collections import Counter
+from typing import Dict, List, Tuple
+
+from tradingagents.agents.utils.memory_store import MemoryLog
+
+# BM25 parameters (same defaults as rank_bm25.BM25Okapi)
+K1 = 1.5
+B = 0.75
 
 
 class FinancialSituationMemory:
-    """Memory system for storing and retrieving financial situations using BM25."""
+    """Memory system for storing and retrieving financial situations using BM25.
+
+    Documents are kept in an inverted index (term -> {doc id: term count})
+    that is updated in place on insert, so adding a situation only tokenizes
+    that situation, and a query only visits documents sharing a term with it.
+
+    If ``memory_dir`` is configured, situations are also appended to a
+    MemoryLog there. The index is then rebuilt lazily from the stored term
+    counts on first use, situation texts are read from disk only when
+    returned as matches, and records appended by other processes are picked
+    up before each query.
+    """
 
     def __init__(self, name: str, config: dict = None):
         """Initialize the memory system.
 
         Args:
             name: Name identifier for this memory instance
-            config: Configuration dict (kept for API compatibility, not used for BM25)
+            config: Configuration dict; ``memory_dir`` enables on-disk storage
         """
         self.name = name
+        memory_dir = (config or {}).get("memory_dir")
+        self.log = MemoryLog(memory_dir, name) if memory_dir else None
         self.documents: List[str] = []
         self.recommendations: List[str] = []
-        self.bm25 = None
+        self.term_counts: List[Dict[str, int]] = []  # cached per-document tokens
+        self.doc_lengths: List[int] = []
+        self.postings: Dict[str, Dict[int, int]] = {}
+        self.total_length = 0
+        self._lock = threading.Lock()
 
     def _tokenize(self, text: str) -> List[str]:
         """Tokenize text for BM25 indexing.
@@ -33,13 +59,32 @@ class FinancialSituationMemory:
         tokens = re.findall(r'\b\w+\b', text.lower())
         return tokens
 
-    def _rebuild_index(self):
-        """Rebuild the BM25 index after adding documents."""
-        if self.documents:
-            tokenized_docs = [self._tokenize(doc) for doc in self.documents]
-            self.bm25 = BM25Okapi(tokenized_docs)
-        else:
-            self.bm25 = None
+    def _index_document(self, term_counts: Dict[str, int], length: int):
+        """Add one tokenized document to the inverted index."""
+        doc_id = len(self.term_counts)
+        self.term_counts.append(term_counts)
+        self.doc_lengths.append(length)
+        self.total_length += length
+        for term, count in term_counts.items():
+            self.postings.setdefault(term, {})[doc_id] = count
+
+    def _sync(self) -> int:
+        """Index records appended to the log since the last sync.
+
+        The caller must hold ``self._lock``. Returns the number of stored
+        documents.
+        """
+        if self.log is not None:
+            for record in self.log.read(len(self.term_counts)):
+                self._index_document(record["terms"], record["length"])
+        return len(self.term_counts)
+
+    def _document(self, idx: int) -> Tuple[str, str]:
+        """Return (situation, recommendation) for a document id."""
+        if self.log is not None:
+            record = self.log.get(idx)
+            return record["situation"], record["recommendation"]
+        return self.documents[idx], self.recommendations[idx]
 
     def add_situations(self, situations_and_advice: List[Tuple[str, str]]):
         """Add financial situations and their corresponding advice.
@@ -47,12 +92,49 @@ class FinancialSituationMemory:
         Args:
             situations_and_advice: List of tuples (situation, recommendation)
         """
+        records = []
         for situation, recommendation in situations_and_advice:
-            self.documents.append(situation)
-            self.recommendations.append(recommendation)
+            tokens = self._tokenize(situation)
+            records.append({
+                "situation": situation,
+                "recommendation": recommendation,
+                "terms": dict(Counter(tokens)),
+                "length": len(tokens),
+            })
 
-        # Rebuild BM25 index with new documents
-        self._rebuild_index()
+        if self.log is not None:
+            self.log.append(records)
+            with self._lock:
+                self._sync()
+            return
+
+        with self._lock:
+            for record in records:
+                self.documents.append(record["situation"])
+                self.recommendations.append(record["recommendation"])
+                self._index_document(record["terms"], record["length"])
+
+    def _idf(self, term: str) -> float:
+        """Non-negative BM25 idf, so terms in most documents never lower a score."""
+        n = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.term_counts) - n + 0.5) / (n + 0.5))
+
+    def _scores(self, query_tokens: List[str]) -> Dict[int, float]:
+        """BM25 scores of every document that shares a term with the query.
+
+        The caller must hold ``self._lock``.
+        """
+        avg_length = self.total_length / len(self.term_counts) or 1.0
+        scores: Dict[int, float] = {}
+        for term, query_count in Counter(query_tokens).items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            weight = self._idf(term) * query_count
+            for doc_id, tf in postings.items():
+                norm = K1 * (1 - B + B * self.doc_lengths[doc_id] / avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * tf * (K1 + 1) / (tf + norm)
+        return scores
 
     def get_memories(self, current_situation: str, n_matches: int = 1) -> List[dict]:
         """Find matching recommendations using BM25 similarity.
@@ -64,38 +146,60 @@ class FinancialSituationMemory:
         Returns:
             List of dicts with matched_situation, recommendation, and similarity_score
         """
-        if not self.documents or self.bm25 is None:
-            return []
-
-        # Tokenize query
         query_tokens = self._tokenize(current_situation)
-
-        # Get BM25 scores for all documents
-        scores = self.bm25.get_scores(query_tokens)
-
-        # Get top-n indices sorted by score (descending)
-        top_indices = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)[:n_matches]
+        # Syncs and inserts update the index in place, so pick up other
+        # processes' records and score in one critical section
+        with self._lock:
+            num_documents = self._sync()
+            if not num_documents:
+                return []
+            scores = self._scores(query_tokens)
+
+        # Partial sort for the top-n; ties keep insertion order
+        top_indices = [
+            idx
+            for idx, _ in heapq.nlargest(
+                n_matches, scores.items(), key=lambda item: (item[1], -item[0])
+            )
+        ]
+
+        # Fill up with non-matching documents, as a full ranking would
+        if len(top_indices) < n_matches:
+            for idx in range(num_documents):
+                if len(top_indices) >= n_matches:
+                    break
+                if idx not in scores:
+                    top_indices.append(idx)
 
         # Build results
         results = []
-        max_score = float(scores.max()) if len(scores) > 0 and scores.max() > 0 else 1.0
+        max_score = max(scores.values(), default=0.0)
+        if max_score <= 0:
+            max_score = 1.0
 
         for idx in top_indices:
             # Normalize score to 0-1 range for consistency
-            normalized_score = scores[idx] / max_score if max_score > 0 else 0
+            normalized_score = scores.get(idx, 0.0) / max_score
+            situation, recommendation = self._document(idx)
             results.append({
-                "matched_situation": self.documents[idx],
-                "recommendation": self.recommendations[idx],
+                "matched_situation": situation,
+                "recommendation": recommendation,
                 "similarity_score": normalized_score,
             })
 
         return results
 
     def clear(self):
-        """Clear all stored memories."""
-        self.documents = []
-        self.recommendations = []
-        self.bm25 = None
+        """Clear all stored memories, including any on-disk log."""
+        with self._lock:
+            if self.log is not None:
+                self.log.clear()
+            self.documents = []
+            self.recommendations = []
+            self.term_counts = []
+            self.doc_lengths = []
+            self.postings = {}
+            self.total_length = 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+"""Append-only on-disk storage for FinancialSituationMemory.
+
+Each memory is stored as two files under the memory directory:
+
+- ``{name}.jsonl``: one JSON record per situation, holding the situation,
+  the recommendation and its cached term counts, so loading never needs
+  to re-tokenize.
+- ``{name}.idx``: fixed-width ``(offset, length)`` int64 pairs, one per
+  record, memory-mapped to fetch a record without scanning the log.
+
+Writes only ever append to both files, and readers pick up records that
+other processes appended by checking the index size.
+"""
+
+import json
+import os
+import threading
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are serialized within the process only
+    fcntl = None
+
+INDEX_DTYPE = np.dtype([("offset", "<i8"), ("length", "<i8")])
+
+
+class MemoryLog:
+    """Durable record log for one named memory."""
+
+    def __init__(self, directory: str, name: str):
+        self.log_path = os.path.join(directory, f"{name}.jsonl")
+        self.index_path = os.path.join(directory, f"{name}.idx")
+        self._lock = threading.Lock()
+        self._index = np.empty(0, dtype=INDEX_DTYPE)
+        os.makedirs(directory, exist_ok=True)
+
+    def count(self) -> int:
+        """Number of complete records in the log."""
+        try:
+            return os.path.getsize(self.index_path) // INDEX_DTYPE.itemsize
+        except OSError:
+            return 0
+
+    def _index_entries(self) -> np.ndarray:
+        """Memory-map the index, remapping only when records were added."""
+        count = self.count()
+        if count != len(self._index):
+            self._index = (
+                np.memmap(self.index_path, dtype=INDEX_DTYPE, mode="r", shape=(count,))
+                if count
+                else np.empty(0, dtype=INDEX_DTYPE)
+            )
+        return self._index
+
+    def append(self, records: List[Dict]) -> None:
+        """Append records to the log and their positions to the index."""
+        lines = [(json.dumps(r, ensure_ascii=False) + "\n").encode("utf-8") for r in records]
+        with self._lock, open(self.log_path, "ab") as log, open(self.index_path, "ab") as index:
+            if fcntl is not None:
+                fcntl.flock(log.fileno(), fcntl.LOCK_EX)
+            try:
+                offset = log.seek(0, os.SEEK_END)
+                entries = np.empty(len(lines), dtype=INDEX_DTYPE)
+                for i, line in enumerate(lines):
+                    entries[i] = (offset, len(line))
+                    offset += len(line)
+                log.write(b"".join(lines))
+                log.flush()
+                # The index is written last, so a record is only visible once complete
+                index.write(entries.tobytes())
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(log.fileno(), fcntl.LOCK_UN)
+
+    def get(self, position: int) -> Dict:
+        """Read the record at ``position``."""
+        offset, length = self._index_entries()[position]
+        with open(self.log_path, "rb") as f:
+            f.seek(int(offset))
+            return json.loads(f.read(int(length)))
+
+    def read(self, start: int = 0) -> Iterator[Dict]:
+        """Yield records from ``start`` to the end of the index."""
+        entries = self._index_entries()
+        if start >= len(entries):
+            return
+        with open(self.log_path, "rb") as f:
+            # Seek per record: an interrupted append may leave unindexed bytes
+            for offset, length in entries[start:]:
+                f.seek(int(offset))
+                yield json.loads(f.read(int(length)))
+
+    def clear(self) -> None:
+        """Delete the log and index files."""
+        with self._lock:
+            self._index = np.empty(0, dtype=INDEX_DTYPE)
+            for path in (self.index_path, self.log_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
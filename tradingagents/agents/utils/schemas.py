@@ -0,0 +1,124 @@
+"""Typed decision schemas for the structured-output mode.
+
+With ``structured_output`` enabled, the Research Manager, Trader and
+Portfolio Manager call their model through ``with_structured_output`` and
+return a TradeDecision instead of free text. The nodes still write a
+rendered text version to the usual report fields, so existing consumers
+keep working, and store the fields themselves in AgentState. A model that
+answers in plain text instead is treated as in free-text mode, and its
+rating is parsed from the text; if it produced no usable decision at all
+(e.g. schema arguments that fail validation), it is asked again without
+the schema.
+"""
+
+import logging
+from typing import Any, Dict, Literal, Optional, Tuple
+
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel, Field
+
+from tradingagents.llm_clients.base_client import normalize_content
+
+logger = logging.getLogger(__name__)
+
+Rating = Literal["BUY", "OVERWEIGHT", "HOLD", "UNDERWEIGHT", "SELL"]
+
+
+class KeyLevels(BaseModel):
+    """Price levels the decision depends on."""
+
+    entry: Optional[float] = Field(None, description="Suggested entry price")
+    stop_loss: Optional[float] = Field(None, description="Price at which to exit to cap losses")
+    take_profit: Optional[float] = Field(None, description="Price target for taking profits")
+
+
+class TradeDecision(BaseModel):
+    """A trading decision with its supporting analysis."""
+
+    rating: Rating = Field(description="Exactly one of BUY, OVERWEIGHT, HOLD, UNDERWEIGHT, SELL")
+    conviction: Literal["low", "medium", "high"] = Field(
+        description="Confidence in the rating"
+    )
+    time_horizon: str = Field(description="Expected holding period, e.g. '1-3 months'")
+    key_levels: KeyLevels = Field(description="Entry, stop-loss and take-profit levels, where applicable")
+    summary: str = Field(description="Two or three sentence action plan")
+    analysis: str = Field(
+        description="The full written analysis in markdown, following the requested structure"
+    )
+
+
+def render_decision(decision: TradeDecision) -> str:
+    """Render a TradeDecision as the markdown text the free-text mode produces."""
+    levels = [
+        f"{label} {value:g}"
+        for label, value in (
+            ("entry", decision.key_levels.entry),
+            ("stop-loss", decision.key_levels.stop_loss),
+            ("take-profit", decision.key_levels.take_profit),
+        )
+        if value is not None
+    ]
+    lines = [
+        f"**Rating**: {decision.rating.capitalize()}",
+        f"**Conviction**: {decision.conviction.capitalize()}",
+        f"**Time Horizon**: {decision.time_horizon}",
+    ]
+    if levels:
+        lines.append(f"**Key Levels**: {', '.join(levels)}")
+    lines.append(f"**Executive Summary**: {decision.summary}")
+    return "\n".join(lines) + f"\n\n{decision.analysis}"
+
+
+def unpack_response(response: Any) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Return (text, structured fields) for a chat message or TradeDecision.
+
+    Also accepts the ``{"raw", "parsed", ...}`` result of
+    ``with_structured_output(..., include_raw=True)``, falling back to the
+    raw message's text when nothing was parsed.
+    """
+    if isinstance(response, dict):
+        response = response["parsed"] if response.get("parsed") is not None else response["raw"]
+    if isinstance(response, TradeDecision):
+        return render_decision(response), response.model_dump()
+    # Some providers return content as a list of typed blocks
+    return normalize_content(response).content, None
+
+
+def with_decision_output(llm: Any) -> RunnableLambda:
+    """Wrap ``llm`` to answer with a TradeDecision where it can.
+
+    Returns the ``include_raw`` result of ``with_structured_output``, for
+    ``unpack_response``. When nothing was parsed and the raw message has no
+    text either, the prompt is sent again to the plain ``llm`` and its
+    free-text message is returned instead.
+
+    Raises:
+        ValueError: If the free-text retry comes back empty as well
+    """
+    structured = llm.with_structured_output(TradeDecision, include_raw=True)
+
+    def needs_retry(result):
+        if result["parsed"] is not None:
+            return False
+        if not unpack_response(result["raw"])[0].strip():
+            logger.warning(
+                f"No TradeDecision parsed ({result.get('parsing_error')!r}) and no text "
+                "returned; asking again without the schema"
+            )
+            return True
+        return False
+
+    def checked(message):
+        if not unpack_response(message)[0].strip():
+            raise ValueError("Model returned neither a TradeDecision nor a text decision")
+        return message
+
+    def decide(prompt, config):
+        result = structured.invoke(prompt, config)
+        return checked(llm.invoke(prompt, config)) if needs_retry(result) else result
+
+    async def adecide(prompt, config):
+        result = await structured.ainvoke(prompt, config)
+        return checked(await llm.ainvoke(prompt, config)) if needs_retry(result) else result
+
+    return RunnableLambda(decide, afunc=adecide)
@@ -1,12 +1,38 @@
 import os
+import re
+import threading
+import time
 import requests
 import pandas as pd
 import json
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from io import StringIO
+from requests.adapters import HTTPAdapter
+
+from .config import get_config
+from .encoders import get_output_encoder
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+# Wording of Alpha Vantage's quota notices, e.g. "Thank you for using Alpha
+# Vantage! Our standard API rate limit is 25 requests per day."
+_RATE_LIMIT_NOTICE = re.compile(
+    r"rate limit|call frequency|thank you for using alpha vantage", re.IGNORECASE
+)
+# Notices about a missing, invalid or demo API key
+_API_KEY_NOTICE = re.compile(r"\bapi ?key\b", re.IGNORECASE)
+
+# Fallbacks for keys missing from the "alpha_vantage" config
+DEFAULT_SETTINGS = {
+    "requests_per_minute": 5,
+    "burst": None,
+    "timeout": 30,
+    "max_retries": 3,
+    "backoff": 1.0,
+    "pool_size": 10,
+}
+
 def get_api_key() -> str:
     """Retrieve the API key for Alpha Vantage from environment variables."""
     api_key = os.getenv("ALPHA_VANTAGE_API_KEY")
@@ -36,14 +62,130 @@ def format_datetime_for_api(date_input) -> str:
         raise ValueError(f"Date must be string or datetime object, got {type(date_input)}")
 
 class AlphaVantageRateLimitError(Exception):
-    """Exception raised when Alpha Vantage API rate limit is exceeded."""
+    """Exception raised when Alpha Vantage API rate limit is exceeded.
+
+    Also raised when Alpha Vantage rejects the API key, so either way the
+    call falls back to the next vendor.
+    """
     pass
 
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + max(0.0, now - self._updated) * self.rate
+                )
+                self._updated = max(self._updated, now)
+                if self._tokens >= 1 and self._updated <= now:
+                    self._tokens -= 1
+                    return
+                wait = max(self._updated - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Empty the bucket and hand out no tokens for ``seconds``."""
+        with self._lock:
+            self._tokens = 0.0
+            self._updated = max(self._updated, time.monotonic() + seconds)
+
+_client_lock = threading.Lock()
+_session = None
+_limiter = None
+_limiter_settings = None
+
+def _get_settings() -> dict:
+    return {**DEFAULT_SETTINGS, **(get_config().get("alpha_vantage") or {})}
+
+def _get_session(settings: dict) -> requests.Session:
+    """Shared keep-alive session, so parallel runs reuse pooled connections."""
+    global _session
+    with _client_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=settings["pool_size"]
+            )
+            _session.mount("https://", adapter)
+        return _session
+
+def _get_rate_limiter(settings: dict) -> TokenBucket:
+    """Process-wide limiter sized to the configured quota."""
+    global _limiter, _limiter_settings
+    quota = (settings["requests_per_minute"], settings["burst"])
+    with _client_lock:
+        if _limiter is None or quota != _limiter_settings:
+            rate, burst = quota
+            _limiter = TokenBucket(rate / 60.0, burst or rate)
+            _limiter_settings = quota
+        return _limiter
+
+def _rate_limit_message(response_text: str) -> str | None:
+    """Return Alpha Vantage's rate-limit or API key notice, or None for a
+    normal response."""
+    try:
+        response_json = json.loads(response_text)
+    except json.JSONDecodeError:
+        # Response is not JSON (likely CSV data), which is normal
+        return None
+    if not isinstance(response_json, dict):
+        return None
+    for field in ("Information", "Note"):
+        message = response_json.get(field)
+        if isinstance(message, str) and (
+            _RATE_LIMIT_NOTICE.search(message) or _API_KEY_NOTICE.search(message)
+        ):
+            return message
+    return None
+
+def _is_short_window_limit(message: str) -> bool:
+    """Whether waiting clears the limit.
+
+    Per-minute (and per-second burst) limits reset within a run; daily
+    quotas and premium-only endpoints don't.
+    """
+    message = message.lower()
+    return "per minute" in message or "per second" in message
+
+def _retry_after(response) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (seconds or HTTP date)."""
+    value = (getattr(response, "headers", None) or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
 def _make_api_request(function_name: str, params: dict) -> dict | str:
     """Helper function to make API requests and handle responses.
-    
+
+    Requests go through a shared pooled session and a token bucket sized to
+    ``alpha_vantage.requests_per_minute``, so concurrent runs queue for the
+    quota instead of tripping it. Connection errors, timeouts and 5xx
+    responses are retried with exponential backoff. A per-minute rate-limit
+    notice or an HTTP 429 pauses the limiter for every thread (for a 429, as
+    long as its ``Retry-After`` header asks), then retries the request.
+
     Raises:
-        AlphaVantageRateLimitError: When API rate limit is exceeded
+        AlphaVantageRateLimitError: When the API key is rejected, the daily
+            quota is exhausted or the per-minute limit persists after all
+            retries
     """
     # Create a copy of params to avoid modifying the original
     api_params = params.copy()
@@ -62,25 +204,45 @@ def _make_api_request(function_name: str, params: dict) -> dict | str:
     elif "entitlement" in api_params:
         # Remove entitlement if it's None or empty
         api_params.pop("entitlement", None)
-    
-    response = requests.get(API_BASE_URL, params=api_params)
-    response.raise_for_status()
 
-    response_text = response.text
-    
-    # Check if response is JSON (error responses are typically JSON)
-    try:
-        response_json = json.loads(response_text)
-        # Check for rate limit error
-        if "Information" in response_json:
-            info_message = response_json["Information"]
-            if "rate limit" in info_message.lower() or "api key" in info_message.lower():
-                raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {info_message}")
-    except json.JSONDecodeError:
-        # Response is not JSON (likely CSV data), which is normal
-        pass
+    settings = _get_settings()
+    session = _get_session(settings)
+    limiter = _get_rate_limiter(settings)
+    max_retries = settings["max_retries"]
+    # Seconds per request at the quota; per-minute waits grow from here
+    window_step = 60.0 / settings["requests_per_minute"]
+
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            response = session.get(API_BASE_URL, params=api_params, timeout=settings["timeout"])
+            if response.status_code != 429:
+                response.raise_for_status()
+        except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+            status = getattr(e.response, "status_code", None)
+            if attempt == max_retries or (status is not None and status < 500):
+                raise
+            time.sleep(settings["backoff"] * 2 ** attempt)
+            continue
+
+        wait = None
+        if response.status_code == 429:
+            message = "HTTP 429 Too Many Requests"
+            wait = _retry_after(response)
+        else:
+            message = _rate_limit_message(response.text)
+            if message is None:
+                return response.text
 
-    return response_text
+        if _API_KEY_NOTICE.search(message):
+            raise AlphaVantageRateLimitError(f"Alpha Vantage rejected the API key: {message}")
+        short_window = response.status_code == 429 or _is_short_window_limit(message)
+        if attempt == max_retries or not short_window:
+            raise AlphaVantageRateLimitError(f"Alpha Vantage rate limit exceeded: {message}")
+        # Per-minute limit: hold every thread until the window has room again
+        if wait is None:
+            wait = min(60.0, window_step * 2 ** attempt)
+        limiter.pause(wait)
 
 
 
@@ -113,8 +275,8 @@ def _filter_csv_by_date_range(csv_data: str, start_date: str, end_date: str) ->
 
         filtered_df = df[(df[date_col] >= start_dt) & (df[date_col] <= end_dt)]
 
-        # Convert back to CSV string
-        return filtered_df.to_csv(index=False)
+        # Render with the configured tool output encoding
+        return get_output_encoder().table(filtered_df.set_index(date_col))
 
     except Exception as e:
         # If filtering fails, return original data with a warning
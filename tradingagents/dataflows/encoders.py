@@ -0,0 +1,109 @@
+"""Text encodings for tabular tool output.
+
+Tool results make up most of the analysts' input tokens, so the vendor
+functions render their frames through one OutputEncoder configured by
+``tool_output``:
+
+- ``format``: ``"csv"`` (the default ``DataFrame.to_csv`` output) or
+  ``"compact"``, a pipe-separated table with dates shortened to
+  YYYY-MM-DD, integral floats written without decimals and empty cells
+  left blank
+- ``drop_empty``: drop rows and columns with no values, such as the
+  mostly-NaN line items of financial statements
+- ``precision``: decimal places for float values (None keeps them as is)
+- ``collapse_non_trading_days``: in dated value lists such as indicator
+  windows, write each run of non-trading days as one date range
+
+The defaults reproduce the previous output exactly.
+"""
+
+import math
+from typing import Any, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+
+NON_TRADING_DAY = "N/A: Not a trading day (weekend or holiday)"
+
+
+class OutputEncoder:
+    """Renders tables and dated value lists for tool results."""
+
+    def __init__(
+        self,
+        format: str = "csv",
+        drop_empty: bool = False,
+        precision: Optional[int] = None,
+        collapse_non_trading_days: bool = False,
+    ):
+        if format not in ("csv", "compact"):
+            raise ValueError(f"Unsupported tool output format: {format}")
+        self.format = format
+        self.drop_empty = drop_empty
+        self.precision = precision
+        self.collapse_non_trading_days = collapse_non_trading_days
+
+    def _format_value(self, value: Any) -> str:
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            return ""
+        if isinstance(value, pd.Timestamp):
+            if value.tzinfo is not None:
+                value = value.tz_localize(None)
+            return value.strftime("%Y-%m-%d" if value == value.normalize() else "%Y-%m-%d %H:%M")
+        if isinstance(value, (float, np.floating)):
+            if float(value).is_integer():
+                return str(int(value))
+            if self.precision is not None:
+                return f"{value:.{self.precision}f}".rstrip("0").rstrip(".")
+            return repr(float(value))
+        return str(value)
+
+    def table(self, data: pd.DataFrame) -> str:
+        """Render a frame (including its index) as text."""
+        if self.drop_empty:
+            data = data.dropna(how="all").dropna(axis=1, how="all")
+        if self.precision is not None:
+            data = data.round(self.precision)
+        if self.format == "csv":
+            return data.to_csv()
+
+        index_label = data.index.name or ""
+        lines = ["|".join([index_label, *(self._format_value(c) for c in data.columns)])]
+        for label, row in zip(data.index, data.itertuples(index=False, name=None)):
+            lines.append(
+                "|".join([self._format_value(label), *(self._format_value(v) for v in row)])
+            )
+        return "\n".join(lines) + "\n"
+
+    def dated_values(self, dates: Iterable[str], values: Iterable[Any]) -> str:
+        """Render ``date: value`` lines, collapsing non-trading runs if enabled.
+
+        Dates are expected newest first, as in the indicator windows. Float
+        values are rounded to ``precision`` if one is set.
+        """
+        lines: List[str] = []
+        run: List[str] = []
+
+        def flush():
+            if run:
+                span = run[0] if len(run) == 1 else f"{run[-1]} to {run[0]}"
+                lines.append(f"{span}: {NON_TRADING_DAY}\n")
+                run.clear()
+
+        for date, value in zip(dates, values):
+            if self.collapse_non_trading_days and value == NON_TRADING_DAY:
+                run.append(date)
+                continue
+            flush()
+            if self.precision is not None and isinstance(value, (float, np.floating)):
+                value = self._format_value(value)
+            lines.append(f"{date}: {value}\n")
+        flush()
+        return "".join(lines)
+
+
+def get_output_encoder() -> OutputEncoder:
+    """Return an encoder for the current ``tool_output`` config."""
+    return OutputEncoder(**(get_config().get("tool_output") or {}))
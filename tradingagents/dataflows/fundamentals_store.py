@@ -0,0 +1,262 @@
+"""Point-in-time store of yfinance fundamentals.
+
+Each fetched financial statement (and company info) is kept as a snapshot
+stamped with the date it was fetched, in one JSON file per symbol and
+kind under ``data_cache_dir/fundamentals``. A lookup as of a date is
+answered from the newest snapshot fetched on or before that date, or, for
+dates before the first fetch, from the oldest snapshot (which the caller
+still filters by fiscal period). Statements only change when a fiscal
+period closes, so the newest snapshot is refreshed only once a new period
+could have ended by the as-of date, and at most every ``recheck_days``.
+A refresh that returns the same data just extends the snapshot instead
+of adding a new one. Company info holds daily market data, so only its
+newest ``info_snapshots`` snapshots are kept.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import get_config
+from .stockstats_utils import yf_retry
+from .ticker_registry import get_ticker
+
+logger = logging.getLogger(__name__)
+
+# Statement -> frequency -> yf.Ticker attribute
+STATEMENTS = {
+    "balance_sheet": {"quarterly": "quarterly_balance_sheet", "annual": "balance_sheet"},
+    "cashflow": {"quarterly": "quarterly_cashflow", "annual": "cashflow"},
+    "income_statement": {"quarterly": "quarterly_income_stmt", "annual": "income_stmt"},
+}
+
+# Months from one fiscal period end to the next, per frequency
+PERIOD_MONTHS = {"quarterly": 3, "annual": 12}
+
+_DATE_FORMAT = "%Y-%m-%d"
+
+
+def _encode_frame(data: pd.DataFrame) -> Dict[str, Any]:
+    values = data.astype(object).where(data.notna(), None).values.tolist()
+    return {
+        "index": [str(label) for label in data.index],
+        "columns": [pd.Timestamp(c).strftime(_DATE_FORMAT) for c in data.columns],
+        "data": [[v.item() if isinstance(v, np.generic) else v for v in row] for row in values],
+    }
+
+
+def _decode_frame(payload: Dict[str, Any]) -> pd.DataFrame:
+    return pd.DataFrame(
+        payload["data"],
+        index=pd.Index(payload["index"]),
+        columns=pd.to_datetime(payload["columns"]),
+    )
+
+
+def _fetch_statement(symbol: str, attribute: str) -> pd.DataFrame:
+    ticker = get_ticker(symbol)
+    return yf_retry(lambda: getattr(ticker, attribute))
+
+
+def _fetch_info(symbol: str) -> Dict[str, Any]:
+    ticker = get_ticker(symbol)
+    return yf_retry(lambda: ticker.info)
+
+
+class FundamentalsStore:
+    """Dated snapshots of fundamentals for many symbols under one directory."""
+
+    def __init__(self, root_dir: str, recheck_days: int = 1, info_snapshots: int = 30):
+        self.root_dir = root_dir
+        self.recheck_days = recheck_days
+        self.info_snapshots = info_snapshots
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _lock_for(self, path: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def _path(self, symbol: str, kind: str) -> str:
+        safe_symbol = symbol.upper().replace(os.sep, "_").replace("/", "_")
+        return os.path.join(self.root_dir, f"{safe_symbol}.{kind}.json")
+
+    def snapshots(self, symbol: str, kind: str) -> List[Dict[str, Any]]:
+        """Return the stored snapshots, oldest first.
+
+        Each has ``fetched`` and ``checked`` dates (YYYY-MM-DD) and the
+        encoded ``value``.
+        """
+        path = self._path(symbol, kind)
+        if not os.path.exists(path):
+            return []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)["snapshots"]
+        except (OSError, ValueError, KeyError):
+            return []
+
+    def _write(self, symbol: str, kind: str, snapshots: List[Dict[str, Any]]) -> None:
+        path = self._path(symbol, kind)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"symbol": symbol.upper(), "snapshots": snapshots}, f)
+        os.replace(tmp_path, path)
+
+    def _lookup(
+        self,
+        symbol: str,
+        kind: str,
+        as_of: pd.Timestamp,
+        today: pd.Timestamp,
+        fetch: Callable[[], Any],
+        may_have_changed: Callable[[Any, pd.Timestamp], bool],
+        max_snapshots: Optional[int] = None,
+    ) -> Any:
+        """Return the encoded value known as of ``as_of``, refreshing if needed.
+
+        ``fetch`` returns a freshly encoded value (None if there is no
+        data); ``may_have_changed(value, as_of)`` tells whether newer data
+        could exist for ``as_of`` than a snapshot holding ``value``. With
+        ``max_snapshots`` set, older snapshots beyond it are dropped.
+        """
+        with self._lock_for(self._path(symbol, kind)):
+            snapshots = self.snapshots(symbol, kind)
+            if snapshots:
+                # Newest snapshot fetched by as_of, else the oldest one
+                position = 0
+                for i, snapshot in enumerate(snapshots):
+                    if pd.Timestamp(snapshot["fetched"]) <= as_of:
+                        position = i
+                chosen = snapshots[position]
+                if position < len(snapshots) - 1:
+                    # Superseded only after as_of, so still current then
+                    return chosen["value"]
+                checked = pd.Timestamp(chosen["checked"])
+                if checked >= as_of or not may_have_changed(chosen["value"], as_of):
+                    return chosen["value"]
+                if (today - checked).days < self.recheck_days:
+                    return chosen["value"]
+
+            value = fetch()
+            if value is None:
+                return snapshots[-1]["value"] if snapshots else None
+
+            stamp = today.strftime(_DATE_FORMAT)
+            if snapshots and snapshots[-1]["value"] == value:
+                snapshots[-1]["checked"] = stamp
+            else:
+                logger.info(f"Stored new {kind} snapshot for {symbol.upper()}")
+                snapshots.append({"fetched": stamp, "checked": stamp, "value": value})
+                if max_snapshots and len(snapshots) > max_snapshots:
+                    del snapshots[:-max_snapshots]
+            self._write(symbol, kind, snapshots)
+            return value
+
+    def statement(
+        self,
+        symbol: str,
+        statement: str,
+        freq: str = "quarterly",
+        as_of: Optional[str] = None,
+        today: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """Return a financial statement as known on ``as_of`` (default today).
+
+        Columns are fiscal period end dates, as in yfinance; the result may
+        include periods after ``as_of`` and should still be filtered with
+        ``filter_financials_by_date``.
+        """
+        freq = "quarterly" if freq.lower() == "quarterly" else "annual"
+        attribute = STATEMENTS[statement][freq]
+        today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+        as_of = pd.Timestamp(as_of).normalize() if as_of else today
+
+        def fetch():
+            data = _fetch_statement(symbol.upper(), attribute)
+            if data is None or data.empty:
+                return None
+            return _encode_frame(data)
+
+        def next_period_due(value, as_of):
+            if not value["columns"]:
+                return True
+            latest = max(pd.to_datetime(value["columns"]))
+            return latest + pd.DateOffset(months=PERIOD_MONTHS[freq]) <= as_of
+
+        value = self._lookup(
+            symbol, f"{statement}_{freq}", as_of, today, fetch, next_period_due
+        )
+        return _decode_frame(value) if value is not None else pd.DataFrame()
+
+    def info(
+        self,
+        symbol: str,
+        as_of: Optional[str] = None,
+        today: Optional[pd.Timestamp] = None,
+    ) -> Dict[str, Any]:
+        """Return company info (``yf.Ticker.info``) as known on ``as_of``.
+
+        Info holds market data that changes daily, so a snapshot answers
+        only dates up to the day it was last checked, and only the newest
+        ``info_snapshots`` are kept; dates before those get the oldest kept.
+        """
+        today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+        as_of = pd.Timestamp(as_of).normalize() if as_of else today
+
+        def fetch():
+            info = _fetch_info(symbol.upper())
+            # Round-trip through JSON so stored and fresh values compare equal
+            return json.loads(json.dumps(info, default=str)) if info else None
+
+        value = self._lookup(
+            symbol, "info", as_of, today, fetch, lambda value, as_of: True, self.info_snapshots
+        )
+        return value or {}
+
+
+_stores: Dict[str, FundamentalsStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_fundamentals_store() -> Optional[FundamentalsStore]:
+    """Return the shared store, or None if ``fundamentals_store`` is disabled."""
+    config = get_config()
+    settings = config.get("fundamentals_store") or {}
+    if not settings.get("enabled", True):
+        return None
+    root_dir = os.path.join(config["data_cache_dir"], "fundamentals")
+    recheck_days = settings.get("recheck_days", 1)
+    info_snapshots = settings.get("info_snapshots", 30)
+    with _stores_lock:
+        store = _stores.get(root_dir)
+        if (
+            store is None
+            or store.recheck_days != recheck_days
+            or store.info_snapshots != info_snapshots
+        ):
+            store = _stores[root_dir] = FundamentalsStore(root_dir, recheck_days, info_snapshots)
+        return store
+
+
+def load_statement(symbol: str, statement: str, freq: str, curr_date: Optional[str]) -> pd.DataFrame:
+    """Return a statement as known on ``curr_date``, from the store if enabled."""
+    store = get_fundamentals_store()
+    if store is None:
+        freq = "quarterly" if freq.lower() == "quarterly" else "annual"
+        return _fetch_statement(symbol.upper(), STATEMENTS[statement][freq])
+    return store.statement(symbol, statement, freq, as_of=curr_date)
+
+
+def load_info(symbol: str, curr_date: Optional[str]) -> Dict[str, Any]:
+    """Return company info as known on ``curr_date``, from the store if enabled."""
+    store = get_fundamentals_store()
+    if store is None:
+        return _fetch_info(symbol.upper())
+    return store.info(symbol, as_of=curr_date)
@@ -0,0 +1,206 @@
+"""In-process technical indicator engine backed by an LRU cache.
+
+The first request for a (symbol, as-of date) pair loads the price history
+once and computes every supported indicator in a single pass over one
+stockstats frame. Later indicator or window requests for the same pair are
+served from memory until the entry is evicted. A frame is only cached once
+the OHLCV store has been fetched past its as-of date; until then new bars
+may still arrive, so it is recomputed on every request.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from stockstats import wrap
+
+from .config import get_config
+from .ohlcv_store import get_ohlcv_store
+from .stockstats_utils import load_ohlcv
+
+logger = logging.getLogger(__name__)
+
+# Supported indicators and the description appended to each tool result
+INDICATOR_DESCRIPTIONS = {
+    # Moving Averages
+    "close_50_sma": (
+        "50 SMA: A medium-term trend indicator. "
+        "Usage: Identify trend direction and serve as dynamic support/resistance. "
+        "Tips: It lags price; combine with faster indicators for timely signals."
+    ),
+    "close_200_sma": (
+        "200 SMA: A long-term trend benchmark. "
+        "Usage: Confirm overall market trend and identify golden/death cross setups. "
+        "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
+    ),
+    "close_10_ema": (
+        "10 EMA: A responsive short-term average. "
+        "Usage: Capture quick shifts in momentum and potential entry points. "
+        "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
+    ),
+    # MACD Related
+    "macd": (
+        "MACD: Computes momentum via differences of EMAs. "
+        "Usage: Look for crossovers and divergence as signals of trend changes. "
+        "Tips: Confirm with other indicators in low-volatility or sideways markets."
+    ),
+    "macds": (
+        "MACD Signal: An EMA smoothing of the MACD line. "
+        "Usage: Use crossovers with the MACD line to trigger trades. "
+        "Tips: Should be part of a broader strategy to avoid false positives."
+    ),
+    "macdh": (
+        "MACD Histogram: Shows the gap between the MACD line and its signal. "
+        "Usage: Visualize momentum strength and spot divergence early. "
+        "Tips: Can be volatile; complement with additional filters in fast-moving markets."
+    ),
+    # Momentum Indicators
+    "rsi": (
+        "RSI: Measures momentum to flag overbought/oversold conditions. "
+        "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
+        "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
+    ),
+    # Volatility Indicators
+    "boll": (
+        "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
+        "Usage: Acts as a dynamic benchmark for price movement. "
+        "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
+    ),
+    "boll_ub": (
+        "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
+        "Usage: Signals potential overbought conditions and breakout zones. "
+        "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
+    ),
+    "boll_lb": (
+        "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
+        "Usage: Indicates potential oversold conditions. "
+        "Tips: Use additional analysis to avoid false reversal signals."
+    ),
+    "atr": (
+        "ATR: Averages true range to measure volatility. "
+        "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
+        "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
+    ),
+    # Volume-Based Indicators
+    "vwma": (
+        "VWMA: A moving average weighted by volume. "
+        "Usage: Confirm trends by integrating price action with volume data. "
+        "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
+    ),
+    "mfi": (
+        "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
+        "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
+        "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
+    ),
+}
+
+
+class IndicatorEngine:
+    """Computes all supported indicators per (symbol, as-of date) and caches them."""
+
+    def __init__(self, max_entries: int = 64):
+        """Initialize the engine.
+
+        Args:
+            max_entries: Maximum number of (symbol, as-of date) frames kept;
+                the least recently used frame is evicted beyond this.
+        """
+        self.max_entries = max_entries
+        self._frames: "OrderedDict[Tuple[str, str], pd.DataFrame]" = OrderedDict()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _compute(self, symbol: str, curr_date: str) -> pd.DataFrame:
+        data = load_ohlcv(symbol, curr_date)
+        # wrap() renames and re-indexes in place, so capture the dates first
+        dates = pd.DatetimeIndex(data["Date"]).normalize()
+        df = wrap(data)
+
+        columns = {}
+        for indicator in INDICATOR_DESCRIPTIONS:
+            try:
+                columns[indicator] = df[indicator].to_numpy(dtype=float)
+            except Exception as e:
+                logger.warning(f"Could not compute {indicator} for {symbol}: {e}")
+                columns[indicator] = np.full(len(dates), np.nan)
+
+        return pd.DataFrame(columns, index=dates)
+
+    def get_frame(self, symbol: str, curr_date: str) -> pd.DataFrame:
+        """Return all supported indicators for ``symbol`` as of ``curr_date``.
+
+        The frame is indexed by trading date and has one column per
+        indicator. Concurrent callers asking for the same key wait for a
+        single computation instead of repeating it.
+        """
+        as_of = pd.Timestamp(curr_date).normalize()
+        key = (symbol.upper(), as_of.strftime("%Y-%m-%d"))
+
+        with self._lock:
+            if key in self._frames:
+                self._frames.move_to_end(key)
+                self.hits += 1
+                return self._frames[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        try:
+            with key_lock:
+                with self._lock:
+                    if key in self._frames:
+                        self._frames.move_to_end(key)
+                        self.hits += 1
+                        return self._frames[key]
+                    self.misses += 1
+
+                frame = self._compute(symbol, curr_date)
+
+                # Bars are stored up to (excluding) fetched_until, so only a
+                # frame before it is final
+                fetched_until = get_ohlcv_store().fetched_until(symbol.upper())
+                if fetched_until is not None and as_of < fetched_until:
+                    with self._lock:
+                        self._frames[key] = frame
+                        while len(self._frames) > self.max_entries:
+                            self._frames.popitem(last=False)
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+
+        return frame
+
+    def get_indicator(self, symbol: str, indicator: str, curr_date: str) -> pd.Series:
+        """Return one indicator's values up to ``curr_date``, indexed by trading date."""
+        if indicator not in INDICATOR_DESCRIPTIONS:
+            raise ValueError(
+                f"Indicator {indicator} is not supported. Please choose from: {list(INDICATOR_DESCRIPTIONS.keys())}"
+            )
+        return self.get_frame(symbol, curr_date)[indicator]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return cache hit/miss counters and the current number of entries."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._frames)}
+
+    def clear(self) -> None:
+        """Drop all cached frames."""
+        with self._lock:
+            self._frames.clear()
+            self._key_locks.clear()
+
+
+_engine: Optional[IndicatorEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_indicator_engine() -> IndicatorEngine:
+    """Return the process-wide engine sized by the ``indicator_cache_size`` config."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = IndicatorEngine(get_config().get("indicator_cache_size", 64))
+        return _engine
@@ -1,4 +1,8 @@
-from typing import Annotated
+import re
+import time
+from typing import Annotated, List, Optional
+
+from langchain_core.callbacks import dispatch_custom_event
 
 # Import from vendor-specific modules
 from .y_finance import (
@@ -10,7 +14,11 @@ from .y_finance import (
     get_income_statement as get_yfinance_income_statement,
     get_insider_transactions as get_yfinance_insider_transactions,
 )
-from .yfinance_news import get_news_yfinance, get_global_news_yfinance
+from .yfinance_news import (
+    get_news_yfinance,
+    get_global_news_yfinance,
+    prefetch_global_news as prefetch_global_news_yfinance,
+)
 from .alpha_vantage import (
     get_stock as get_alpha_vantage_stock,
     get_indicator as get_alpha_vantage_indicator,
@@ -23,9 +31,14 @@ from .alpha_vantage import (
     get_global_news as get_alpha_vantage_global_news,
 )
 from .alpha_vantage_common import AlphaVantageRateLimitError
+from .ohlcv_store import prefetch_ohlcv as prefetch_ohlcv_yfinance
 
 # Configuration and routing logic
 from .config import get_config
+from .response_cache import MISS, get_response_cache
+
+# Vendor answers meaning "nothing yet", e.g. "No news found for ..."
+_EMPTY_RESULT = re.compile(r"No\b.*\b(?:found|available)\b")
 
 # Tools organized by category
 TOOLS_CATEGORIES = {
@@ -147,6 +160,10 @@ def route_to_vendor(method: str, *args, **kwargs):
         if vendor not in fallback_vendors:
             fallback_vendors.append(vendor)
 
+    cache = get_response_cache()
+    started = time.time_ns()
+    skipped = []
+
     for vendor in fallback_vendors:
         if vendor not in VENDOR_METHODS[method]:
             continue
@@ -154,9 +171,87 @@ def route_to_vendor(method: str, *args, **kwargs):
         vendor_impl = VENDOR_METHODS[method][vendor]
         impl_func = vendor_impl[0] if isinstance(vendor_impl, list) else vendor_impl
 
+        if cache is not None:
+            key, as_of = cache.make_key(method, vendor, impl_func, args, kwargs)
+            cached = cache.get(method, key)
+            if cached is not MISS:
+                _report_vendor_call(method, vendor, started, None, skipped, cache_hit=True)
+                return cached
+
+        called = time.time_ns()
         try:
-            return impl_func(*args, **kwargs)
+            result = impl_func(*args, **kwargs)
         except AlphaVantageRateLimitError:
+            skipped.append(vendor)
             continue  # Only rate limits trigger fallback
+        except Exception as e:
+            _report_vendor_call(method, vendor, started, called, skipped, error=repr(e))
+            raise
+
+        # Vendors report failures as "Error ..." strings; never cache those,
+        # nor "No ... found" answers that may only be transient gaps
+        failed = isinstance(result, str) and result.startswith("Error")
+        empty = isinstance(result, str) and _EMPTY_RESULT.match(result) is not None
+        if cache is not None and not failed and not empty:
+            cache.set(method, category, key, as_of, result)
+        _report_vendor_call(
+            method, vendor, started, called, skipped, error=result[:200] if failed else None
+        )
+        return result
+
+    raise RuntimeError(f"No available vendor for '{method}'")
+
+def _report_vendor_call(
+    method: str,
+    vendor: str,
+    started: int,
+    called: Optional[int],
+    skipped: List[str],
+    cache_hit: bool = False,
+    error: Optional[str] = None,
+) -> None:
+    """Emit a ``vendor_call`` event to the calling tool's callback handlers.
 
-    raise RuntimeError(f"No available vendor for '{method}'")
\ No newline at end of file
+    Outside a graph run there is no parent run to attach it to and the
+    event is dropped.
+    """
+    try:
+        dispatch_custom_event(
+            "vendor_call",
+            {
+                "method": method,
+                "vendor": vendor,
+                "cache_hit": cache_hit,
+                "rate_limited_vendors": list(skipped),
+                "start_ns": started,
+                "call_ns": called,
+                "end_ns": time.time_ns(),
+                "error": error,
+            },
+        )
+    except RuntimeError:
+        pass
+
+def prefetch_global_news(limit: int = 5) -> None:
+    """Fetch today's global news once before a multi-ticker batch.
+
+    Only the yfinance vendor keeps a shared article store; for other
+    vendors this is a no-op and each call goes through route_to_vendor.
+    """
+    vendor_config = get_vendor(get_category_for_method("get_global_news"), "get_global_news")
+    if vendor_config.split(",")[0].strip() == "yfinance":
+        prefetch_global_news_yfinance(limit)
+
+def prefetch_ohlcv(symbols) -> None:
+    """Bulk-download price history for a ticker universe before a batch.
+
+    Fills the yfinance-backed OHLCV store that ``get_stock_data`` and
+    ``get_indicators`` read from, so runs don't fetch prices one symbol at
+    a time. A no-op unless yfinance is the first vendor for either tool.
+    """
+    first_vendors = {
+        get_vendor(get_category_for_method(method), method).split(",")[0].strip()
+        for method in ("get_stock_data", "get_indicators")
+    }
+    if "yfinance" in first_vendors:
+        prefetch_ohlcv_yfinance(symbols)
@@ -0,0 +1,381 @@
+"""Persistent per-symbol OHLCV store backed by memory-mapped record files.
+
+Each symbol gets an append-only binary file of fixed-width daily records
+(``{symbol}.v2.bin``) and a small JSON sidecar (``{symbol}.json``) recording
+the exclusive end date the history has been fetched up to. Reads
+memory-map the record file and slice it by date with a binary search, so
+only the requested rows are materialized. Updates download just the
+trading days missing since the last fetch, independent of "today".
+
+A download that comes back empty still counts as fetched, so symbols
+without data are not downloaded again until the next day. A download
+that fails is logged and recorded in the sidecar, and is only retried
+after ``FAILED_FETCH_RETRY_SECONDS``; until then reads serve whatever
+history is stored.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+from .config import get_config
+from .stockstats_utils import _clean_dataframe, yf_retry
+
+logger = logging.getLogger(__name__)
+
+# One fixed-width record per trading day, sorted by date
+OHLCV_DTYPE = np.dtype(
+    [
+        ("date", "<M8[D]"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<i8"),
+        ("dividends", "<f8"),
+        ("splits", "<f8"),
+    ]
+)
+
+# Record file suffix, bumped whenever OHLCV_DTYPE changes so that files in
+# an older layout are ignored and their history is downloaded again
+RECORD_SUFFIX = ".v2.bin"
+
+# Record field -> DataFrame column, matching yfinance's column names
+_COLUMNS = {
+    "open": "Open",
+    "high": "High",
+    "low": "Low",
+    "close": "Close",
+    "volume": "Volume",
+    "dividends": "Dividends",
+    "splits": "Stock Splits",
+}
+
+# Fields where a gap means zero, as on days without trades or corporate actions
+_ZERO_FILLED = ("volume", "dividends", "splits")
+
+# Years of history fetched when a symbol is first added to the store
+HISTORY_YEARS = 5
+
+# Symbols per multi-symbol yfinance download in update_many
+BULK_CHUNK_SIZE = 100
+
+# Seconds after a failed download before a symbol is downloaded again
+FAILED_FETCH_RETRY_SECONDS = 15 * 60
+
+
+class OHLCVStore:
+    """Date-indexed OHLCV history for many symbols under one directory."""
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _lock_for(self, symbol: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def _path(self, symbol: str, suffix: str) -> str:
+        safe_symbol = symbol.upper().replace(os.sep, "_").replace("/", "_")
+        return os.path.join(self.root_dir, f"{safe_symbol}{suffix}")
+
+    def _read_meta(self, symbol: str) -> Optional[dict]:
+        path = self._path(symbol, ".json")
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(
+        self, symbol: str, end: Optional[pd.Timestamp], failed_at: Optional[float] = None
+    ) -> None:
+        meta = {"symbol": symbol.upper(), "end": end.strftime("%Y-%m-%d") if end else None}
+        if failed_at is not None:
+            meta["failed_at"] = failed_at
+        path = self._path(symbol, ".json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, path)
+
+    def _record_failure(self, symbol: str, error: Exception) -> None:
+        """Log a failed download and stamp it in the sidecar (caller holds the lock)."""
+        logger.warning(f"OHLCV download failed for {symbol}: {error!r}")
+        self._write_meta(symbol, self.fetched_until(symbol), failed_at=time.time())
+
+    def _recently_failed(self, symbol: str) -> bool:
+        failed_at = (self._read_meta(symbol) or {}).get("failed_at")
+        return failed_at is not None and time.time() - failed_at < FAILED_FETCH_RETRY_SECONDS
+
+    def _is_current(self, symbol: str, today: pd.Timestamp) -> bool:
+        """Whether the symbol needs no download before ``today``."""
+        fetched_until = self.fetched_until(symbol)
+        if fetched_until is not None and fetched_until >= today:
+            return True
+        return self._recently_failed(symbol)
+
+    def _records(self, symbol: str) -> np.ndarray:
+        """Memory-map the symbol's records (empty array if none are stored)."""
+        path = self._path(symbol, RECORD_SUFFIX)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=OHLCV_DTYPE)
+        # Ignore a trailing partial record left by an interrupted append
+        count = os.path.getsize(path) // OHLCV_DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=OHLCV_DTYPE)
+        return np.memmap(path, dtype=OHLCV_DTYPE, mode="r", shape=(count,))
+
+    @staticmethod
+    def _to_records(data: pd.DataFrame) -> np.ndarray:
+        data = data.sort_values("Date").drop_duplicates("Date", keep="last")
+        records = np.empty(len(data), dtype=OHLCV_DTYPE)
+        records["date"] = pd.to_datetime(data["Date"]).values.astype("M8[D]")
+        for field, column in _COLUMNS.items():
+            if column not in data.columns:
+                records[field] = 0
+                continue
+            values = data[column]
+            if field in _ZERO_FILLED:
+                values = pd.to_numeric(values, errors="coerce").fillna(0)
+            records[field] = values
+        return records
+
+    def last_date(self, symbol: str) -> Optional[pd.Timestamp]:
+        """Return the date of the newest stored bar, if any."""
+        records = self._records(symbol)
+        if len(records) == 0:
+            return None
+        return pd.Timestamp(records["date"][-1])
+
+    def fetched_until(self, symbol: str) -> Optional[pd.Timestamp]:
+        """Return the exclusive end date the stored history was fetched up to.
+
+        Set even if the download found no bars.
+        """
+        meta = self._read_meta(symbol)
+        if not meta or not meta.get("end"):
+            return None
+        if not os.path.exists(self._path(symbol, RECORD_SUFFIX)):
+            return None  # Stored in an older record layout
+        return pd.Timestamp(meta["end"])
+
+    def read(
+        self,
+        symbol: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Read stored bars with ``start <= Date <= end`` (both optional).
+
+        Returns a DataFrame with Date, Open, High, Low, Close, Volume,
+        Dividends and Stock Splits columns, as from ``Ticker.history``.
+        """
+        records = self._records(symbol)
+        dates = records["date"]
+        lo = 0 if start is None else np.searchsorted(
+            dates, np.datetime64(pd.Timestamp(start).date(), "D"), side="left"
+        )
+        hi = len(records) if end is None else np.searchsorted(
+            dates, np.datetime64(pd.Timestamp(end).date(), "D"), side="right"
+        )
+        window = records[lo:hi]
+
+        # Copy out of the memory map so the file is not held open
+        frame = pd.DataFrame({"Date": pd.to_datetime(window["date"].astype("M8[ns]"))})
+        for field, column in _COLUMNS.items():
+            frame[column] = np.array(window[field])
+        return frame
+
+    def write(self, symbol: str, data: pd.DataFrame, end: pd.Timestamp) -> None:
+        """Replace the symbol's history with ``data`` fetched up to ``end``."""
+        path = self._path(symbol, RECORD_SUFFIX)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._to_records(data).tobytes())
+        os.replace(tmp_path, path)
+        self._write_meta(symbol, end)
+
+    def append(self, symbol: str, data: pd.DataFrame, end: pd.Timestamp) -> None:
+        """Append bars newer than the last stored date, fetched up to ``end``."""
+        last = self.last_date(symbol)
+        if last is not None:
+            data = data[pd.to_datetime(data["Date"]) > last]
+        if not data.empty:
+            with open(self._path(symbol, RECORD_SUFFIX), "ab") as f:
+                f.write(self._to_records(data).tobytes())
+        self._write_meta(symbol, end)
+
+    def update(self, symbol: str, today: Optional[pd.Timestamp] = None) -> None:
+        """Bring the symbol's history up to (but excluding) ``today``.
+
+        The first call downloads ``HISTORY_YEARS`` of history. Later calls
+        download from the last stored bar onwards and append only the new
+        days. Because prices are split/dividend adjusted, a change in the
+        overlapping bar means history was re-adjusted, and the full history
+        is reloaded instead. A failed download is logged, not raised.
+        """
+        today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+
+        with self._lock_for(symbol):
+            if self._is_current(symbol, today):
+                return
+
+            last = self.last_date(symbol)
+            try:
+                if last is None:
+                    self._reload(symbol, today)
+                else:
+                    self._apply_update(symbol, last, _download(symbol, last, today), today)
+            except Exception as e:
+                self._record_failure(symbol, e)
+
+    def _apply_update(
+        self, symbol: str, last: pd.Timestamp, data: pd.DataFrame, today: pd.Timestamp
+    ) -> None:
+        """Append bars downloaded from ``last`` onwards (caller holds the lock)."""
+        if data.empty:
+            self._write_meta(symbol, today)
+            return
+
+        overlap = data[pd.to_datetime(data["Date"]) == last]
+        stored_close = float(self._records(symbol)["close"][-1])
+        if not overlap.empty and not np.isclose(
+            float(overlap["Close"].iloc[0]), stored_close, rtol=1e-6
+        ):
+            logger.info(f"Adjusted prices changed for {symbol}, reloading history")
+            self._reload(symbol, today)
+            return
+
+        self.append(symbol, data, today)
+
+    def update_many(
+        self,
+        symbols: Iterable[str],
+        today: Optional[pd.Timestamp] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> None:
+        """Bring many symbols up to date with chunked multi-symbol downloads.
+
+        Stale symbols are grouped by the date their download has to start
+        from (the last stored bar, or ``HISTORY_YEARS`` back for new
+        symbols), so a universe refreshed together costs one request per
+        ``chunk_size`` symbols instead of one per symbol. Symbols missing
+        from a download are left for ``update`` to fetch on first use.
+        """
+        today = pd.Timestamp(today or pd.Timestamp.today()).normalize()
+        groups: Dict[pd.Timestamp, List[str]] = {}
+        for symbol in dict.fromkeys(s.upper() for s in symbols):
+            if self._is_current(symbol, today):
+                continue
+            last = self.last_date(symbol)
+            start = last if last is not None else today - pd.DateOffset(years=HISTORY_YEARS)
+            groups.setdefault(start, []).append(symbol)
+
+        for start, group in groups.items():
+            for i in range(0, len(group), chunk_size):
+                chunk = group[i:i + chunk_size]
+                try:
+                    frames = _download_many(chunk, start, today)
+                except Exception as e:
+                    for symbol in chunk:
+                        with self._lock_for(symbol):
+                            self._record_failure(symbol, e)
+                    continue
+                for symbol, data in frames.items():
+                    with self._lock_for(symbol):
+                        # Another thread may have updated it meanwhile
+                        if self._is_current(symbol, today):
+                            continue
+                        last = self.last_date(symbol)
+                        try:
+                            if last is None:
+                                self.write(symbol, data, today)
+                            else:
+                                self._apply_update(symbol, last, data, today)
+                        except Exception as e:
+                            self._record_failure(symbol, e)
+
+    def _reload(self, symbol: str, today: pd.Timestamp) -> None:
+        start = today - pd.DateOffset(years=HISTORY_YEARS)
+        self.write(symbol, _download(symbol, start, today), today)
+
+
+def _download(symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Download adjusted daily bars and actions for ``start <= date < end``."""
+    data = yf_retry(lambda: yf.download(
+        symbol,
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        multi_level_index=False,
+        progress=False,
+        auto_adjust=True,
+        actions=True,
+    ))
+    if data is None or data.empty:
+        return pd.DataFrame(columns=["Date", *_COLUMNS.values()])
+    return _clean_dataframe(data.reset_index())
+
+
+def _download_many(
+    symbols: List[str], start: pd.Timestamp, end: pd.Timestamp
+) -> Dict[str, pd.DataFrame]:
+    """Download adjusted daily bars and actions for several symbols in one request.
+
+    Returns a frame per symbol that yfinance returned data for.
+    """
+    data = yf_retry(lambda: yf.download(
+        symbols,
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
+        group_by="ticker",
+        progress=False,
+        auto_adjust=True,
+        actions=True,
+        threads=True,
+    ))
+    if data is None or data.empty:
+        return {}
+
+    frames = {}
+    tickers = data.columns.get_level_values(0) if isinstance(data.columns, pd.MultiIndex) else []
+    for symbol in symbols:
+        if symbol not in tickers:
+            continue
+        # Rows before a symbol's listing date come back without prices
+        frame = data[symbol]
+        prices = [column for column in ("Open", "High", "Low", "Close") if column in frame.columns]
+        frame = frame.dropna(how="all", subset=prices or None)
+        if not frame.empty:
+            frames[symbol] = _clean_dataframe(frame.rename_axis("Date").reset_index())
+    return frames
+
+
+def prefetch_ohlcv(symbols: Iterable[str], chunk_size: int = BULK_CHUNK_SIZE) -> None:
+    """Warm the shared store for a ticker universe before a batch runs."""
+    get_ohlcv_store().update_many(symbols, chunk_size=chunk_size)
+
+
+_stores: Dict[str, OHLCVStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_ohlcv_store() -> OHLCVStore:
+    """Return the shared store under the configured ``data_cache_dir``."""
+    root_dir = os.path.join(get_config()["data_cache_dir"], "ohlcv")
+    with _stores_lock:
+        if root_dir not in _stores:
+            _stores[root_dir] = OHLCVStore(root_dir)
+        return _stores[root_dir]
@@ -0,0 +1,105 @@
+"""Per-run in-memory price history shared by the price tools.
+
+Within a ``price_context()`` block (one graph run), the first price lookup
+for a symbol brings the OHLCV store up to date and reads the full history
+into memory once. ``get_stock_data`` and ``get_indicators`` then slice that
+same frame by date, so the two tools never disagree and repeated tool
+calls don't go back to the store. Outside a block, every lookup reads the
+store directly.
+"""
+
+import contextlib
+import contextvars
+import threading
+from typing import Dict, Iterator, NamedTuple, Optional
+
+import pandas as pd
+
+from .ohlcv_store import HISTORY_YEARS, get_ohlcv_store
+
+
+class PriceHistory(NamedTuple):
+    frame: pd.DataFrame  # Open/High/Low/Close/Volume indexed by Date
+    covers_from: Optional[pd.Timestamp]  # Earliest date the history is complete from
+
+
+def _load_history(symbol: str) -> PriceHistory:
+    store = get_ohlcv_store()
+    store.update(symbol)
+    fetched_until = store.fetched_until(symbol)
+    covers_from = (
+        fetched_until - pd.DateOffset(years=HISTORY_YEARS) if fetched_until is not None else None
+    )
+    return PriceHistory(store.read(symbol).set_index("Date"), covers_from)
+
+
+class PriceContext:
+    """Price histories loaded during one run, keyed by symbol."""
+
+    def __init__(self):
+        self._histories: Dict[str, PriceHistory] = {}
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def history(self, symbol: str) -> PriceHistory:
+        """Return the symbol's history, loading it on first use.
+
+        Tools of one run may execute in parallel; concurrent first lookups
+        for a symbol wait for a single load.
+        """
+        symbol = symbol.upper()
+        with self._lock:
+            if symbol in self._histories:
+                return self._histories[symbol]
+            symbol_lock = self._symbol_locks.setdefault(symbol, threading.Lock())
+        with symbol_lock:
+            with self._lock:
+                if symbol in self._histories:
+                    return self._histories[symbol]
+            history = _load_history(symbol)
+            with self._lock:
+                self._histories[symbol] = history
+            return history
+
+
+_current: contextvars.ContextVar[Optional[PriceContext]] = contextvars.ContextVar(
+    "price_context", default=None
+)
+
+
+@contextlib.contextmanager
+def price_context() -> Iterator[PriceContext]:
+    """Share price histories across the tool calls made inside the block.
+
+    Nested blocks reuse the outer context.
+    """
+    context = _current.get()
+    if context is not None:
+        yield context
+        return
+    context = PriceContext()
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+def get_price_window(
+    symbol: str, start: Optional[str] = None, end: Optional[str] = None
+) -> Optional[pd.DataFrame]:
+    """Return bars with ``start <= Date <= end`` (both optional), indexed by Date.
+
+    The result is a slice of the run's shared frame and must not be
+    modified. Returns None if ``start`` precedes the stored history.
+    """
+    context = _current.get()
+    history = context.history(symbol) if context is not None else _load_history(symbol)
+    if start is not None and (
+        history.covers_from is None or pd.Timestamp(start) < history.covers_from
+    ):
+        return None
+    return history.frame.loc[
+        pd.Timestamp(start) if start is not None else None:
+        pd.Timestamp(end) if end is not None else None
+    ]
@@ -0,0 +1,295 @@
+"""Response cache for vendor calls made through ``route_to_vendor``.
+
+Entries are keyed by method, vendor and the normalized call arguments, so
+identical requests from different analysts or tickers (e.g. global news
+for one date) are fetched once. Every argument, including the as-of date,
+is part of the key, so a response is never served for another trading
+date. Vendors return text already encoded per the ``tool_output`` config,
+so those settings are part of the key too. A response fetched on or before
+its own as-of date describes a day that is still in progress; it expires
+at the end of the fetch day rather than being replayed later as settled
+history.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .config import get_config
+
+# Default time-to-live in seconds per data category
+DEFAULT_TTLS = {
+    "core_stock_apis": 24 * 3600,
+    "technical_indicators": 24 * 3600,
+    "fundamental_data": 7 * 24 * 3600,
+    "news_data": 24 * 3600,
+}
+
+# Argument names that hold ticker symbols and are compared case-insensitively
+_SYMBOL_ARGS = ("symbol", "ticker")
+
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Sentinel returned by ResponseCache.get on a miss (None is a valid response)
+MISS = object()
+
+
+class MemoryCacheBackend:
+    """In-process cache backend."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, expires_at: float, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCacheBackend:
+    """Cache backend storing one JSON file per entry, surviving restarts.
+
+    Each file's modification time is set to the entry's expiry, so
+    ``sweep`` can drop expired entries and keep the directory under
+    ``max_bytes`` from file stats alone, evicting the entries closest to
+    expiry first. A sweep runs on start-up and every ``sweep_every`` writes.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        max_bytes: Optional[int] = 256 * 1024 * 1024,
+        sweep_every: int = 500,
+    ):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.sweep_every = sweep_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        os.makedirs(root_dir, exist_ok=True)
+        self.sweep()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root_dir, key[:2], f"{key}.json")
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry["expires_at"], entry["value"]
+
+    def set(self, key: str, expires_at: float, value: Any) -> None:
+        try:
+            payload = json.dumps({"expires_at": expires_at, "value": value})
+        except (TypeError, ValueError):
+            return  # Not JSON-serializable; skip persisting
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file and rename so readers never see partial entries
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.utime(tmp_path, (expires_at, expires_at))
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._writes += 1
+            due = self._writes % self.sweep_every == 0
+        if due:
+            self.sweep()
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def sweep(self) -> None:
+        """Delete expired entries, then the soonest-expiring ones over ``max_bytes``."""
+        now = time.time()
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root_dir):
+            for filename in filenames:
+                if not filename.endswith(".json"):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    stat = os.stat(path)
+                    if stat.st_mtime <= now:
+                        os.remove(path)
+                        continue
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total += stat.st_size
+
+        if self.max_bytes is None or total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self) -> None:
+        for dirpath, _, filenames in os.walk(self.root_dir):
+            for filename in filenames:
+                if filename.endswith(".json"):
+                    os.remove(os.path.join(dirpath, filename))
+
+
+class ResponseCache:
+    """TTL cache for vendor responses with hit/miss counters per method."""
+
+    def __init__(self, backend, ttls: Optional[Dict[str, int]] = None):
+        """Initialize the cache.
+
+        Args:
+            backend: Storage backend (MemoryCacheBackend, DiskCacheBackend or
+                any object with the same get/set/delete/clear methods)
+            ttls: Time-to-live in seconds per data category
+        """
+        self.backend = backend
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize_args(func: Callable, args: tuple, kwargs: dict) -> Dict[str, Any]:
+        """Bind arguments to the vendor signature so positional, keyword and
+        defaulted forms of the same call produce the same key."""
+        try:
+            bound = inspect.signature(func).bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+        except (TypeError, ValueError):
+            arguments = {"args": list(args), **kwargs}
+
+        for name, value in arguments.items():
+            if isinstance(value, str):
+                value = value.strip()
+                if name in _SYMBOL_ARGS:
+                    value = value.upper()
+                arguments[name] = value
+        return arguments
+
+    def make_key(self, method: str, vendor: str, func: Callable, args: tuple, kwargs: dict) -> Tuple[str, Optional[str]]:
+        """Return (cache key, latest date argument) for a vendor call."""
+        arguments = self._normalize_args(func, args, kwargs)
+        tool_output = get_config().get("tool_output")
+        raw = json.dumps([method, vendor, arguments, tool_output], sort_keys=True, default=str)
+        dates = [
+            v for v in arguments.values() if isinstance(v, str) and _DATE_PATTERN.match(v)
+        ]
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest(), max(dates, default=None)
+
+    def _count(self, method: str, field: str) -> None:
+        with self._lock:
+            counters = self._stats.setdefault(method, {"hits": 0, "misses": 0})
+            counters[field] += 1
+
+    def get(self, method: str, key: str) -> Any:
+        """Return the cached response, or MISS if absent or expired."""
+        entry = self.backend.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                self._count(method, "hits")
+                return value
+            self.backend.delete(key)
+        self._count(method, "misses")
+        return MISS
+
+    def set(self, method: str, category: str, key: str, as_of: Optional[str], value: Any) -> None:
+        """Store a response under the category TTL.
+
+        If the request's as-of date is today or later, the entry expires no
+        later than the end of today.
+        """
+        now = datetime.now()
+        expires_at = now.timestamp() + self.ttls.get(category, 3600)
+        if as_of is not None and as_of >= now.strftime("%Y-%m-%d"):
+            end_of_day = datetime(now.year, now.month, now.day) + timedelta(days=1)
+            expires_at = min(expires_at, end_of_day.timestamp())
+        self.backend.set(key, expires_at, value)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return total and per-method hit/miss counters."""
+        with self._lock:
+            by_method = {m: dict(c) for m, c in self._stats.items()}
+        return {
+            "hits": sum(c["hits"] for c in by_method.values()),
+            "misses": sum(c["misses"] for c in by_method.values()),
+            "by_method": by_method,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        self.backend.clear()
+        with self._lock:
+            self._stats.clear()
+
+
+_cache: Optional[ResponseCache] = None
+_cache_signature: Optional[str] = None
+_custom_cache = False
+_cache_lock = threading.Lock()
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Install a custom cache (or None to disable caching) for route_to_vendor."""
+    global _cache, _custom_cache
+    with _cache_lock:
+        _cache = cache
+        _custom_cache = True
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Return the active cache, building it from the ``response_cache`` config."""
+    global _cache, _cache_signature
+    config = get_config()
+    settings = config.get("response_cache") or {}
+    signature = json.dumps([settings, config.get("data_cache_dir")], sort_keys=True, default=str)
+
+    with _cache_lock:
+        if _custom_cache:
+            return _cache
+        if signature != _cache_signature:
+            _cache_signature = signature
+            if not settings.get("enabled", False):
+                _cache = None
+            elif settings.get("backend", "disk") == "memory":
+                _cache = ResponseCache(MemoryCacheBackend(), settings.get("ttl"))
+            else:
+                root_dir = os.path.join(config["data_cache_dir"], "vendor_responses")
+                max_mb = settings.get("max_mb", 256)
+                backend = DiskCacheBackend(
+                    root_dir, max_bytes=max_mb * 1024 * 1024 if max_mb else None
+                )
+                _cache = ResponseCache(backend, settings.get("ttl"))
+        return _cache
@@ -6,8 +6,6 @@ import yfinance as yf
 from yfinance.exceptions import YFRateLimitError
 from stockstats import wrap
 from typing import Annotated
-import os
-from .config import get_config
 
 logger = logging.getLogger(__name__)
 
@@ -47,45 +45,18 @@ def _clean_dataframe(data: pd.DataFrame) -> pd.DataFrame:
 def load_ohlcv(symbol: str, curr_date: str) -> pd.DataFrame:
     """Fetch OHLCV data with caching, filtered to prevent look-ahead bias.
 
-    Downloads 15 years of data up to today and caches per symbol. On
-    subsequent calls the cache is reused. Rows after curr_date are
-    filtered out so backtests never see future prices.
+    History lives in the persistent per-symbol OHLCV store, which is
+    topped up incrementally with only the days missing since the last
+    fetch, and is shared with ``get_stock_data`` through the run's price
+    context. Rows after curr_date are filtered out so backtests never see
+    future prices.
     """
-    config = get_config()
-    curr_date_dt = pd.to_datetime(curr_date)
-
-    # Cache uses a fixed window (15y to today) so one file per symbol
-    today_date = pd.Timestamp.today()
-    start_date = today_date - pd.DateOffset(years=5)
-    start_str = start_date.strftime("%Y-%m-%d")
-    end_str = today_date.strftime("%Y-%m-%d")
-
-    os.makedirs(config["data_cache_dir"], exist_ok=True)
-    data_file = os.path.join(
-        config["data_cache_dir"],
-        f"{symbol}-YFin-data-{start_str}-{end_str}.csv",
-    )
-
-    if os.path.exists(data_file):
-        data = pd.read_csv(data_file, on_bad_lines="skip")
-    else:
-        data = yf_retry(lambda: yf.download(
-            symbol,
-            start=start_str,
-            end=end_str,
-            multi_level_index=False,
-            progress=False,
-            auto_adjust=True,
-        ))
-        data = data.reset_index()
-        data.to_csv(data_file, index=False)
-
-    data = _clean_dataframe(data)
+    from .price_context import get_price_window
 
     # Filter to curr_date to prevent look-ahead bias in backtesting
-    data = data[data["Date"] <= curr_date_dt]
+    data = get_price_window(symbol, end=curr_date).reset_index()
 
-    return data
+    return _clean_dataframe(data)
 
 
 def filter_financials_by_date(data: pd.DataFrame, curr_date: str) -> pd.DataFrame:
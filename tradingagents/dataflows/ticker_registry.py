@@ -0,0 +1,80 @@
+"""Per-run registry of ``yf.Ticker`` objects shared by the yfinance tools.
+
+A ``yf.Ticker`` caches what it has downloaded (the quote summary behind
+``info``, statement time series, news), so the fundamentals analyst's
+back-to-back tool calls for one symbol should go through one object.
+Within a ``ticker_registry()`` block (one graph run), ``get_ticker``
+returns the same Ticker per symbol, keeping at most ``max_size`` of them
+(least recently used are dropped first). Outside a block, every call
+builds a new Ticker.
+"""
+
+import contextlib
+import contextvars
+import threading
+from collections import OrderedDict
+from typing import Iterator, Optional
+
+import yfinance as yf
+
+from .config import get_config
+
+
+class TickerRegistry:
+    """Bounded, thread-safe map from symbol to ``yf.Ticker``."""
+
+    def __init__(self, max_size: int = 32):
+        self.max_size = max_size
+        self._tickers: "OrderedDict[str, yf.Ticker]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str) -> yf.Ticker:
+        symbol = symbol.upper()
+        with self._lock:
+            ticker = self._tickers.get(symbol)
+            if ticker is None:
+                ticker = yf.Ticker(symbol)
+                self._tickers[symbol] = ticker
+                while len(self._tickers) > self.max_size:
+                    self._tickers.popitem(last=False)
+            else:
+                self._tickers.move_to_end(symbol)
+            return ticker
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tickers)
+
+
+_current: contextvars.ContextVar[Optional[TickerRegistry]] = contextvars.ContextVar(
+    "ticker_registry", default=None
+)
+
+
+@contextlib.contextmanager
+def ticker_registry(max_size: Optional[int] = None) -> Iterator[TickerRegistry]:
+    """Share Ticker objects across the tool calls made inside the block.
+
+    The size defaults to the ``ticker_registry_size`` config. Nested
+    blocks reuse the outer registry.
+    """
+    registry = _current.get()
+    if registry is not None:
+        yield registry
+        return
+    if max_size is None:
+        max_size = get_config().get("ticker_registry_size", 32)
+    registry = TickerRegistry(max_size)
+    token = _current.set(registry)
+    try:
+        yield registry
+    finally:
+        _current.reset(token)
+
+
+def get_ticker(symbol: str) -> yf.Ticker:
+    """Return the run's Ticker for ``symbol``, or a new one outside a run."""
+    registry = _current.get()
+    if registry is None:
+        return yf.Ticker(symbol.upper())
+    return registry.get(symbol)
@@ -2,9 +2,13 @@ from typing import Annotated
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import pandas as pd
-import yfinance as yf
 import os
 from .stockstats_utils import StockstatsUtils, _clean_dataframe, yf_retry, load_ohlcv, filter_financials_by_date
+from .indicator_engine import INDICATOR_DESCRIPTIONS, get_indicator_engine
+from .price_context import get_price_window
+from .encoders import NON_TRADING_DAY, get_output_encoder
+from .fundamentals_store import load_info, load_statement
+from .ticker_registry import get_ticker
 
 def get_YFin_data_online(
     symbol: Annotated[str, "ticker symbol of the company"],
@@ -15,11 +19,11 @@ def get_YFin_data_online(
     datetime.strptime(start_date, "%Y-%m-%d")
     datetime.strptime(end_date, "%Y-%m-%d")
 
-    # Create ticker object
-    ticker = yf.Ticker(symbol.upper())
-
-    # Fetch historical data for the specified date range
-    data = yf_retry(lambda: ticker.history(start=start_date, end=end_date))
+    data = _read_stored_history(symbol, start_date, end_date)
+    if data is None:
+        # Range predates the stored history: fetch it directly
+        ticker = get_ticker(symbol)
+        data = yf_retry(lambda: ticker.history(start=start_date, end=end_date))
 
     # Check if data is empty
     if data.empty:
@@ -37,8 +41,8 @@ def get_YFin_data_online(
         if col in data.columns:
             data[col] = data[col].round(2)
 
-    # Convert DataFrame to CSV string
-    csv_string = data.to_csv()
+    # Render with the configured tool output encoding
+    csv_string = get_output_encoder().table(data)
 
     # Add header information
     header = f"# Stock data for {symbol.upper()} from {start_date} to {end_date}\n"
@@ -47,6 +51,17 @@ def get_YFin_data_online(
 
     return header + csv_string
 
+def _read_stored_history(symbol: str, start_date: str, end_date: str):
+    """Read ``start_date <= Date < end_date`` from the run's price history.
+
+    Matches ``Ticker.history``'s exclusive end date. Returns None if the
+    stored history may not reach back to ``start_date``.
+    """
+    end = pd.Timestamp(end_date) - pd.Timedelta(days=1)
+    window = get_price_window(symbol, start=start_date, end=end.strftime("%Y-%m-%d"))
+    # Rounding below writes to the frame, so detach it from the shared history
+    return window.copy() if window is not None else None
+
 def get_stock_stats_indicators_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to get the analysis and report of"],
@@ -56,82 +71,9 @@ def get_stock_stats_indicators_window(
     look_back_days: Annotated[int, "how many days to look back"],
 ) -> str:
 
-    best_ind_params = {
-        # Moving Averages
-        "close_50_sma": (
-            "50 SMA: A medium-term trend indicator. "
-            "Usage: Identify trend direction and serve as dynamic support/resistance. "
-            "Tips: It lags price; combine with faster indicators for timely signals."
-        ),
-        "close_200_sma": (
-            "200 SMA: A long-term trend benchmark. "
-            "Usage: Confirm overall market trend and identify golden/death cross setups. "
-            "Tips: It reacts slowly; best for strategic trend confirmation rather than frequent trading entries."
-        ),
-        "close_10_ema": (
-            "10 EMA: A responsive short-term average. "
-            "Usage: Capture quick shifts in momentum and potential entry points. "
-            "Tips: Prone to noise in choppy markets; use alongside longer averages for filtering false signals."
-        ),
-        # MACD Related
-        "macd": (
-            "MACD: Computes momentum via differences of EMAs. "
-            "Usage: Look for crossovers and divergence as signals of trend changes. "
-            "Tips: Confirm with other indicators in low-volatility or sideways markets."
-        ),
-        "macds": (
-            "MACD Signal: An EMA smoothing of the MACD line. "
-            "Usage: Use crossovers with the MACD line to trigger trades. "
-            "Tips: Should be part of a broader strategy to avoid false positives."
-        ),
-        "macdh": (
-            "MACD Histogram: Shows the gap between the MACD line and its signal. "
-            "Usage: Visualize momentum strength and spot divergence early. "
-            "Tips: Can be volatile; complement with additional filters in fast-moving markets."
-        ),
-        # Momentum Indicators
-        "rsi": (
-            "RSI: Measures momentum to flag overbought/oversold conditions. "
-            "Usage: Apply 70/30 thresholds and watch for divergence to signal reversals. "
-            "Tips: In strong trends, RSI may remain extreme; always cross-check with trend analysis."
-        ),
-        # Volatility Indicators
-        "boll": (
-            "Bollinger Middle: A 20 SMA serving as the basis for Bollinger Bands. "
-            "Usage: Acts as a dynamic benchmark for price movement. "
-            "Tips: Combine with the upper and lower bands to effectively spot breakouts or reversals."
-        ),
-        "boll_ub": (
-            "Bollinger Upper Band: Typically 2 standard deviations above the middle line. "
-            "Usage: Signals potential overbought conditions and breakout zones. "
-            "Tips: Confirm signals with other tools; prices may ride the band in strong trends."
-        ),
-        "boll_lb": (
-            "Bollinger Lower Band: Typically 2 standard deviations below the middle line. "
-            "Usage: Indicates potential oversold conditions. "
-            "Tips: Use additional analysis to avoid false reversal signals."
-        ),
-        "atr": (
-            "ATR: Averages true range to measure volatility. "
-            "Usage: Set stop-loss levels and adjust position sizes based on current market volatility. "
-            "Tips: It's a reactive measure, so use it as part of a broader risk management strategy."
-        ),
-        # Volume-Based Indicators
-        "vwma": (
-            "VWMA: A moving average weighted by volume. "
-            "Usage: Confirm trends by integrating price action with volume data. "
-            "Tips: Watch for skewed results from volume spikes; use in combination with other volume analyses."
-        ),
-        "mfi": (
-            "MFI: The Money Flow Index is a momentum indicator that uses both price and volume to measure buying and selling pressure. "
-            "Usage: Identify overbought (>80) or oversold (<20) conditions and confirm the strength of trends or reversals. "
-            "Tips: Use alongside RSI or MACD to confirm signals; divergence between price and MFI can indicate potential reversals."
-        ),
-    }
-
-    if indicator not in best_ind_params:
+    if indicator not in INDICATOR_DESCRIPTIONS:
         raise ValueError(
-            f"Indicator {indicator} is not supported. Please choose from: {list(best_ind_params.keys())}"
+            f"Indicator {indicator} is not supported. Please choose from: {list(INDICATOR_DESCRIPTIONS.keys())}"
         )
 
     end_date = curr_date
@@ -141,28 +83,17 @@ def get_stock_stats_indicators_window(
     # Optimized: Get stock data once and calculate indicators for all dates
     try:
         indicator_data = _get_stock_stats_bulk(symbol, indicator, curr_date)
-        
-        # Generate the date range we need
-        current_dt = curr_date_dt
-        date_values = []
-        
-        while current_dt >= before:
-            date_str = current_dt.strftime('%Y-%m-%d')
-            
-            # Look up the indicator value for this date
-            if date_str in indicator_data:
-                indicator_value = indicator_data[date_str]
-            else:
-                indicator_value = "N/A: Not a trading day (weekend or holiday)"
-            
-            date_values.append((date_str, indicator_value))
-            current_dt = current_dt - relativedelta(days=1)
-        
+
+        # Reindex the trading-day values against every calendar day in the
+        # window (newest first); days without a bar are non-trading days
+        window = pd.date_range(start=before, end=curr_date_dt, freq="D")[::-1]
+        window_values = indicator_data.reindex(window).fillna(NON_TRADING_DAY)
+
         # Build the result string
-        ind_string = ""
-        for date_str, value in date_values:
-            ind_string += f"{date_str}: {value}\n"
-        
+        ind_string = get_output_encoder().dated_values(
+            window.strftime("%Y-%m-%d"), window_values
+        )
+
     except Exception as e:
         print(f"Error getting bulk stockstats data: {e}")
         # Fallback to original implementation if bulk method fails
@@ -179,7 +110,7 @@ def get_stock_stats_indicators_window(
         f"## {indicator} values from {before.strftime('%Y-%m-%d')} to {end_date}:\n\n"
         + ind_string
         + "\n\n"
-        + best_ind_params.get(indicator, "No description available.")
+        + INDICATOR_DESCRIPTIONS.get(indicator, "No description available.")
     )
 
     return result_str
@@ -189,34 +120,17 @@ def _get_stock_stats_bulk(
     symbol: Annotated[str, "ticker symbol of the company"],
     indicator: Annotated[str, "technical indicator to calculate"],
     curr_date: Annotated[str, "current date for reference"]
-) -> dict:
+) -> pd.Series:
     """
     Optimized bulk calculation of stock stats indicators.
-    Fetches data once and calculates indicator for all available dates.
-    Returns dict mapping date strings to indicator values.
+    Served by the shared indicator engine, which computes every supported
+    indicator for (symbol, curr_date) once and caches the result.
+    Returns a Series of float values ("N/A" for NaN) indexed by trading date,
+    left for the output encoder to format.
     """
-    from stockstats import wrap
-
-    data = load_ohlcv(symbol, curr_date)
-    df = wrap(data)
-    df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-    
-    # Calculate the indicator for all rows at once
-    df[indicator]  # This triggers stockstats to calculate the indicator
-    
-    # Create a dictionary mapping date strings to indicator values
-    result_dict = {}
-    for _, row in df.iterrows():
-        date_str = row["Date"]
-        indicator_value = row[indicator]
-        
-        # Handle NaN/None values
-        if pd.isna(indicator_value):
-            result_dict[date_str] = "N/A"
-        else:
-            result_dict[date_str] = str(indicator_value)
-    
-    return result_dict
+    values = get_indicator_engine().get_indicator(symbol, indicator, curr_date)
+
+    return values.astype(object).where(values.notna(), "N/A")
 
 
 def get_stockstats_indicator(
@@ -247,12 +161,11 @@ def get_stockstats_indicator(
 
 def get_fundamentals(
     ticker: Annotated[str, "ticker symbol of the company"],
-    curr_date: Annotated[str, "current date (not used for yfinance)"] = None
+    curr_date: Annotated[str, "current date in YYYY-MM-DD format"] = None
 ):
     """Get company fundamentals overview from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-        info = yf_retry(lambda: ticker_obj.info)
+        info = load_info(ticker, curr_date)
 
         if not info:
             return f"No fundamentals data found for symbol '{ticker}'"
@@ -309,20 +222,14 @@ def get_balance_sheet(
 ):
     """Get balance sheet data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-
-        if freq.lower() == "quarterly":
-            data = yf_retry(lambda: ticker_obj.quarterly_balance_sheet)
-        else:
-            data = yf_retry(lambda: ticker_obj.balance_sheet)
-
+        data = load_statement(ticker, "balance_sheet", freq, curr_date)
         data = filter_financials_by_date(data, curr_date)
 
         if data.empty:
             return f"No balance sheet data found for symbol '{ticker}'"
             
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+        # Render with the configured tool output encoding
+        csv_string = get_output_encoder().table(data)
         
         # Add header information
         header = f"# Balance Sheet data for {ticker.upper()} ({freq})\n"
@@ -341,20 +248,14 @@ def get_cashflow(
 ):
     """Get cash flow data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-
-        if freq.lower() == "quarterly":
-            data = yf_retry(lambda: ticker_obj.quarterly_cashflow)
-        else:
-            data = yf_retry(lambda: ticker_obj.cashflow)
-
+        data = load_statement(ticker, "cashflow", freq, curr_date)
         data = filter_financials_by_date(data, curr_date)
 
         if data.empty:
             return f"No cash flow data found for symbol '{ticker}'"
             
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+        # Render with the configured tool output encoding
+        csv_string = get_output_encoder().table(data)
         
         # Add header information
         header = f"# Cash Flow data for {ticker.upper()} ({freq})\n"
@@ -373,20 +274,14 @@ def get_income_statement(
 ):
     """Get income statement data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
-
-        if freq.lower() == "quarterly":
-            data = yf_retry(lambda: ticker_obj.quarterly_income_stmt)
-        else:
-            data = yf_retry(lambda: ticker_obj.income_stmt)
-
+        data = load_statement(ticker, "income_statement", freq, curr_date)
         data = filter_financials_by_date(data, curr_date)
 
         if data.empty:
             return f"No income statement data found for symbol '{ticker}'"
             
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+        # Render with the configured tool output encoding
+        csv_string = get_output_encoder().table(data)
         
         # Add header information
         header = f"# Income Statement data for {ticker.upper()} ({freq})\n"
@@ -403,14 +298,14 @@ def get_insider_transactions(
 ):
     """Get insider transactions data from yfinance."""
     try:
-        ticker_obj = yf.Ticker(ticker.upper())
+        ticker_obj = get_ticker(ticker)
         data = yf_retry(lambda: ticker_obj.insider_transactions)
         
         if data is None or data.empty:
             return f"No insider transactions data found for symbol '{ticker}'"
             
-        # Convert to CSV string for consistency with other functions
-        csv_string = data.to_csv()
+        # Render with the configured tool output encoding
+        csv_string = get_output_encoder().table(data)
         
         # Add header information
         header = f"# Insider Transactions data for {ticker.upper()}\n"
@@ -1,10 +1,13 @@
 """yfinance-based news data fetching functions."""
 
+import threading
 import yfinance as yf
 from datetime import datetime
+from typing import Dict, List, Tuple
 from dateutil.relativedelta import relativedelta
 
 from .stockstats_utils import yf_retry
+from .ticker_registry import get_ticker
 
 
 def _extract_article_data(article: dict) -> dict:
@@ -65,7 +68,7 @@ def get_news_yfinance(
         Formatted string containing news articles
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = get_ticker(ticker)
         news = yf_retry(lambda: stock.get_news(count=20))
 
         if not news:
@@ -104,6 +107,106 @@ def get_news_yfinance(
         return f"Error fetching news for {ticker}: {str(e)}"
 
 
+# Search queries for macro/global news
+GLOBAL_NEWS_QUERIES = [
+    "stock market economy",
+    "Federal Reserve interest rates",
+    "inflation economic outlook",
+    "global markets trading",
+]
+
+# Normalized global news articles per (fetch day, limit), shared by all runs
+_global_news_store: Dict[Tuple[str, int], List[dict]] = {}
+_global_news_locks: Dict[Tuple[str, int], threading.Lock] = {}
+_global_news_guard = threading.Lock()
+
+
+def _search_global_news(limit: int) -> List[dict]:
+    """Run the macro news searches and return articles deduplicated by title."""
+    articles = []
+    seen_titles = set()
+
+    for query in GLOBAL_NEWS_QUERIES:
+        search = yf_retry(lambda q=query: yf.Search(
+            query=q,
+            news_count=limit,
+            enable_fuzzy_query=True,
+        ))
+
+        if search.news:
+            for article in search.news:
+                # Handle both flat and nested structures
+                if "content" in article:
+                    data = _extract_article_data(article)
+                    title = data["title"]
+                else:
+                    title = article.get("title", "")
+                    data = {
+                        "title": article.get("title", "No title"),
+                        "summary": "",
+                        "publisher": article.get("publisher", "Unknown"),
+                        "link": article.get("link", ""),
+                        "pub_date": None,
+                    }
+
+                # Deduplicate by title
+                if title and title not in seen_titles:
+                    seen_titles.add(title)
+                    articles.append(data)
+
+        if len(articles) >= limit:
+            break
+
+    return articles
+
+
+def fetch_global_news_articles(limit: int = 10) -> List[dict]:
+    """
+    Return today's normalized global news articles, searching at most once.
+
+    yfinance Search only returns current news, so the result depends on the
+    fetch day and ``limit`` but not on the requested date. Concurrent runs
+    wait for the first caller's searches instead of repeating them, and
+    every caller shares the stored list, which must not be modified.
+
+    Args:
+        limit: Number of articles requested from each search query
+
+    Returns:
+        List of dicts with title, summary, publisher, link and pub_date
+    """
+    key = (datetime.now().strftime("%Y-%m-%d"), limit)
+    with _global_news_guard:
+        lock = _global_news_locks.setdefault(key, threading.Lock())
+
+    with lock:
+        if key not in _global_news_store:
+            articles = _search_global_news(limit)
+            if not articles:
+                return articles  # Don't pin an empty result for the whole day
+            with _global_news_guard:
+                # Articles fetched on earlier days are superseded
+                for stale in [k for k in _global_news_store if k[0] != key[0]]:
+                    del _global_news_store[stale]
+                    _global_news_locks.pop(stale, None)
+                _global_news_store[key] = articles
+        return _global_news_store[key]
+
+
+def prefetch_global_news(limit: int = 5) -> int:
+    """
+    Fetch today's global news once ahead of a multi-ticker batch.
+
+    Args:
+        limit: Article limit the news tools will request (the
+            ``get_global_news`` tool defaults to 5)
+
+    Returns:
+        Number of articles stored
+    """
+    return len(fetch_global_news_articles(limit))
+
+
 def get_global_news_yfinance(
     curr_date: str,
     look_back_days: int = 7,
@@ -112,6 +215,9 @@ def get_global_news_yfinance(
     """
     Retrieve global/macro economic news using yfinance Search.
 
+    Articles come from the shared store filled by fetch_global_news_articles,
+    so runs for many tickers on the same day search only once.
+
     Args:
         curr_date: Current date in yyyy-mm-dd format
         look_back_days: Number of days to look back
@@ -120,41 +226,8 @@ def get_global_news_yfinance(
     Returns:
         Formatted string containing global news articles
     """
-    # Search queries for macro/global news
-    search_queries = [
-        "stock market economy",
-        "Federal Reserve interest rates",
-        "inflation economic outlook",
-        "global markets trading",
-    ]
-
-    all_news = []
-    seen_titles = set()
-
     try:
-        for query in search_queries:
-            search = yf_retry(lambda q=query: yf.Search(
-                query=q,
-                news_count=limit,
-                enable_fuzzy_query=True,
-            ))
-
-            if search.news:
-                for article in search.news:
-                    # Handle both flat and nested structures
-                    if "content" in article:
-                        data = _extract_article_data(article)
-                        title = data["title"]
-                    else:
-                        title = article.get("title", "")
-
-                    # Deduplicate by title
-                    if title and title not in seen_titles:
-                        seen_titles.add(title)
-                        all_news.append(article)
-
-            if len(all_news) >= limit:
-                break
+        all_news = fetch_global_news_articles(limit)
 
         if not all_news:
             return f"No global news found for {curr_date}"
@@ -165,30 +238,18 @@ def get_global_news_yfinance(
         start_date = start_dt.strftime("%Y-%m-%d")
 
         news_str = ""
-        for article in all_news[:limit]:
-            # Handle both flat and nested structures
-            if "content" in article:
-                data = _extract_article_data(article)
-                # Skip articles published after curr_date (look-ahead guard)
-                if data.get("pub_date"):
-                    pub_naive = data["pub_date"].replace(tzinfo=None) if hasattr(data["pub_date"], "replace") else data["pub_date"]
-                    if pub_naive > curr_dt + relativedelta(days=1):
-                        continue
-                title = data["title"]
-                publisher = data["publisher"]
-                link = data["link"]
-                summary = data["summary"]
-            else:
-                title = article.get("title", "No title")
-                publisher = article.get("publisher", "Unknown")
-                link = article.get("link", "")
-                summary = ""
-
-            news_str += f"### {title} (source: {publisher})\n"
-            if summary:
-                news_str += f"{summary}\n"
-            if link:
-                news_str += f"Link: {link}\n"
+        for data in all_news[:limit]:
+            # Skip articles published after curr_date (look-ahead guard)
+            if data["pub_date"]:
+                pub_naive = data["pub_date"].replace(tzinfo=None)
+                if pub_naive > curr_dt + relativedelta(days=1):
+                    continue
+
+            news_str += f"### {data['title']} (source: {data['publisher']})\n"
+            if data["summary"]:
+                news_str += f"{data['summary']}\n"
+            if data["link"]:
+                news_str += f"Link: {data['link']}\n"
             news_str += "\n"
 
         return f"## Global Market News, from {start_date} to {curr_date}:\n\n{news_str}"
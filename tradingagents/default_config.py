@@ -6,6 +6,8 @@ DEFAULT_CONFIG = {
     "project_dir": os.path.abspath(os.path.join(os.path.dirname(__file__), ".")),
     "results_dir": os.getenv("TRADINGAGENTS_RESULTS_DIR", os.path.join(_TRADINGAGENTS_HOME, "logs")),
     "data_cache_dir": os.getenv("TRADINGAGENTS_CACHE_DIR", os.path.join(_TRADINGAGENTS_HOME, "cache")),
+    # Directory for persistent agent memories (None keeps them in memory only)
+    "memory_dir": os.getenv("TRADINGAGENTS_MEMORY_DIR"),
     # LLM settings
     "llm_provider": "openai",
     "deep_think_llm": "gpt-5.4",
@@ -15,6 +17,14 @@ DEFAULT_CONFIG = {
     "google_thinking_level": None,      # "high", "minimal", etc.
     "openai_reasoning_effort": None,    # "medium", "high", "low"
     "anthropic_effort": None,           # "high", "medium", "low"
+    # Disk cache of LLM responses for re-running historical dates. "replay"
+    # mode fails on a cache miss instead of calling the provider
+    "llm_cache": {
+        "enabled": False,
+        "path": None,                  # Defaults to data_cache_dir/llm_cache.sqlite
+        "max_size_mb": 512,
+        "mode": "read_write",          # Options: read_write, replay
+    },
     # Output language for analyst reports and final decision
     # Internal agent debate stays in English for reasoning quality
     "output_language": "English",
@@ -22,6 +32,91 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Run the selected analysts concurrently, each in its own message
+    # sub-state, instead of as a serial chain
+    "parallel_analysts": False,
+    # USD per million tokens by model name, used for backtest cost reporting
+    "llm_pricing": {
+        # Example: "gpt-5.4-mini": {"input": 0.25, "output": 2.00},
+    },
+    # Token budgets for the analyst reports and debate history passed to
+    # researchers, risk debators and managers. Reports over budget are
+    # replaced by cached digests and older debate turns by a rolling summary
+    "context_budget": {
+        "enabled": False,
+        "report_tokens": 1500,     # per analyst report
+        "history_tokens": 3000,    # debate history
+        "agents": {
+            # Example: "portfolio_manager": {"history_tokens": 6000},
+        },
+    },
+    # Have the Research Manager, Trader and Portfolio Manager return typed
+    # TradeDecision objects (rating, conviction, key levels, ...) through
+    # with_structured_output. The rating is then read without a parse step
+    "structured_output": False,
+    # Per-run spans for graph nodes, LLM calls, tools and vendor calls
+    # (wall/queue time, tokens, cache hits, vendor), written as JSONL and
+    # OTLP/JSON with an aggregated summary per run
+    "tracing": {
+        "enabled": False,
+        "dir": None,                   # Defaults to results_dir/traces
+        "otlp": True,
+        "max_summaries": 1000,         # Run summaries kept in memory
+    },
+    # SQLite file for LangGraph checkpoints (requires langgraph-checkpoint-sqlite).
+    # When set, a failed or killed run for a ticker and date resumes from its
+    # last completed node. None disables checkpointing
+    "checkpoint_db": None,
+    # Worker pool size for TradingAgentsGraph.propagate_many
+    "max_concurrent_runs": 4,
+    # Number of (symbol, as-of date) indicator frames kept in memory
+    "indicator_cache_size": 64,
+    # Most yfinance Ticker objects one run keeps for reuse across its tools
+    "ticker_registry_size": 32,
+    # Cache for vendor responses made through route_to_vendor, off by
+    # default. TTLs are in seconds per data category; "disk" entries live
+    # in data_cache_dir/vendor_responses, survive restarts and are swept
+    # once expired or when the directory exceeds max_mb
+    "response_cache": {
+        "enabled": False,
+        "backend": "disk",                   # Options: disk, memory
+        "max_mb": 256,                       # Disk size limit; None for no limit
+        "ttl": {
+            "core_stock_apis": 24 * 3600,
+            "technical_indicators": 24 * 3600,
+            "fundamental_data": 7 * 24 * 3600,
+            "news_data": 24 * 3600,
+        },
+    },
+    # Point-in-time store of yfinance statements and company info (see
+    # dataflows/fundamentals_store.py). A stored statement is re-fetched
+    # only once a new fiscal period could have ended, at most every
+    # recheck_days. Company info changes daily, so only the newest
+    # info_snapshots per symbol are kept
+    "fundamentals_store": {
+        "enabled": True,
+        "recheck_days": 1,
+        "info_snapshots": 30,
+    },
+    # Text encoding of tabular tool results (see dataflows/encoders.py).
+    # The defaults keep the plain CSV output; "compact" with drop_empty,
+    # a precision and collapsed non-trading days cuts prompt tokens
+    "tool_output": {
+        "format": "csv",               # Options: csv, compact
+        "drop_empty": False,           # Drop all-empty rows and columns
+        "precision": None,             # Decimal places for floats
+        "collapse_non_trading_days": False,
+    },
+    # Alpha Vantage client: requests share one pooled session and a
+    # token-bucket limiter sized to the account's quota
+    "alpha_vantage": {
+        "requests_per_minute": 5,      # Free tier; raise to match a premium plan
+        "burst": None,                 # Bucket size; defaults to requests_per_minute
+        "timeout": 30,                 # Seconds per request
+        "max_retries": 3,              # For timeouts, 5xx and per-minute limits
+        "backoff": 1.0,                # Seconds, doubled per retry
+        "pool_size": 10,               # Keep-alive connections
+    },
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
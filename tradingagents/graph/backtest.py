@@ -0,0 +1,324 @@
+# TradingAgents/graph/backtest.py
+
+import json
+import os
+import re
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from tradingagents.dataflows.ohlcv_store import get_ohlcv_store
+from tradingagents.default_config import DEFAULT_CONFIG
+
+from .tracing import RunTracer
+from .trading_graph import TradingAgentsGraph
+
+# Position taken for each rating, as a fraction of a full long position
+RATING_POSITIONS = {
+    "BUY": 1.0,
+    "OVERWEIGHT": 0.5,
+    "HOLD": 0.0,
+    "UNDERWEIGHT": -0.5,
+    "SELL": -1.0,
+}
+
+_RATING_PATTERN = re.compile(r"\b(OVERWEIGHT|UNDERWEIGHT|BUY|HOLD|SELL)\b")
+
+
+def rating_position(decision: str) -> Optional[float]:
+    """Map a processed decision (e.g. "BUY") to a position size, or None."""
+    match = _RATING_PATTERN.search(str(decision).upper())
+    return RATING_POSITIONS[match.group(1)] if match else None
+
+
+def _usage_stats(
+    summaries: List[Dict[str, Any]], priced: bool, stats: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Add up LLM usage and cost over RunTracer run summaries.
+
+    Adds to ``stats`` (a previous result) if given. Cost is None unless
+    ``priced`` and every run's cost was known.
+    """
+    if stats is None:
+        stats = {
+            "llm_calls": 0,
+            "tokens_in": 0,
+            "tokens_out": 0,
+            "tokens_by_model": {},
+            "cost_usd": 0 if priced else None,
+        }
+    for summary in summaries:
+        for field in ("llm_calls", "tokens_in", "tokens_out"):
+            stats[field] += summary[field]
+        for model, counts in summary["models"].items():
+            entry = stats["tokens_by_model"].setdefault(model, {"tokens_in": 0, "tokens_out": 0})
+            entry["tokens_in"] += counts["tokens_in"]
+            entry["tokens_out"] += counts["tokens_out"]
+        if stats["cost_usd"] is not None and summary["cost_usd"] is not None:
+            stats["cost_usd"] += summary["cost_usd"]
+        else:
+            stats["cost_usd"] = None
+    return stats
+
+
+class Backtester:
+    """Walks TradingAgentsGraph over a ticker universe and date range.
+
+    Dates run in order. Within a date, tickers run concurrently through
+    ``propagate_many``. Each decision's realized return comes from the
+    cached OHLCV store and is fed back through reflection once the holding
+    period has ended, so later dates learn from earlier outcomes without
+    seeing prices from their own future. Progress is appended to a JSONL
+    checkpoint, and an interrupted backtest resumes from it. Memories only
+    carry over across a resume if ``memory_dir`` is configured.
+    """
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        start_date: str,
+        end_date: str,
+        config: Optional[Dict[str, Any]] = None,
+        selected_analysts: List[str] = ["market", "social", "news", "fundamentals"],
+        holding_days: int = 1,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        reflect: bool = True,
+    ):
+        """Initialize the backtest.
+
+        Args:
+            tickers: Ticker symbols to trade
+            start_date: First trade date (yyyy-mm-dd)
+            end_date: Last trade date (yyyy-mm-dd)
+            config: TradingAgentsGraph configuration. If None, uses default config
+            selected_analysts: Analysts to include in each run
+            holding_days: Trading days each decision is held for its return
+            max_workers: Concurrent runs per date. Defaults to ``max_concurrent_runs``
+            checkpoint_path: JSONL progress file. Defaults to
+                ``results_dir/backtests/backtest_{start}_{end}.jsonl``
+            reflect: Whether to reflect on realized returns and update memories
+        """
+        self.tickers = [t.strip().upper() for t in tickers]
+        self.start_date = start_date
+        self.end_date = end_date
+        self.config = config or DEFAULT_CONFIG.copy()
+        self.holding_days = holding_days
+        self.max_workers = max_workers
+        self.reflect = reflect
+        self.checkpoint_path = checkpoint_path or os.path.join(
+            self.config["results_dir"],
+            "backtests",
+            f"backtest_{start_date}_{end_date}.jsonl",
+        )
+
+        self.graph = TradingAgentsGraph(selected_analysts, config=self.config)
+        if self.graph.tracer is None:
+            # Keep run summaries in memory for the usage and cost report
+            self.graph.tracer = RunTracer(pricing=self.config.get("llm_pricing") or None)
+        self._closes: Dict[str, pd.Series] = {}
+
+    def _load_prices(self) -> None:
+        """Bring every ticker's history up to date and index closes by date."""
+        store = get_ohlcv_store()
+        store.update_many(self.tickers)
+        for ticker in self.tickers:
+            store.update(ticker)  # No-op unless the bulk download missed it
+            bars = store.read(ticker, start=self.start_date)
+            self._closes[ticker] = pd.Series(
+                bars["Close"].values, index=bars["Date"].dt.strftime("%Y-%m-%d")
+            )
+
+    def trading_dates(self) -> List[str]:
+        """Dates in range on which at least one ticker traded."""
+        if not self._closes:
+            self._load_prices()
+        dates = set()
+        for closes in self._closes.values():
+            dates.update(d for d in closes.index if d <= self.end_date)
+        return sorted(dates)
+
+    def forward_return(self, ticker: str, trade_date: str) -> Optional[float]:
+        """Close-to-close return over ``holding_days`` trading days, or None
+        if the holding period has not ended yet."""
+        closes = self._closes[ticker]
+        if trade_date not in closes.index:
+            return None
+        i = closes.index.get_loc(trade_date)
+        if i + self.holding_days >= len(closes):
+            return None
+        return float(closes.iloc[i + self.holding_days] / closes.iloc[i] - 1)
+
+    # Checkpointing
+
+    def _load_checkpoint(self) -> Tuple[Dict[Tuple[str, str], dict], Set[Tuple[str, str]]]:
+        """Return (completed run records, reflected jobs) from the checkpoint."""
+        runs, reflected = {}, set()
+        if not os.path.exists(self.checkpoint_path):
+            return runs, reflected
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Partial line from an interrupted write
+                job = (record["ticker"], record["trade_date"])
+                if record["event"] == "run":
+                    runs[job] = record
+                elif record["event"] == "reflected":
+                    reflected.add(job)
+        return runs, reflected
+
+    def _checkpoint(self, record: dict) -> None:
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    def _load_logged_state(self, ticker: str, trade_date: str) -> Optional[dict]:
+        """Rebuild the state a resumed run needs for reflection from its log."""
+        path = os.path.join(
+            self.config["results_dir"],
+            ticker,
+            "TradingAgentsStrategy_logs",
+            f"full_states_log_{trade_date}.json",
+        )
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        state["trader_investment_plan"] = state.get("trader_investment_decision", "")
+        return state
+
+    # Running
+
+    def _reflect(self, pending: List[Tuple[str, str, Optional[dict], float]]) -> None:
+        outcomes, jobs = [], []
+        for ticker, trade_date, state, pnl in pending:
+            state = state or self._load_logged_state(ticker, trade_date)
+            if state is not None:
+                outcomes.append((state, pnl))
+                jobs.append((ticker, trade_date))
+        if not outcomes:
+            return
+        self.graph.reflector.reflect_all(outcomes, self.graph.memories)
+        for ticker, trade_date in jobs:
+            self._checkpoint({"event": "reflected", "ticker": ticker, "trade_date": trade_date})
+
+    def _run_jobs(self, jobs: List[Tuple[str, str]]) -> List[Tuple[str, str, Any, dict]]:
+        """Run jobs concurrently; returns (ticker, date, final state, record)."""
+        finished = []
+        for ticker, trade_date, final_state, decision in self.graph.propagate_many(
+            jobs, max_workers=self.max_workers, return_exceptions=True
+        ):
+            if isinstance(final_state, Exception):
+                self._checkpoint({
+                    "event": "error",
+                    "ticker": ticker,
+                    "trade_date": trade_date,
+                    "error": repr(final_state),
+                })
+                continue
+            position = rating_position(decision)
+            forward_return = self.forward_return(ticker, trade_date)
+            pnl = (
+                position * forward_return
+                if position is not None and forward_return is not None
+                else None
+            )
+            record = {
+                "event": "run",
+                "ticker": ticker,
+                "trade_date": trade_date,
+                "decision": decision,
+                "position": position,
+                "forward_return": forward_return,
+                "pnl": pnl,
+            }
+            self._checkpoint(record)
+            finished.append((ticker, trade_date, final_state, record))
+        return finished
+
+    def run(self) -> Dict[str, Any]:
+        """Run (or resume) the backtest and return its summary.
+
+        The summary includes throughput (``runs_per_hour``) and the LLM
+        usage and cost of this session's graph runs, taken from the run
+        tracer's summaries (reflections are not counted); cost needs
+        ``llm_pricing`` in the config to cover every model used. The
+        tracer's summaries are drained after each batch of runs, so they
+        don't pile up over long backtests.
+        """
+        dates = self.trading_dates()
+        runs, reflected = self._load_checkpoint()
+        resumed = len(runs)
+        tracer = self.graph.tracer
+        priced = tracer.pricing is not None
+        tracer.drain_summaries()  # Runs from before this session
+        usage = _usage_stats([], priced)
+        started = time.monotonic()
+        completed = 0
+
+        # Resumed runs whose outcome was never reflected on
+        pending = [
+            (t, d, None, r["pnl"])
+            for (t, d), r in runs.items()
+            if r["pnl"] is not None and (t, d) not in reflected
+        ]
+        date_index = {d: i for i, d in enumerate(dates)}
+
+        def jobs_for(trade_date):
+            return [
+                (t, trade_date)
+                for t in self.tickers
+                if trade_date in self._closes[t].index and (t, trade_date) not in runs
+            ]
+
+        if not self.reflect:
+            finished = self._run_jobs([job for d in dates for job in jobs_for(d)])
+            usage = _usage_stats(tracer.drain_summaries(), priced, usage)
+            completed += len(finished)
+            for ticker, trade_date, _, record in finished:
+                runs[(ticker, trade_date)] = record
+        else:
+            for i, trade_date in enumerate(dates):
+                # Reflect only on outcomes whose holding period ended by now
+                ready, waiting = [], []
+                for p in pending:
+                    if date_index.get(p[1], -1) + self.holding_days <= i:
+                        ready.append(p)
+                    else:
+                        waiting.append(p)
+                if ready:
+                    self._reflect(ready)
+                pending = waiting
+
+                finished = self._run_jobs(jobs_for(trade_date))
+                usage = _usage_stats(tracer.drain_summaries(), priced, usage)
+                completed += len(finished)
+                for ticker, d, final_state, record in finished:
+                    runs[(ticker, d)] = record
+                    if record["pnl"] is not None:
+                        pending.append((ticker, d, final_state, record["pnl"]))
+
+            if pending:
+                self._reflect(pending)
+
+        elapsed = time.monotonic() - started
+        results = sorted(runs.values(), key=lambda r: (r["trade_date"], r["ticker"]))
+        pnls = [r["pnl"] for r in results if r["pnl"] is not None]
+        return {
+            "runs": len(results),
+            "resumed_runs": resumed,
+            "completed_runs": completed,
+            "elapsed_seconds": elapsed,
+            "runs_per_hour": completed / elapsed * 3600 if elapsed > 0 else 0.0,
+            **usage,
+            "cost_per_run": usage["cost_usd"] / completed
+            if usage["cost_usd"] is not None and completed
+            else None,
+            "mean_pnl": sum(pnls) / len(pnls) if pnls else None,
+            "hit_rate": sum(p > 0 for p in pnls) / len(pnls) if pnls else None,
+            "results": results,
+        }
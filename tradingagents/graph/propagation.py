@@ -53,16 +53,26 @@ class Propagator:
             "news_report": "",
         }
 
-    def get_graph_args(self, callbacks: Optional[List] = None) -> Dict[str, Any]:
+    @staticmethod
+    def get_thread_id(company_name: str, trade_date: str) -> str:
+        """Checkpoint thread used for one (ticker, date) run."""
+        return f"{company_name}-{trade_date}"
+
+    def get_graph_args(
+        self, callbacks: Optional[List] = None, thread_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Get arguments for the graph invocation.
 
         Args:
             callbacks: Optional list of callback handlers for tool execution tracking.
                        Note: LLM callbacks are handled separately via LLM constructor.
+            thread_id: Checkpoint thread, required when the graph has a checkpointer.
         """
         config = {"recursion_limit": self.max_recur_limit}
         if callbacks:
             config["callbacks"] = callbacks
+        if thread_id:
+            config["configurable"] = {"thread_id": thread_id}
         return {
             "stream_mode": "values",
             "config": config,
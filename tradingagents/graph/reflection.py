@@ -1,6 +1,6 @@
 # TradingAgents/graph/reflection.py
 
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 class Reflector:
@@ -54,11 +54,9 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
 
         return f"{curr_market_report}\n\n{curr_sentiment_report}\n\n{curr_news_report}\n\n{curr_fundamentals_report}"
 
-    def _reflect_on_component(
-        self, component_type: str, report: str, situation: str, returns_losses
-    ) -> str:
-        """Generate reflection for a component."""
-        messages = [
+    def _reflection_messages(self, report: str, situation: str, returns_losses) -> list:
+        """Build the reflection prompt for one component's report."""
+        return [
             ("system", self.reflection_system_prompt),
             (
                 "human",
@@ -66,9 +64,61 @@ Adhere strictly to these instructions, and ensure your output is detailed, accur
             ),
         ]
 
+    def _reflect_on_component(
+        self, component_type: str, report: str, situation: str, returns_losses
+    ) -> str:
+        """Generate reflection for a component."""
+        messages = self._reflection_messages(report, situation, returns_losses)
+
         result = self.quick_thinking_llm.invoke(messages).content
         return result
 
+    @staticmethod
+    def _component_reports(current_state: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """Return (memory name, report) for every component reflected on."""
+        return [
+            ("bull_memory", current_state["investment_debate_state"]["bull_history"]),
+            ("bear_memory", current_state["investment_debate_state"]["bear_history"]),
+            ("trader_memory", current_state["trader_investment_plan"]),
+            ("invest_judge_memory", current_state["investment_debate_state"]["judge_decision"]),
+            ("portfolio_manager_memory", current_state["risk_debate_state"]["judge_decision"]),
+        ]
+
+    def reflect_all(
+        self,
+        outcomes: Iterable[Tuple[Dict[str, Any], Any]],
+        memories: Dict[str, Any],
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """Reflect on every component of one or more runs and update memories.
+
+        All reflections are sent as a single concurrent ``batch`` call, each
+        run's situation is built once, and each memory receives one
+        ``add_situations`` call covering all runs.
+
+        Args:
+            outcomes: (final_state, returns_losses) pairs
+            memories: Memory name (e.g. "bull_memory") -> FinancialSituationMemory
+            max_concurrency: Optional cap on concurrent LLM calls
+        """
+        jobs = []
+        for current_state, returns_losses in outcomes:
+            situation = self._extract_current_situation(current_state)
+            for memory_name, report in self._component_reports(current_state):
+                messages = self._reflection_messages(report, situation, returns_losses)
+                jobs.append((memory_name, situation, messages))
+        if not jobs:
+            return
+
+        config = {"max_concurrency": max_concurrency} if max_concurrency else None
+        results = self.quick_thinking_llm.batch([job[2] for job in jobs], config=config)
+
+        inserts: Dict[str, List[Tuple[str, str]]] = {}
+        for (memory_name, situation, _), result in zip(jobs, results):
+            inserts.setdefault(memory_name, []).append((situation, result.content))
+        for memory_name, situations_and_advice in inserts.items():
+            memories[memory_name].add_situations(situations_and_advice)
+
     def reflect_bull_researcher(self, current_state, returns_losses, bull_memory):
         """Reflect on bull researcher's analysis and update memory."""
         situation = self._extract_current_situation(current_state)
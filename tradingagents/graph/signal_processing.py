@@ -1,6 +1,35 @@
 # TradingAgents/graph/signal_processing.py
 
-from typing import Any
+import re
+import threading
+from typing import Any, Dict, Optional
+
+RATINGS = ("BUY", "OVERWEIGHT", "HOLD", "UNDERWEIGHT", "SELL")
+
+_RATING_WORD = re.compile(r"\b(" + "|".join(RATINGS) + r")\b", re.IGNORECASE)
+# "**Rating**: Buy", "1. Rating - **Overweight**", "FINAL TRANSACTION PROPOSAL: **SELL**"
+_RATING_LINE = re.compile(
+    r"(?:\brating\b|final transaction proposal)[*_\s]*[:\-]+(.*)", re.IGNORECASE
+)
+
+
+def parse_rating(full_signal: str) -> Optional[str]:
+    """Extract the rating from a decision's "Rating:" line without an LLM.
+
+    Returns None if no rating line names exactly one rating, or if several
+    rating lines disagree.
+    """
+    found = set()
+    for line in full_signal.splitlines():
+        match = _RATING_LINE.search(line)
+        if not match:
+            continue
+        ratings = {word.upper() for word in _RATING_WORD.findall(match.group(1))}
+        if len(ratings) == 1:
+            found |= ratings
+        elif ratings:
+            return None  # e.g. "Rating: Hold or Buy"
+    return found.pop() if len(found) == 1 else None
 
 
 class SignalProcessor:
@@ -9,18 +38,28 @@ class SignalProcessor:
     def __init__(self, quick_thinking_llm: Any):
         """Initialize with an LLM for processing."""
         self.quick_thinking_llm = quick_thinking_llm
+        self.parsed = 0
+        self.fallbacks = 0
+        self._lock = threading.Lock()
 
-    def process_signal(self, full_signal: str) -> str:
-        """
-        Process a full trading signal to extract the core decision.
+    def _parse(self, full_signal: str) -> Optional[str]:
+        """Try the rule-based parser and count which path was taken."""
+        rating = parse_rating(full_signal)
+        with self._lock:
+            if rating is None:
+                self.fallbacks += 1
+            else:
+                self.parsed += 1
+        return rating
 
-        Args:
-            full_signal: Complete trading signal text
+    def get_stats(self) -> Dict[str, int]:
+        """Return how many signals were parsed directly vs. sent to the LLM."""
+        with self._lock:
+            return {"parsed": self.parsed, "llm_fallbacks": self.fallbacks}
 
-        Returns:
-            Extracted rating (BUY, OVERWEIGHT, HOLD, UNDERWEIGHT, or SELL)
-        """
-        messages = [
+    def _get_messages(self, full_signal: str) -> list:
+        """Build the extraction prompt for a full trading signal."""
+        return [
             (
                 "system",
                 "You are an efficient assistant that extracts the trading decision from analyst reports. "
@@ -30,4 +69,28 @@ class SignalProcessor:
             ("human", full_signal),
         ]
 
-        return self.quick_thinking_llm.invoke(messages).content
+    def process_signal(self, full_signal: str) -> str:
+        """
+        Process a full trading signal to extract the core decision.
+
+        Args:
+            full_signal: Complete trading signal text
+
+        Returns:
+            Extracted rating (BUY, OVERWEIGHT, HOLD, UNDERWEIGHT, or SELL)
+
+        The rating is read from the "Rating:" line when it is unambiguous;
+        the LLM is only asked otherwise.
+        """
+        rating = self._parse(full_signal)
+        if rating is not None:
+            return rating
+        return self.quick_thinking_llm.invoke(self._get_messages(full_signal)).content
+
+    async def aprocess_signal(self, full_signal: str) -> str:
+        """Async variant of process_signal."""
+        rating = self._parse(full_signal)
+        if rating is not None:
+            return rating
+        messages = self._get_messages(full_signal)
+        return (await self.quick_thinking_llm.ainvoke(messages)).content
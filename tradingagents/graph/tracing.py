@@ -0,0 +1,462 @@
+# TradingAgents/graph/tracing.py
+
+"""Per-run tracing of graph nodes, LLM calls, tool calls and vendor calls.
+
+RunTracer is a LangChain callback handler passed in the graph's run config,
+so every node, chat model and tool below the graph reports to it. Vendor
+calls made through ``route_to_vendor`` arrive as ``vendor_call`` custom
+events on the tool that made them.
+
+Each finished span records its wall time and, where it applies:
+
+- queue time: for a run, the time it waited in ``propagate_many``'s pool;
+  for a node, the gap between the previous node finishing and this node
+  starting (graph scheduling and checkpoint writes); for a vendor call,
+  the time spent on cache lookups and rate-limited vendors before the
+  answering vendor was called
+- input/output tokens and cache hits for LLM calls
+- the vendor used and whether the response cache answered the call
+
+When a run finishes, its spans are appended to ``events.jsonl`` (one span
+per line), to ``spans.otlp.jsonl`` (one OTLP/JSON ExportTraceServiceRequest
+per line, as written by the OpenTelemetry collector's file exporter) and
+its aggregated summary to ``summaries.jsonl``.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+_OTLP_STATUS = {"ok": 1, "error": 2}
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    if isinstance(value, (list, tuple)):
+        return {"arrayValue": {"values": [_otlp_value(v) for v in value]}}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(spans: List[Dict[str, Any]], service_name: str = "tradingagents") -> Dict[str, Any]:
+    """Convert one run's spans to an OTLP/JSON ExportTraceServiceRequest."""
+    otlp_spans = []
+    for span in spans:
+        attributes = {"tradingagents.kind": span["kind"], **span["attributes"]}
+        if span["queue_ms"] is not None:
+            attributes["tradingagents.queue_ms"] = span["queue_ms"]
+        otlp_span = {
+            "traceId": span["trace_id"],
+            "spanId": span["span_id"],
+            "name": span["name"],
+            "kind": 3 if span["kind"] in ("llm", "vendor") else 1,  # CLIENT / INTERNAL
+            "startTimeUnixNano": str(span["start_ns"]),
+            "endTimeUnixNano": str(span["end_ns"]),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in attributes.items()
+                if value is not None
+            ],
+            "status": {"code": _OTLP_STATUS[span["status"]]},
+        }
+        if span["parent_id"]:
+            otlp_span["parentSpanId"] = span["parent_id"]
+        if span["error"]:
+            otlp_span["status"]["message"] = span["error"]
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [
+                    {"scope": {"name": "tradingagents.graph.tracing"}, "spans": otlp_spans}
+                ],
+            }
+        ]
+    }
+
+
+def summarize_run(
+    spans: List[Dict[str, Any]],
+    pricing: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Dict[str, Any]:
+    """Aggregate one run's spans by node, tool, vendor and model.
+
+    LLM and tool spans are attributed to the node they ran in. ``cost_usd``
+    is only set if ``pricing`` (USD per million tokens) covers every model.
+    """
+    by_id = {span["span_id"]: span for span in spans}
+    root = next(span for span in spans if span["kind"] == "run")
+
+    def node_of(span):
+        parent = by_id.get(span["parent_id"])
+        while parent is not None and parent["kind"] != "node":
+            parent = by_id.get(parent["parent_id"])
+        return parent["name"] if parent is not None else None
+
+    nodes: Dict[str, Dict[str, Any]] = {}
+    tools: Dict[str, Dict[str, Any]] = {}
+    vendors: Dict[str, Dict[str, Any]] = {}
+    models: Dict[str, Dict[str, Any]] = {}
+
+    def node_entry(name):
+        return nodes.setdefault(name, {
+            "calls": 0, "wall_ms": 0.0, "queue_ms": 0.0, "llm_calls": 0,
+            "tokens_in": 0, "tokens_out": 0, "tool_calls": 0, "errors": 0,
+        })
+
+    for span in spans:
+        kind, attrs = span["kind"], span["attributes"]
+        if kind == "node":
+            entry = node_entry(span["name"])
+            entry["calls"] += 1
+            entry["wall_ms"] += span["wall_ms"]
+            entry["queue_ms"] += span["queue_ms"] or 0.0
+            entry["errors"] += span["status"] == "error"
+        elif kind == "llm":
+            model = attrs.get("model") or "unknown"
+            entry = models.setdefault(model, {
+                "calls": 0, "wall_ms": 0.0, "tokens_in": 0, "tokens_out": 0, "cache_hits": 0,
+            })
+            entry["calls"] += 1
+            entry["wall_ms"] += span["wall_ms"]
+            entry["tokens_in"] += attrs.get("tokens_in", 0)
+            entry["tokens_out"] += attrs.get("tokens_out", 0)
+            entry["cache_hits"] += bool(attrs.get("cache_hit"))
+            node = node_of(span)
+            if node is not None:
+                entry = node_entry(node)
+                entry["llm_calls"] += 1
+                entry["tokens_in"] += attrs.get("tokens_in", 0)
+                entry["tokens_out"] += attrs.get("tokens_out", 0)
+        elif kind == "tool":
+            entry = tools.setdefault(span["name"], {"calls": 0, "wall_ms": 0.0, "errors": 0})
+            entry["calls"] += 1
+            entry["wall_ms"] += span["wall_ms"]
+            entry["errors"] += span["status"] == "error"
+            node = node_of(span)
+            if node is not None:
+                node_entry(node)["tool_calls"] += 1
+        elif kind == "vendor":
+            entry = vendors.setdefault(f"{attrs['method']}/{attrs['vendor']}", {
+                "calls": 0, "wall_ms": 0.0, "queue_ms": 0.0, "cache_hits": 0, "errors": 0,
+            })
+            entry["calls"] += 1
+            entry["wall_ms"] += span["wall_ms"]
+            entry["queue_ms"] += span["queue_ms"] or 0.0
+            entry["cache_hits"] += bool(attrs.get("cache_hit"))
+            entry["errors"] += span["status"] == "error"
+
+    cost = None
+    if pricing is not None and all(model in pricing for model in models):
+        cost = sum(
+            counts["tokens_in"] * pricing[model].get("input", 0.0) / 1e6
+            + counts["tokens_out"] * pricing[model].get("output", 0.0) / 1e6
+            for model, counts in models.items()
+        )
+
+    return {
+        "trace_id": root["trace_id"],
+        "ticker": root["attributes"].get("ticker"),
+        "trade_date": root["attributes"].get("trade_date"),
+        "status": root["status"],
+        "wall_ms": root["wall_ms"],
+        "queue_ms": root["queue_ms"],
+        "llm_calls": sum(m["calls"] for m in models.values()),
+        "tokens_in": sum(m["tokens_in"] for m in models.values()),
+        "tokens_out": sum(m["tokens_out"] for m in models.values()),
+        "cost_usd": cost,
+        "nodes": nodes,
+        "tools": tools,
+        "vendors": vendors,
+        "models": models,
+    }
+
+
+class RunTracer(BaseCallbackHandler):
+    """Callback handler that records spans for each graph run.
+
+    One instance can trace many concurrent runs; each graph invocation is
+    its own trace. The run config's ``ticker``, ``trade_date`` and
+    ``queued_at_ns`` metadata label the run span.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        otlp: bool = True,
+        pricing: Optional[Dict[str, Dict[str, float]]] = None,
+        max_summaries: Optional[int] = 1000,
+    ):
+        """Initialize the tracer.
+
+        Args:
+            directory: Where finished runs are written. If None, runs are
+                only kept in memory (see ``summaries``)
+            otlp: Also write OTLP/JSON spans
+            pricing: USD per million input/output tokens by model
+            max_summaries: Most recent run summaries kept in ``summaries``;
+                None keeps all of them
+        """
+        super().__init__()
+        self.directory = directory
+        self.otlp = otlp
+        self.pricing = pricing
+        self.summaries: "deque[Dict[str, Any]]" = deque(maxlen=max_summaries)
+        self._lock = threading.Lock()
+        # LangChain run id -> (trace id, id of the nearest recorded ancestor span)
+        self._context: Dict[UUID, tuple] = {}
+        self._open: Dict[UUID, Dict[str, Any]] = {}
+        self._traces: Dict[str, List[Dict[str, Any]]] = {}
+        # Trace id -> end time of the last finished node, for node queue time
+        self._last_node_end: Dict[str, int] = {}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def drain_summaries(self) -> List[Dict[str, Any]]:
+        """Return the kept run summaries, oldest first, and forget them."""
+        with self._lock:
+            summaries = list(self.summaries)
+            self.summaries.clear()
+        return summaries
+
+    # Span bookkeeping
+
+    def _start(self, run_id, parent_run_id, kind, name, attributes=None, queue_ns=None):
+        now = time.time_ns()
+        with self._lock:
+            if parent_run_id is None:
+                trace_id, parent_id = run_id.hex, None
+                self._traces[trace_id] = []
+                self._last_node_end[trace_id] = now
+            elif parent_run_id in self._context:
+                trace_id, parent_id = self._context[parent_run_id]
+            else:
+                return  # Not part of a traced graph run
+            if kind == "node":
+                queue_ns = now - self._last_node_end[trace_id]
+            span_id = run_id.hex[16:]
+            self._context[run_id] = (trace_id, span_id)
+            self._open[run_id] = {
+                "trace_id": trace_id,
+                "span_id": span_id,
+                "parent_id": parent_id,
+                "kind": kind,
+                "name": name,
+                "start_ns": now,
+                "queue_ns": queue_ns,
+                "attributes": attributes or {},
+            }
+
+    def _end(self, run_id, error=None, attributes=None):
+        now = time.time_ns()
+        finished = None
+        with self._lock:
+            self._context.pop(run_id, None)
+            span = self._open.pop(run_id, None)
+            if span is None:
+                return
+            span["attributes"].update(attributes or {})
+            self._record(span, now, error)
+            if span["kind"] == "node":
+                self._last_node_end[span["trace_id"]] = now
+            elif span["kind"] == "run":
+                finished = self._traces.pop(span["trace_id"])
+                self._last_node_end.pop(span["trace_id"], None)
+        if finished is not None:
+            self._export(finished)
+
+    def _record(self, span, end_ns, error=None, status=None):
+        """Finalize a span and add it to its trace (caller holds the lock)."""
+        queue_ns = span.pop("queue_ns")
+        span.update({
+            "end_ns": end_ns,
+            "wall_ms": (end_ns - span["start_ns"]) / 1e6,
+            "queue_ms": queue_ns / 1e6 if queue_ns is not None else None,
+            "status": status or ("error" if error else "ok"),
+            "error": error,
+        })
+        self._traces[span["trace_id"]].append(span)
+
+    def _export(self, spans):
+        summary = summarize_run(spans, self.pricing)
+        with self._lock:
+            self.summaries.append(summary)
+            if not self.directory:
+                return
+            with open(os.path.join(self.directory, "events.jsonl"), "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(span) + "\n" for span in spans)
+            if self.otlp:
+                with open(
+                    os.path.join(self.directory, "spans.otlp.jsonl"), "a", encoding="utf-8"
+                ) as f:
+                    f.write(json.dumps(to_otlp(spans)) + "\n")
+            with open(os.path.join(self.directory, "summaries.jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(summary) + "\n")
+
+    # Graph and node runs
+
+    def on_chain_start(
+        self,
+        serialized: Optional[Dict[str, Any]],
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        metadata = metadata or {}
+        name = kwargs.get("name") or (serialized or {}).get("name", "")
+        if parent_run_id is None:
+            queued_at = metadata.get("queued_at_ns")
+            self._start(
+                run_id,
+                None,
+                "run",
+                name or "graph",
+                {"ticker": metadata.get("ticker"), "trade_date": metadata.get("trade_date")},
+                queue_ns=time.time_ns() - queued_at if queued_at else None,
+            )
+        elif name and metadata.get("langgraph_node") == name:
+            self._start(run_id, parent_run_id, "node", name)
+        else:
+            # Branches, subgraph internals, prompt chains: only track ancestry
+            with self._lock:
+                if parent_run_id in self._context:
+                    self._context[run_id] = self._context[parent_run_id]
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error=repr(error))
+
+    # LLM calls
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[Any]],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        model = (metadata or {}).get("ls_model_name")
+        self._start(run_id, parent_run_id, "llm", model or "chat_model", {"model": model})
+
+    def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        model = (metadata or {}).get("ls_model_name")
+        self._start(run_id, parent_run_id, "llm", model or "llm", {"model": model})
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        attributes = {"tokens_in": 0, "tokens_out": 0, "cache_hit": False}
+        response_model = None
+        for generations in response.generations:
+            for generation in generations:
+                if (generation.generation_info or {}).get("cache_hit"):
+                    attributes["cache_hit"] = True
+                message = getattr(generation, "message", None)
+                usage = getattr(message, "usage_metadata", None)
+                if usage:
+                    attributes["tokens_in"] += usage.get("input_tokens", 0)
+                    attributes["tokens_out"] += usage.get("output_tokens", 0)
+                metadata = getattr(message, "response_metadata", None) or {}
+                response_model = (
+                    response_model or metadata.get("model_name") or metadata.get("model")
+                )
+        with self._lock:
+            span = self._open.get(run_id)
+            if span is not None and not span["attributes"].get("model"):
+                attributes["model"] = response_model
+        self._end(run_id, attributes=attributes)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error=repr(error))
+
+    # Tool and vendor calls
+
+    def on_tool_start(
+        self,
+        serialized: Dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: Optional[UUID] = None,
+        **kwargs: Any,
+    ) -> None:
+        name = kwargs.get("name") or (serialized or {}).get("name", "tool")
+        self._start(run_id, parent_run_id, "tool", name)
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end(run_id, error=repr(error))
+
+    def on_custom_event(
+        self, name: str, data: Any, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        if name != "vendor_call":
+            return
+        with self._lock:
+            if run_id not in self._context:
+                return
+            trace_id, parent_id = self._context[run_id]
+            call_ns = data["call_ns"] if data["call_ns"] is not None else data["end_ns"]
+            span = {
+                "trace_id": trace_id,
+                # Vendor calls have no run id of their own
+                "span_id": os.urandom(8).hex(),
+                "parent_id": parent_id,
+                "kind": "vendor",
+                "name": f"{data['method']} ({data['vendor']})",
+                "start_ns": data["start_ns"],
+                "queue_ns": call_ns - data["start_ns"],
+                "attributes": {
+                    "method": data["method"],
+                    "vendor": data["vendor"],
+                    "cache_hit": data["cache_hit"],
+                    "rate_limited_vendors": data["rate_limited_vendors"],
+                },
+            }
+            self._record(span, data["end_ns"], error=data["error"])
+
+
+def create_tracer(config: Dict[str, Any]) -> Optional[RunTracer]:
+    """Build a RunTracer from the ``tracing`` config, or None if disabled."""
+    settings = config.get("tracing") or {}
+    if not settings.get("enabled", False):
+        return None
+    return RunTracer(
+        directory=settings.get("dir") or os.path.join(config["results_dir"], "traces"),
+        otlp=settings.get("otlp", True),
+        pricing=config.get("llm_pricing") or None,
+        max_summaries=settings.get("max_summaries", 1000),
+    )
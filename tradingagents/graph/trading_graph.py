@@ -1,24 +1,33 @@
 # TradingAgents/graph/trading_graph.py
 
 import os
+import asyncio
+import logging
+import sqlite3
+import time
 from pathlib import Path
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Iterable, Iterator, Tuple, List, Optional
 
 from langgraph.prebuilt import ToolNode
 
-from tradingagents.llm_clients import create_llm_client
+from tradingagents.llm_clients import create_llm_cache, create_llm_client
 
 from tradingagents.agents import *
 from tradingagents.default_config import DEFAULT_CONFIG
 from tradingagents.agents.utils.memory import FinancialSituationMemory
+from tradingagents.agents.utils.context_budget import create_context_budget
 from tradingagents.agents.utils.agent_states import (
     AgentState,
     InvestDebateState,
     RiskDebateState,
 )
 from tradingagents.dataflows.config import set_config
+from tradingagents.dataflows.interface import prefetch_global_news, prefetch_ohlcv
+from tradingagents.dataflows.price_context import price_context
+from tradingagents.dataflows.ticker_registry import ticker_registry
 
 # Import the new abstract tool methods from agent_utils
 from tradingagents.agents.utils.agent_utils import (
@@ -38,6 +47,9 @@ from .setup import GraphSetup
 from .propagation import Propagator
 from .reflection import Reflector
 from .signal_processing import SignalProcessor
+from .tracing import create_tracer
+
+logger = logging.getLogger(__name__)
 
 
 class TradingAgentsGraph:
@@ -76,6 +88,11 @@ class TradingAgentsGraph:
         if self.callbacks:
             llm_kwargs["callbacks"] = self.callbacks
 
+        # Shared response cache for replaying identical LLM calls
+        self.llm_cache = create_llm_cache(self.config)
+        if self.llm_cache is not None:
+            llm_kwargs["cache"] = self.llm_cache
+
         deep_client = create_llm_client(
             provider=self.config["llm_provider"],
             model=self.config["deep_think_llm"],
@@ -117,19 +134,45 @@ class TradingAgentsGraph:
             self.invest_judge_memory,
             self.portfolio_manager_memory,
             self.conditional_logic,
+            context_budget=create_context_budget(self.quick_thinking_llm, self.config),
+            structured_output=self.config.get("structured_output", False),
         )
 
         self.propagator = Propagator()
+        self.tracer = create_tracer(self.config)
         self.reflector = Reflector(self.quick_thinking_llm)
         self.signal_processor = SignalProcessor(self.quick_thinking_llm)
 
         # State tracking
+        self.selected_analysts = list(selected_analysts)
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.checkpointer = self._create_checkpointer()
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            checkpointer=self.checkpointer,
+        )
+
+    def _create_checkpointer(self):
+        """Create the SQLite checkpointer if ``checkpoint_db`` is configured."""
+        db_path = self.config.get("checkpoint_db")
+        if not db_path:
+            return None
+        try:
+            from langgraph.checkpoint.sqlite import SqliteSaver
+        except ImportError as e:
+            raise ImportError(
+                "checkpoint_db requires the langgraph-checkpoint-sqlite package: "
+                "pip install langgraph-checkpoint-sqlite"
+            ) from e
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # One connection shared by all runs; SqliteSaver serializes access
+        conn = sqlite3.connect(db_path, check_same_thread=False)
+        return SqliteSaver(conn)
 
     def _get_provider_kwargs(self) -> Dict[str, Any]:
         """Get provider-specific kwargs for LLM client creation."""
@@ -189,31 +232,113 @@ class TradingAgentsGraph:
             ),
         }
 
-    def propagate(self, company_name, trade_date):
-        """Run the trading agents graph for a company on a specific date."""
+    def _run_graph(self, company_name, trade_date, queued_at=None):
+        """Run the graph once and return the final state.
 
-        self.ticker = company_name
+        Does not touch any per-instance run state, so it is safe to call from
+        several threads against the same compiled graph.
+        """
+        # Initialize state, or resume an interrupted checkpointed run
+        init_agent_state, args = self._prepare_run(company_name, trade_date)
+        self._attach_tracer(args, company_name, trade_date, queued_at)
+
+        # Tools of this run share one in-memory price history and one
+        # yfinance Ticker per symbol
+        with price_context(), ticker_registry():
+            if self.debug:
+                # Debug mode with tracing
+                trace = []
+                for chunk in self.graph.stream(init_agent_state, **args):
+                    if len(chunk["messages"]) == 0:
+                        pass
+                    else:
+                        chunk["messages"][-1].pretty_print()
+                        trace.append(chunk)
+
+                final_state = trace[-1]
+            else:
+                # Standard mode without tracing
+                final_state = self.graph.invoke(init_agent_state, **args)
+
+        self._finish_run(args)
+        return final_state
+
+    def _prepare_run(self, company_name, trade_date):
+        """Return (graph input, graph args) for a run.
+
+        With a checkpointer, each (ticker, date) run has its own thread. If
+        that thread stopped partway, the input is None so the graph resumes
+        after its last completed node instead of starting over.
+        """
+        if self.checkpointer is None:
+            return (
+                self.propagator.create_initial_state(company_name, trade_date),
+                self.propagator.get_graph_args(),
+            )
+
+        thread_id = self.propagator.get_thread_id(company_name, trade_date)
+        args = self.propagator.get_graph_args(thread_id=thread_id)
+        snapshot = self.graph.get_state(args["config"])
+        if snapshot.next:
+            return None, args
+        if snapshot.values:
+            # A finished run whose thread was not cleaned up; start fresh
+            self.checkpointer.delete_thread(thread_id)
+        return self.propagator.create_initial_state(company_name, trade_date), args
+
+    def _attach_tracer(self, args, company_name, trade_date, queued_at=None):
+        """Add the run tracer to the graph args, with the metadata that
+        labels the run's trace."""
+        if self.tracer is None:
+            return
+        config = args["config"]
+        config["callbacks"] = list(config.get("callbacks") or []) + [self.tracer]
+        config["metadata"] = {
+            "ticker": company_name,
+            "trade_date": str(trade_date),
+            "queued_at_ns": queued_at,
+        }
+
+    def _finish_run(self, args):
+        """Drop a successful run's checkpoints; only failed runs are kept."""
+        if self.checkpointer is not None:
+            self.checkpointer.delete_thread(args["config"]["configurable"]["thread_id"])
+
+    async def _arun_graph(self, company_name, trade_date):
+        """Async variant of _run_graph driven by ``astream``/``ainvoke``.
+
+        The SQLite checkpointer only has a sync API, so with ``checkpoint_db``
+        set the run goes through _run_graph on a worker thread instead.
+        """
+        if self.checkpointer is not None:
+            return await asyncio.to_thread(self._run_graph, company_name, trade_date)
 
-        # Initialize state
         init_agent_state = self.propagator.create_initial_state(
             company_name, trade_date
         )
         args = self.propagator.get_graph_args()
+        self._attach_tracer(args, company_name, trade_date)
+
+        with price_context(), ticker_registry():
+            if self.debug:
+                trace = []
+                async for chunk in self.graph.astream(init_agent_state, **args):
+                    if len(chunk["messages"]) == 0:
+                        pass
+                    else:
+                        chunk["messages"][-1].pretty_print()
+                        trace.append(chunk)
 
-        if self.debug:
-            # Debug mode with tracing
-            trace = []
-            for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
-
-            final_state = trace[-1]
-        else:
-            # Standard mode without tracing
-            final_state = self.graph.invoke(init_agent_state, **args)
+                return trace[-1]
+
+            return await self.graph.ainvoke(init_agent_state, **args)
+
+    def propagate(self, company_name, trade_date):
+        """Run the trading agents graph for a company on a specific date."""
+
+        self.ticker = company_name
+
+        final_state = self._run_graph(company_name, trade_date)
 
         # Store current state for reflection
         self.curr_state = final_state
@@ -222,11 +347,107 @@ class TradingAgentsGraph:
         self._log_state(trade_date, final_state)
 
         # Return decision and processed signal
-        return final_state, self.process_signal(final_state["final_trade_decision"])
+        return final_state, self.get_decision(final_state)
+
+    async def apropagate(self, company_name, trade_date):
+        """Async variant of propagate for use inside an event loop.
+
+        Agent nodes await ``ainvoke`` on the chat models and tool nodes run
+        their async path, so many tickers can be driven concurrently from one
+        loop (e.g. with ``asyncio.gather``). Like ``propagate_many``, this
+        does not touch ``ticker``, ``curr_state`` or ``log_states_dict``.
+        """
+        final_state = await self._arun_graph(company_name, trade_date)
+        self._write_state_log(trade_date, final_state)
+        return final_state, await self.aget_decision(final_state)
+
+    def _propagate_isolated(self, company_name, trade_date, queued_at=None):
+        """Run one batch job without mutating ticker/curr_state/log_states_dict."""
+        final_state = self._run_graph(company_name, trade_date, queued_at)
+        self._write_state_log(trade_date, final_state)
+        return final_state, self.get_decision(final_state)
+
+    def propagate_many(
+        self,
+        jobs: Iterable[Tuple[str, str]],
+        max_workers: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> Iterator[Tuple[str, str, Any, Optional[str]]]:
+        """Run the graph for many (ticker, trade_date) jobs concurrently.
+
+        All jobs share this instance's LLM clients, tool nodes and compiled
+        graph; each run keeps its own state and writes its own log file.
+        ``self.curr_state`` and ``self.log_states_dict`` are left untouched.
+        Global news is fetched once before the jobs start and shared by every
+        run's news analyst, and price history for all tickers is downloaded
+        in bulk so the market analysts' tools read it locally.
+
+        Args:
+            jobs: Iterable of (ticker, trade_date) pairs
+            max_workers: Maximum number of concurrent runs. Defaults to the
+                ``max_concurrent_runs`` config value.
+            return_exceptions: If True, a failed job yields its exception in
+                place of the final state instead of aborting the batch.
+
+        Yields:
+            (ticker, trade_date, final_state, decision) tuples in completion order
+        """
+        max_workers = max_workers or self.config.get("max_concurrent_runs", 4)
+        jobs = list(jobs)
+        if len(jobs) > 1:
+            self._prefetch_shared_data(jobs)
+
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="tradingagents-run"
+        )
+        try:
+            futures = {
+                executor.submit(
+                    self._propagate_isolated, ticker, trade_date, time.time_ns()
+                ): (
+                    ticker,
+                    trade_date,
+                )
+                for ticker, trade_date in jobs
+            }
+            for future in as_completed(futures):
+                ticker, trade_date = futures[future]
+                try:
+                    final_state, decision = future.result()
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    yield ticker, trade_date, e, None
+                    continue
+                yield ticker, trade_date, final_state, decision
+        finally:
+            # Drop queued jobs if the caller stops iterating early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _prefetch_shared_data(self, jobs):
+        """Fetch data that is identical for every run of a batch once, up front."""
+        if "news" in self.selected_analysts:
+            try:
+                prefetch_global_news()
+            except Exception as e:
+                # Each run's news tool retries and reports the error itself
+                logger.warning(f"Global news prefetch failed: {e!r}")
+        if "market" in self.selected_analysts:
+            try:
+                prefetch_ohlcv(ticker for ticker, _ in jobs)
+            except Exception as e:
+                # Symbols not prefetched are fetched individually on first use
+                logger.warning(f"OHLCV prefetch failed: {e!r}")
 
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
-        self.log_states_dict[str(trade_date)] = {
+        self.log_states_dict[str(trade_date)] = self._write_state_log(
+            trade_date, final_state
+        )
+
+    def _write_state_log(self, trade_date, final_state):
+        """Write the final state to its JSON log file and return the logged dict."""
+        state_log = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
             "market_report": final_state["market_report"],
@@ -257,31 +478,63 @@ class TradingAgentsGraph:
         }
 
         # Save to file
-        directory = Path(self.config["results_dir"]) / self.ticker / "TradingAgentsStrategy_logs"
+        directory = (
+            Path(self.config["results_dir"])
+            / final_state["company_of_interest"]
+            / "TradingAgentsStrategy_logs"
+        )
         directory.mkdir(parents=True, exist_ok=True)
 
         log_path = directory / f"full_states_log_{trade_date}.json"
         with open(log_path, "w", encoding="utf-8") as f:
-            json.dump(self.log_states_dict[str(trade_date)], f, indent=4)
+            json.dump(state_log, f, indent=4)
 
-    def reflect_and_remember(self, returns_losses):
-        """Reflect on decisions and update memory based on returns."""
-        self.reflector.reflect_bull_researcher(
-            self.curr_state, returns_losses, self.bull_memory
-        )
-        self.reflector.reflect_bear_researcher(
-            self.curr_state, returns_losses, self.bear_memory
-        )
-        self.reflector.reflect_trader(
-            self.curr_state, returns_losses, self.trader_memory
-        )
-        self.reflector.reflect_invest_judge(
-            self.curr_state, returns_losses, self.invest_judge_memory
-        )
-        self.reflector.reflect_portfolio_manager(
-            self.curr_state, returns_losses, self.portfolio_manager_memory
+        return state_log
+
+    def reflect_and_remember(self, returns_losses, final_state=None):
+        """Reflect on decisions and update memory based on returns.
+
+        Args:
+            returns_losses: Realized returns of the decision
+            final_state: State to reflect on. Defaults to the last state from
+                ``propagate``; pass it explicitly for ``propagate_many`` or
+                ``apropagate`` results.
+        """
+        self.reflector.reflect_all(
+            [(final_state or self.curr_state, returns_losses)], self.memories
         )
 
+    @property
+    def memories(self):
+        """Agent memories keyed by name, as used by Reflector.reflect_all."""
+        return {
+            "bull_memory": self.bull_memory,
+            "bear_memory": self.bear_memory,
+            "trader_memory": self.trader_memory,
+            "invest_judge_memory": self.invest_judge_memory,
+            "portfolio_manager_memory": self.portfolio_manager_memory,
+        }
+
     def process_signal(self, full_signal):
         """Process a signal to extract the core decision."""
         return self.signal_processor.process_signal(full_signal)
+
+    def get_decision(self, final_state):
+        """Return the rating of a finished run.
+
+        In structured-output mode the Portfolio Manager's rating is read
+        directly; otherwise the final text goes through the signal processor.
+        """
+        structured = final_state.get("structured_final_decision")
+        if structured:
+            return structured["rating"]
+        return self.process_signal(final_state["final_trade_decision"])
+
+    async def aget_decision(self, final_state):
+        """Async variant of get_decision."""
+        structured = final_state.get("structured_final_decision")
+        if structured:
+            return structured["rating"]
+        return await self.signal_processor.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
@@ -1,4 +1,11 @@
 from .base_client import BaseLLMClient
 from .factory import create_llm_client
+from .cache import LLMCacheMissError, LLMResponseCache, create_llm_cache
 
-__all__ = ["BaseLLMClient", "create_llm_client"]
+__all__ = [
+    "BaseLLMClient",
+    "create_llm_client",
+    "LLMCacheMissError",
+    "LLMResponseCache",
+    "create_llm_cache",
+]
@@ -7,7 +7,7 @@ from .validators import validate_model
 
 _PASSTHROUGH_KWARGS = (
     "timeout", "max_retries", "api_key", "max_tokens",
-    "callbacks", "http_client", "http_async_client", "effort",
+    "callbacks", "cache", "http_client", "http_async_client", "effort",
 )
 
 
@@ -22,6 +22,9 @@ class NormalizedChatAnthropic(ChatAnthropic):
     def invoke(self, input, config=None, **kwargs):
         return normalize_content(super().invoke(input, config, **kwargs))
 
+    async def ainvoke(self, input, config=None, **kwargs):
+        return normalize_content(await super().ainvoke(input, config, **kwargs))
+
 
 class AnthropicClient(BaseLLMClient):
     """Client for Anthropic Claude models."""
@@ -8,7 +8,7 @@ from .validators import validate_model
 
 _PASSTHROUGH_KWARGS = (
     "timeout", "max_retries", "api_key", "reasoning_effort",
-    "callbacks", "http_client", "http_async_client",
+    "callbacks", "cache", "http_client", "http_async_client",
 )
 
 
@@ -18,6 +18,9 @@ class NormalizedAzureChatOpenAI(AzureChatOpenAI):
     def invoke(self, input, config=None, **kwargs):
         return normalize_content(super().invoke(input, config, **kwargs))
 
+    async def ainvoke(self, input, config=None, **kwargs):
+        return normalize_content(await super().ainvoke(input, config, **kwargs))
+
 
 class AzureOpenAIClient(BaseLLMClient):
     """Client for Azure OpenAI deployments.
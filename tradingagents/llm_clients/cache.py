@@ -0,0 +1,189 @@
+"""Disk-backed LLM response cache for replaying runs.
+
+LangChain chat models consult ``cache.lookup(prompt, llm_string)`` before
+calling the provider. ``llm_string`` already identifies the model, its
+parameters and any bound tools. The prompt is the serialized message list,
+which also carries per-run message ids and provider metadata, so it is
+normalized to roles, content and tool calls before hashing. That way a
+re-run of the same date hits the cache even though the graph assigned new
+message ids.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+# Message fields that identify a call; ids and provider metadata are dropped
+_MESSAGE_FIELDS = ("content", "tool_calls", "tool_call_id", "name")
+
+
+class LLMCacheMissError(RuntimeError):
+    """Raised in replay mode when a call has no cached response."""
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Reduce a serialized message list to the fields that define the call."""
+    try:
+        messages = json.loads(prompt)
+    except ValueError:
+        return prompt
+    if not isinstance(messages, list):
+        return prompt
+
+    normalized = []
+    for message in messages:
+        if isinstance(message, dict) and message.get("type") == "constructor":
+            kwargs = message.get("kwargs", {})
+            normalized.append({
+                "type": message.get("id", [""])[-1],
+                **{k: kwargs[k] for k in _MESSAGE_FIELDS if kwargs.get(k)},
+            })
+        else:
+            normalized.append(message)
+    return json.dumps(normalized, sort_keys=True)
+
+
+class LLMResponseCache(BaseCache):
+    """SQLite-backed LangChain cache with LRU size eviction and replay mode."""
+
+    def __init__(
+        self,
+        path: str,
+        max_size_mb: float = 512,
+        replay_only: bool = False,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file
+            max_size_mb: Total size of stored responses before the least
+                recently used are evicted
+            replay_only: Raise LLMCacheMissError instead of calling the model
+                when a response is not cached
+        """
+        self.path = path
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.replay_only = replay_only
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)"
+        )
+        self._conn.commit()
+        self._total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        raw = f"{llm_string}\x00{_normalize_prompt(prompt)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return cached generations, or None (LangChain then calls the model)."""
+        key = self._key(prompt, llm_string)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._conn.execute(
+                    "UPDATE responses SET accessed = ? WHERE key = ?", (time.time(), key)
+                )
+                self._conn.commit()
+
+        if row is None:
+            if self.replay_only:
+                raise LLMCacheMissError(
+                    "No cached LLM response for this call and the LLM cache is in "
+                    "replay mode"
+                )
+            return None
+        generations = loads(row[0])
+        for generation in generations:
+            # Lets callback handlers (e.g. RunTracer) count cache hits
+            generation.generation_info = {**(generation.generation_info or {}), "cache_hit": True}
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations and evict the least recently used over budget."""
+        key = self._key(prompt, llm_string)
+        value = dumps(list(return_val))
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, size, time.time()),
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Delete least recently used rows until under the size budget."""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                return
+            for key, size in rows:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._total_bytes -= size
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def clear(self, **kwargs: Any) -> None:
+        """Delete all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counts and stored size."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+                "size_bytes": self._total_bytes,
+            }
+
+
+def create_llm_cache(config: Dict[str, Any]) -> Optional[LLMResponseCache]:
+    """Build the cache from the ``llm_cache`` config, or None if disabled."""
+    settings = config.get("llm_cache") or {}
+    if not settings.get("enabled", False):
+        return None
+    path = settings.get("path") or os.path.join(config["data_cache_dir"], "llm_cache.sqlite")
+    return LLMResponseCache(
+        path,
+        max_size_mb=settings.get("max_size_mb", 512),
+        replay_only=settings.get("mode", "read_write") == "replay",
+    )